@@ -0,0 +1,312 @@
+# expression_compiler.py
+"""
+Expression Compiler
+
+Compiles arithmetic expressions such as "(a + b) * c / d" once into nested
+closures, so they can be evaluated many times without parsing them again.
+Compiled expressions are cached by their text.
+
+A compiled expression can be evaluated for one set of bindings, or for
+whole columns of bindings in a single pass. Division by zero raises
+ZeroDivisionError("Cannot divide by zero.") for one set of bindings and
+is reported as an error code per row for columns.
+"""
+
+import functools
+import itertools
+import operator
+import re
+from array import array
+
+# Error codes reported by CompiledExpression.evaluate_columns
+OK = 0
+DIVIDE_BY_ZERO = 1
+
+DIVIDE_BY_ZERO_MESSAGE = "Cannot divide by zero."
+
+_TOKEN = re.compile(r"\s*(?:(\d+\.?\d*(?:[eE][+-]?\d+)?|\.\d+(?:[eE][+-]?\d+)?)|([A-Za-z_]\w*)|(\S))")
+
+_OPERATORS = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.truediv,
+}
+
+_NAN = float("nan")
+
+
+class ExpressionError(ValueError):
+    """Raised when an expression cannot be parsed."""
+
+
+class _Undefined:
+    """Result of a division by zero within a column; absorbs any further arithmetic."""
+
+    __slots__ = ()
+
+    def _absorb(self, *args):
+        return self
+
+    __add__ = __radd__ = __sub__ = __rsub__ = _absorb
+    __mul__ = __rmul__ = __truediv__ = __rtruediv__ = __neg__ = _absorb
+
+
+_UNDEFINED = _Undefined()
+
+
+def _column_divide(numerator, denominator):
+    if denominator == 0:
+        return _UNDEFINED
+    return numerator / denominator
+
+
+class CompiledExpression:
+    """
+    An arithmetic expression compiled for repeated evaluation.
+
+    Attributes:
+        text (str): The source of the expression
+        variables (tuple): Names of the variables the expression uses, sorted
+    """
+
+    __slots__ = ("text", "variables", "_scalar", "_column")
+
+    def __init__(self, text, tree):
+        self.text = text
+        self.variables = tuple(sorted(_variables(tree)))
+        self._scalar = _compile_scalar(tree)
+        self._column = _compile_column(tree)
+
+    def __repr__(self):
+        return f"CompiledExpression({self.text!r})"
+
+    def evaluate(self, bindings=None, **values):
+        """
+        Evaluate the expression for one set of variable bindings.
+
+        Args:
+            bindings (dict): Variable name -> number
+            **values: Further bindings given as keyword arguments
+
+        Returns:
+            float: The value of the expression
+
+        Raises:
+            KeyError: If a variable has no binding
+            ZeroDivisionError: If the expression divides by zero
+        """
+        if bindings:
+            values = {**bindings, **values}
+        return self._scalar(values)
+
+    def evaluate_columns(self, columns):
+        """
+        Evaluate the expression for every row of a set of columns.
+
+        Args:
+            columns (dict): Variable name -> sequence of numbers, all the
+                same length
+
+        Returns:
+            tuple: (array of float results, bytearray of error codes), where
+            each code is OK or DIVIDE_BY_ZERO and failing rows hold NaN
+        """
+        missing = [name for name in self.variables if name not in columns]
+        if missing:
+            raise KeyError(f"No column for variable(s): {', '.join(missing)}")
+        converted = {name: array("d", columns[name]) for name in self.variables}
+        lengths = {len(column) for column in converted.values()}
+        if len(lengths) > 1:
+            raise ValueError("All columns must have the same length")
+        rows = lengths.pop() if lengths else len(next(iter(columns.values()), ()))
+
+        values = list(self._column(converted, rows))
+        errors = bytearray(rows)
+        if _UNDEFINED not in values:
+            return array("d", values), errors
+
+        for row, value in enumerate(values):
+            if value is _UNDEFINED:
+                values[row] = _NAN
+                errors[row] = DIVIDE_BY_ZERO
+        return array("d", values), errors
+
+
+@functools.lru_cache(maxsize=256)
+def compile_expression(text):
+    """
+    Compile an arithmetic expression, reusing the result for the same text.
+
+    Expressions use numbers, variable names, parentheses, unary +/- and the
+    binary operators +, -, * and /.
+
+    Args:
+        text (str): The expression to compile
+
+    Returns:
+        CompiledExpression: The compiled expression
+
+    Raises:
+        ExpressionError: If the text is not a valid expression
+    """
+    return CompiledExpression(text, _Parser(text).parse())
+
+
+def evaluate(text, bindings=None, **values):
+    """
+    Compile (or fetch from the cache) an expression and evaluate it once.
+
+    Args:
+        text (str): The expression to evaluate
+        bindings (dict): Variable name -> number
+        **values: Further bindings given as keyword arguments
+
+    Returns:
+        float: The value of the expression
+    """
+    return compile_expression(text).evaluate(bindings, **values)
+
+
+class _Parser:
+    """
+    Recursive descent parser producing a tree of tuples:
+    ("num", value), ("var", name), ("neg", operand) or (operator, left, right).
+    """
+
+    def __init__(self, text):
+        self.tokens = self._tokenize(text)
+        self.position = 0
+
+    @staticmethod
+    def _tokenize(text):
+        tokens = []
+        for number, name, symbol in _TOKEN.findall(text):
+            if number:
+                tokens.append(("num", float(number)))
+            elif name:
+                tokens.append(("var", name))
+            elif symbol in _OPERATORS or symbol in "()":
+                tokens.append((symbol, None))
+            else:
+                raise ExpressionError(f"Unexpected character {symbol!r}")
+        return tokens
+
+    def _peek(self):
+        if self.position < len(self.tokens):
+            return self.tokens[self.position][0]
+        return None
+
+    def _take(self):
+        token = self.tokens[self.position]
+        self.position += 1
+        return token
+
+    def parse(self):
+        if not self.tokens:
+            raise ExpressionError("Empty expression")
+        tree = self._sum()
+        if self._peek() is not None:
+            raise ExpressionError(f"Unexpected {self._peek()!r}")
+        return tree
+
+    def _sum(self):
+        tree = self._product()
+        while self._peek() in ("+", "-"):
+            symbol = self._take()[0]
+            tree = _fold((symbol, tree, self._product()))
+        return tree
+
+    def _product(self):
+        tree = self._unary()
+        while self._peek() in ("*", "/"):
+            symbol = self._take()[0]
+            tree = _fold((symbol, tree, self._unary()))
+        return tree
+
+    def _unary(self):
+        if self._peek() == "+":
+            self._take()
+            return self._unary()
+        if self._peek() == "-":
+            self._take()
+            operand = self._unary()
+            if operand[0] == "num":
+                return ("num", -operand[1])
+            return ("neg", operand)
+        return self._atom()
+
+    def _atom(self):
+        kind = self._peek()
+        if kind in ("num", "var"):
+            return self._take()
+        if kind == "(":
+            self._take()
+            tree = self._sum()
+            if self._peek() != ")":
+                raise ExpressionError("Missing ')'")
+            self._take()
+            return tree
+        raise ExpressionError("Unexpected end of expression" if kind is None else f"Unexpected {kind!r}")
+
+
+def _fold(tree):
+    """Evaluate an operation on two constants at compile time."""
+    symbol, left, right = tree
+    if left[0] == "num" and right[0] == "num" and not (symbol == "/" and right[1] == 0):
+        return ("num", _OPERATORS[symbol](left[1], right[1]))
+    return tree
+
+
+def _variables(tree):
+    kind = tree[0]
+    if kind == "var":
+        return {tree[1]}
+    if kind == "num":
+        return set()
+    return set().union(*(_variables(child) for child in tree[1:]))
+
+
+def _compile_scalar(tree):
+    """Compile a tree into a function of a bindings dict."""
+    kind = tree[0]
+    if kind == "num":
+        value = tree[1]
+        return lambda bindings: value
+    if kind == "var":
+        name = tree[1]
+        return lambda bindings: bindings[name]
+    if kind == "neg":
+        operand = _compile_scalar(tree[1])
+        return lambda bindings: -operand(bindings)
+
+    left = _compile_scalar(tree[1])
+    right = _compile_scalar(tree[2])
+    if kind == "/":
+        def divide(bindings):
+            denominator = right(bindings)
+            if denominator == 0:
+                raise ZeroDivisionError(DIVIDE_BY_ZERO_MESSAGE)
+            return left(bindings) / denominator
+        return divide
+    function = _OPERATORS[kind]
+    return lambda bindings: function(left(bindings), right(bindings))
+
+
+def _compile_column(tree):
+    """Compile a tree into a function of (columns, rows) returning an iterator of values."""
+    kind = tree[0]
+    if kind == "num":
+        value = tree[1]
+        return lambda columns, rows: itertools.repeat(value, rows)
+    if kind == "var":
+        name = tree[1]
+        return lambda columns, rows: iter(columns[name])
+    if kind == "neg":
+        operand = _compile_column(tree[1])
+        return lambda columns, rows: map(operator.neg, operand(columns, rows))
+
+    left = _compile_column(tree[1])
+    right = _compile_column(tree[2])
+    function = _column_divide if kind == "/" else _OPERATORS[kind]
+    return lambda columns, rows: map(function, left(columns, rows), right(columns, rows))
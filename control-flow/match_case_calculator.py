@@ -1,5 +1,7 @@
 # match_case_calculator.py
 
+from expression_compiler import evaluate
+
 # Prompt for user input
 num1 = float(input("Enter the first number: "))
 num2 = float(input("Enter the second number: "))
@@ -7,20 +9,11 @@ operation = input("Choose the operation (+, -, *, /): ")
 
 # Perform calculation using match case
 match operation:
-    case '+':
-        result = num1 + num2
-        print(f"The result is {result}.")
-    case '-':
-        result = num1 - num2
-        print(f"The result is {result}.")
-    case '*':
-        result = num1 * num2
-        print(f"The result is {result}.")
-    case '/':
-        if num2 != 0:
-            result = num1 / num2
+    case '+' | '-' | '*' | '/':
+        try:
+            result = evaluate(f"a {operation} b", a=num1, b=num2)
             print(f"The result is {result}.")
-        else:
+        except ZeroDivisionError:
             print("Cannot divide by zero.")
     case _:
         print("Invalid operation selected.")
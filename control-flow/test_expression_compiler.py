@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the Expression Compiler
+
+This module contains unit tests for compile_expression, covering parsing,
+caching, division by zero and evaluation over columns.
+"""
+
+import math
+import unittest
+from expression_compiler import (
+    DIVIDE_BY_ZERO, OK, ExpressionError, compile_expression, evaluate,
+)
+
+
+class TestCompileExpression(unittest.TestCase):
+    """Test cases for compiling and evaluating single expressions."""
+
+    def test_precedence(self):
+        """Test operator precedence, parentheses and unary minus."""
+        self.assertEqual(evaluate("1 + 2 * 3"), 7.0)
+        self.assertEqual(evaluate("(a + b) * c / d", a=1, b=3, c=5, d=2), 10.0)
+        self.assertEqual(evaluate("-a - -2", {"a": 5}), -3.0)
+        self.assertEqual(evaluate("8 / 4 / 2"), 1.0)
+
+    def test_divide_by_zero(self):
+        """Test that division by zero keeps the calculator's message."""
+        with self.assertRaisesRegex(ZeroDivisionError, "Cannot divide by zero."):
+            evaluate("a / (b - 2)", a=1, b=2)
+        with self.assertRaisesRegex(ZeroDivisionError, "Cannot divide by zero."):
+            evaluate("1 / 0")
+
+    def test_cache(self):
+        """Test that the same text compiles to the same object."""
+        compiled = compile_expression("x * y")
+        self.assertIs(compile_expression("x * y"), compiled)
+        self.assertEqual(compiled.variables, ("x", "y"))
+
+    def test_invalid_expressions(self):
+        """Test that malformed expressions raise ExpressionError."""
+        for text in ("", "1 +", "(a", "a b", "2 ^ 3", ")"):
+            with self.subTest(text=text), self.assertRaises(ExpressionError):
+                compile_expression(text)
+
+
+class TestEvaluateColumns(unittest.TestCase):
+    """Test cases for evaluating an expression over columns."""
+
+    def test_columns(self):
+        """Test row-wise results and the error mask."""
+        compiled = compile_expression("(a + b) * 2 / c")
+        results, errors = compiled.evaluate_columns({"a": [1, 2, 3], "b": [1, 2, 3], "c": [4, 0, 2]})
+        self.assertEqual(list(errors), [OK, DIVIDE_BY_ZERO, OK])
+        self.assertEqual((results[0], results[2]), (1.0, 6.0))
+        self.assertTrue(math.isnan(results[1]))
+
+    def test_error_propagates(self):
+        """Test that a zero division inside a larger expression fails the row."""
+        compiled = compile_expression("-(1 / a) + 1")
+        results, errors = compiled.evaluate_columns({"a": [0, 2]})
+        self.assertEqual(list(errors), [DIVIDE_BY_ZERO, OK])
+        self.assertEqual(results[1], 0.5)
+
+    def test_bad_columns(self):
+        """Test missing and mismatched columns."""
+        compiled = compile_expression("a + b")
+        with self.assertRaises(KeyError):
+            compiled.evaluate_columns({"a": [1]})
+        with self.assertRaises(ValueError):
+            compiled.evaluate_columns({"a": [1], "b": [1, 2]})
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
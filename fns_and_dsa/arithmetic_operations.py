@@ -1,15 +1,43 @@
+"""
+Arithmetic Operations
+
+perform_operation applies one operation to two numbers. perform_operations
+applies a column of operations to two columns of numbers at once, grouping
+rows by operation and reporting errors in a separate mask.
+"""
+
+import operator
+from array import array
+
+# Error codes reported by perform_operations
+OK = 0
+DIVIDE_BY_ZERO = 1
+INVALID_OPERATION = 2
+
+_OPERATIONS = {
+    'add': operator.add,
+    'subtract': operator.sub,
+    'multiply': operator.mul,
+    'divide': operator.truediv,
+}
+
+_NAN = float("nan")
+
+
 def perform_operation(num1, num2, operation):
     """
     Performs basic arithmetic operations on two numbers.
-    
+
     Args:
         num1 (float): First number
         num2 (float): Second number
         operation (string): Operation to perform ('add', 'subtract', 'multiply', 'divide')
-    
+
     Returns:
         float or string: Result of the operation or error message for division by zero
     """
+    # For a single row, comparing the name directly is faster than looking
+    # the operation up in _OPERATIONS and calling it
     if operation == 'add':
         return num1 + num2
     elif operation == 'subtract':
@@ -21,4 +49,62 @@ def perform_operation(num1, num2, operation):
             return "Error: Cannot divide by zero."
         return num1 / num2
     else:
-        return "Error: Invalid operation."
\ No newline at end of file
+        return "Error: Invalid operation."
+
+
+def perform_operations(num1, num2, operations):
+    """
+    Performs arithmetic operations row by row over two columns of numbers.
+
+    Rows are grouped by operation and each group is computed in one pass, so
+    the cost of choosing an operation is paid once per group, not per row.
+
+    Args:
+        num1 (sequence): First numbers
+        num2 (sequence): Second numbers, one per first number
+        operations (sequence or string): Operation for each row, or one
+            operation for every row
+
+    Returns:
+        tuple: (array of float results, bytearray of error codes), where each
+        code is OK, DIVIDE_BY_ZERO or INVALID_OPERATION and failing rows hold NaN
+    """
+    if len(num1) != len(num2):
+        raise ValueError("num1 and num2 must have the same length")
+    if isinstance(operations, str):
+        groups = {operations: range(len(num1))}
+    else:
+        if len(operations) != len(num1):
+            raise ValueError("operations must have one entry per row")
+        groups = {}
+        for row, operation in enumerate(operations):
+            groups.setdefault(operation, []).append(row)
+
+    results = array("d", bytes(8 * len(num1)))
+    errors = bytearray(len(num1))
+    for operation, rows in groups.items():
+        function = _OPERATIONS.get(operation)
+        if function is None:
+            for row in rows:
+                results[row] = _NAN
+                errors[row] = INVALID_OPERATION
+            continue
+        if function is operator.truediv:
+            rows = _drop_zero_divisors(num2, rows, results, errors)
+        left = [num1[row] for row in rows]
+        right = [num2[row] for row in rows]
+        for row, value in zip(rows, map(function, left, right)):
+            results[row] = value
+    return results, errors
+
+
+def _drop_zero_divisors(num2, rows, results, errors):
+    """Mark rows with a zero divisor as errors and return the remaining rows."""
+    valid = []
+    for row in rows:
+        if num2[row] == 0:
+            results[row] = _NAN
+            errors[row] = DIVIDE_BY_ZERO
+        else:
+            valid.append(row)
+    return valid
\ No newline at end of file
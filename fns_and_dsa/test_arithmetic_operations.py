@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Arithmetic Operations
+
+This module contains unit tests for perform_operation and the batch
+perform_operations function.
+"""
+
+import math
+import unittest
+from arithmetic_operations import (
+    DIVIDE_BY_ZERO, INVALID_OPERATION, OK, perform_operation, perform_operations,
+)
+
+
+class TestPerformOperation(unittest.TestCase):
+    """Test cases for the single-row perform_operation function."""
+
+    def test_operations(self):
+        """Test every operation and both error messages."""
+        self.assertEqual(perform_operation(6, 3, 'add'), 9)
+        self.assertEqual(perform_operation(6, 3, 'subtract'), 3)
+        self.assertEqual(perform_operation(6, 3, 'multiply'), 18)
+        self.assertEqual(perform_operation(6, 3, 'divide'), 2.0)
+        self.assertEqual(perform_operation(6, 0, 'divide'), "Error: Cannot divide by zero.")
+        self.assertEqual(perform_operation(6, 3, 'power'), "Error: Invalid operation.")
+
+
+class TestPerformOperations(unittest.TestCase):
+    """Test cases for the batch perform_operations function."""
+
+    def test_mixed_operations(self):
+        """Test that rows keep their order and errors go to the mask."""
+        results, errors = perform_operations(
+            [1, 6, 6, 6, 5, 8],
+            [2, 3, 0, 3, 5, 2],
+            ['add', 'divide', 'divide', 'power', 'multiply', 'subtract'],
+        )
+        self.assertEqual(list(errors), [OK, OK, DIVIDE_BY_ZERO, INVALID_OPERATION, OK, OK])
+        self.assertEqual([results[row] for row in (0, 1, 4, 5)], [3.0, 2.0, 25.0, 6.0])
+        self.assertTrue(math.isnan(results[2]) and math.isnan(results[3]))
+
+    def test_single_operation(self):
+        """Test one operation applied to every row."""
+        results, errors = perform_operations([1, 2, 3], [4, 5, 6], 'multiply')
+        self.assertEqual(list(results), [4.0, 10.0, 18.0])
+        self.assertEqual(list(errors), [OK, OK, OK])
+
+    def test_length_mismatch(self):
+        """Test that columns of different lengths are rejected."""
+        with self.assertRaises(ValueError):
+            perform_operations([1, 2], [1], 'add')
+        with self.assertRaises(ValueError):
+            perform_operations([1, 2], [1, 2], ['add'])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
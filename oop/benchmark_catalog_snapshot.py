@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Catalog Snapshot Benchmark
+
+Compares pickle with the binary catalog snapshot for saving a catalog,
+opening it, reading a few random books and reading every book.
+
+Usage:
+    python benchmark_catalog_snapshot.py [catalog sizes...]
+"""
+
+import os
+import pickle
+import random
+import sys
+import tempfile
+import time
+from catalog_snapshot import CatalogSnapshot, write_snapshot
+from library_system import Book, EBook, PrintBook
+
+DEFAULT_SIZES = (100_000, 1_000_000)
+SAMPLES = 1000
+
+
+def build_books(size):
+    books = []
+    for i in range(size):
+        if i % 3 == 0:
+            books.append(Book(f"Title {i}", f"Author {i % 1000}"))
+        elif i % 3 == 1:
+            books.append(EBook(f"Title {i}", f"Author {i % 1000}", i % 5000))
+        else:
+            books.append(PrintBook(f"Title {i}", f"Author {i % 1000}", i % 900))
+    return books
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+
+def pickle_times(books, path, positions):
+    def save():
+        with open(path, "wb") as output:
+            pickle.dump(books, output, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def load():
+        with open(path, "rb") as source:
+            return pickle.load(source)
+
+    save_seconds, _ = timed(save)
+    open_seconds, loaded = timed(load)
+    sample_seconds, _ = timed(lambda: [loaded[position] for position in positions])
+    # pickle has already decoded every book when it opens
+    return save_seconds, open_seconds, open_seconds + sample_seconds, open_seconds, os.path.getsize(path)
+
+
+def snapshot_times(books, path, positions):
+    save_seconds, _ = timed(lambda: write_snapshot(path, books))
+    open_seconds, snapshot = timed(lambda: CatalogSnapshot(path))
+    sample_seconds, _ = timed(lambda: [snapshot[position] for position in positions])
+    all_seconds, _ = timed(lambda: list(snapshot))
+    snapshot.close()
+    return (save_seconds, open_seconds, open_seconds + sample_seconds,
+            open_seconds + all_seconds, os.path.getsize(path))
+
+
+def main(sizes):
+    print(f"{'books':>9}  {'format':<8}  {'save s':>7}  {'open s':>9}  "
+          f"{'open+{} s'.format(SAMPLES):>11}  {'open+all s':>10}  {'MB':>7}")
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            books = build_books(size)
+            positions = [random.randrange(size) for _ in range(SAMPLES)]
+            for name, measure in (("pickle", pickle_times), ("snapshot", snapshot_times)):
+                path = os.path.join(directory, name)
+                save, opened, sampled, everything, file_size = measure(books, path, positions)
+                print(f"{size:>9}  {name:<8}  {save:>7.3f}  {opened:>9.6f}  {sampled:>11.4f}  "
+                      f"{everything:>10.3f}  {file_size / 1e6:>7.1f}")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES)
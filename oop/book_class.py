@@ -1,11 +1,31 @@
+import sys
+import weakref
+from shared_modules import sink
+
+_deletion_notices = False
+
+def set_deletion_notices(enabled):
+    """
+    Switch "Deleting <title>" notices on or off for books created afterwards.
+
+    Notices are off by default. When on, each book gets a weakref.finalize
+    hook that emits its notice to the shared event sink, which writes
+    notices in batches from a background thread.
+    """
+    global _deletion_notices
+    _deletion_notices = enabled
+
 class Book:
+    __slots__ = ("title", "author", "year", "__weakref__")
+
     def __init__(self, title, author, year):
         self.title = title
-        self.author = author
+        # Interned, so the many books by one author share a single string.
+        # Titles are mostly unique, so interning them would cost more than it saves.
+        self.author = sys.intern(author) if type(author) is str else author
         self.year = year
-
-    def __del__(self):
-        print(f"Deleting {self.title}")
+        if _deletion_notices:
+            weakref.finalize(self, sink.emit, f"Deleting {title}")
 
     def __str__(self):
         return f"{self.title} by {self.author}, published in {self.year}"
@@ -1,3 +1,5 @@
+from shared_modules import sink
+
 
 class Calculator:
     calculation_type = "Arithmetic Operations"
@@ -8,5 +10,5 @@ class Calculator:
 
     @classmethod
     def multiply(cls, a, b):
-        print(f"Calculation type: {cls.calculation_type}")
+        sink.emit(f"Calculation type: {cls.calculation_type}")
         return a * b
@@ -1,4 +1,10 @@
+from array import array
+from collections import namedtuple
+from shared_modules import decode_cursor, encode_cursor, write_lines
+
 class Book:
+    __slots__ = ("title", "author")
+
     def __init__(self, title, author):
         self.title = title
         self.author = author
@@ -7,6 +13,8 @@ class Book:
         return f"Book: {self.title} by {self.author}"
 
 class EBook(Book):
+    __slots__ = ("file_size",)
+
     def __init__(self, title, author, file_size):
         super().__init__(title, author)
         self.file_size = file_size
@@ -15,6 +23,8 @@ class EBook(Book):
         return f"EBook: {self.title} by {self.author}, File Size: {self.file_size}KB"
 
 class PrintBook(Book):
+    __slots__ = ("page_count",)
+
     def __init__(self, title, author, page_count):
         super().__init__(title, author)
         self.page_count = page_count
@@ -22,16 +32,132 @@ class PrintBook(Book):
     def __str__(self):
         return f"PrintBook: {self.title} by {self.author}, Page Count: {self.page_count}"
 
+# Numeric fields whose running aggregates the library keeps
+AGGREGATED_FIELDS = ("file_size", "page_count")
+
+class FieldStats(namedtuple("FieldStats", "count total minimum maximum")):
+    """Count, sum, minimum and maximum of one numeric field."""
+    __slots__ = ()
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else None
+
+_EMPTY_STATS = FieldStats(0, 0, None, None)
+
+def _aggregated_fields(book_type):
+    """Return the aggregated fields declared in the __slots__ of a book type."""
+    declared = set()
+    for cls in book_type.__mro__:
+        declared.update(getattr(cls, "__slots__", ()))
+    return tuple(field for field in AGGREGATED_FIELDS if field in declared)
+
+class _TypeStore:
+    """Positions and field aggregates of the books of one exact type."""
+    __slots__ = ("positions", "fields", "stats")
+
+    def __init__(self, fields):
+        self.positions = array("Q")  # Index of each book in Library.books
+        self.fields = fields
+        self.stats = dict.fromkeys(fields, _EMPTY_STATS)
+
+def _updated(stats, value):
+    if not stats.count:
+        return FieldStats(1, value, value, value)
+    return FieldStats(stats.count + 1, stats.total + value,
+                      min(stats.minimum, value), max(stats.maximum, value))
+
 class Library:
+    """
+    A collection of books of any type, kept in insertion order.
+
+    Books are also partitioned by exact type, and the count, sum, minimum
+    and maximum of file_size and page_count are kept per type and overall.
+    They are updated as books are added, so count() and field_stats() take
+    constant time. Field values that are not numbers are left out of the
+    aggregates, and changing a field of a book after adding it is not
+    reflected in them.
+    """
+
     def __init__(self):
         self.books = []
+        self._stores = {}  # Book type -> _TypeStore
+        self._stats = dict.fromkeys(AGGREGATED_FIELDS, _EMPTY_STATS)
+
+    def __len__(self):
+        return len(self.books)
+
+    def __iter__(self):
+        return iter(self.books)
 
     def add_book(self, book):
+        store = self._stores.get(type(book))
+        if store is None:
+            store = self._stores[type(book)] = _TypeStore(_aggregated_fields(type(book)))
+        # Work out every update before changing anything, so a book whose
+        # fields cannot be aggregated leaves the library consistent
+        updates = []
+        for field in store.fields:
+            value = getattr(book, field, None)
+            if isinstance(value, (int, float)):
+                updates.append((field, _updated(store.stats[field], value),
+                                _updated(self._stats[field], value)))
+        store.positions.append(len(self.books))
         self.books.append(book)
+        for field, type_stats, stats in updates:
+            store.stats[field] = type_stats
+            self._stats[field] = stats
+
+    def books_of_type(self, book_type):
+        """Return the books of exactly book_type, in insertion order."""
+        store = self._stores.get(book_type)
+        if store is None:
+            return []
+        books = self.books
+        return [books[position] for position in store.positions]
+
+    def count(self, book_type=None):
+        """Return the number of books, or of books of exactly book_type."""
+        if book_type is None:
+            return len(self.books)
+        store = self._stores.get(book_type)
+        return len(store.positions) if store is not None else 0
+
+    def field_stats(self, field, book_type=None):
+        """
+        Return FieldStats for file_size or page_count over all books that
+        have the field, or over the books of exactly book_type.
+        """
+        if field not in AGGREGATED_FIELDS:
+            raise ValueError(f"No aggregates are kept for {field!r}")
+        if book_type is None:
+            return self._stats[field]
+        store = self._stores.get(book_type)
+        if store is None:
+            return _EMPTY_STATS
+        return store.stats.get(field, _EMPTY_STATS)
+
+    def list_books(self, file=None):
+        """Write every book to file (default sys.stdout) through a large buffer."""
+        write_lines(self.book_lines(), file)
+
+    def book_lines(self, start=0, stop=None):
+        """Generate str(book) for the books from position start up to stop."""
+        books = self.books
+        stop = len(books) if stop is None else min(stop, len(books))
+        for position in range(start, stop):
+            yield str(books[position])
+
+    def book_page(self, cursor=None, limit=100):
+        """
+        Return (lines, next cursor) for one page of the listing.
 
-    def list_books(self):
-        for book in self.books:
-            print(book)
+        cursor is None for the first page, then the token returned with the
+        previous page; the next cursor is None after the last page.
+        """
+        start = decode_cursor(cursor)
+        stop = start + limit
+        return list(self.book_lines(start, stop)), encode_cursor(stop, len(self.books))
 
 # Test the classes (optional)
 # if __name__ == "__main__":
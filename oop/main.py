@@ -1,6 +1,9 @@
-from book_class import Book
+from book_class import Book, set_deletion_notices, sink
 
 def main():
+    # Deletion notices are opt-in
+    set_deletion_notices(True)
+
     # Creating an instance of Book
     my_book = Book("1984", "George Orwell", 1949)
 
@@ -10,8 +13,9 @@ def main():
     # Demonstrating the __repr__ method
     print(repr(my_book))  # Expected to use __repr__
 
-    # Deleting a book instance to trigger __del__
+    # Deleting a book instance to trigger its deletion notice
     del my_book
+    sink.flush()
 
 if __name__ == "__main__":
     main()
@@ -53,15 +57,16 @@ def main():
 if __name__ == "__main__":
     main()
     
-    from class_static_methods_demo import Calculator
+    from class_static_methods_demo import Calculator, sink
 
 def main():
     # Using the static method
     sum_result = Calculator.add(10, 5)
     print(f"The sum is: {sum_result}")
 
-    # Using the class method
+    # Using the class method; its message is buffered, so flush it first
     product_result = Calculator.multiply(10, 5)
+    sink.flush()
     print(f"The product is: {product_result}")
 
 if __name__ == "__main__":
@@ -1,4 +1,6 @@
 import math
+import operator
+from array import array
 
 class Shape:
     def area(self):
@@ -19,6 +21,130 @@ class Circle(Shape):
     def area(self):
         return math.pi * (self.radius ** 2)
 
+def register_area_kernel(shape_type, fields, kernel):
+    """
+    Register a batch area kernel for a Shape subclass.
+
+    ShapeCollection stores each field of shapes of exactly this type in its
+    own column of floats and computes their areas with one call to the kernel.
+
+    Args:
+        shape_type (type): The Shape subclass
+        fields (tuple): Attribute names stored as columns, e.g. ("radius",)
+        kernel (callable): Called with one column per field; returns an
+            iterable of areas
+    """
+    _AREA_KERNELS[shape_type] = (tuple(fields), kernel)
+
+def _rectangle_areas(lengths, widths):
+    return map(operator.mul, lengths, widths)
+
+def _circle_areas(radii):
+    pi = math.pi
+    return [pi * (radius ** 2) for radius in radii]
+
+def _object_areas(shapes):
+    return map(operator.methodcaller("area"), shapes)
+
+_AREA_KERNELS = {}
+register_area_kernel(Rectangle, ("length", "width"), _rectangle_areas)
+register_area_kernel(Circle, ("radius",), _circle_areas)
+
+class ShapeCollection:
+    """
+    A collection of shapes stored by type, with areas computed per type.
+
+    Shapes of a type with a registered kernel are kept only as columns of
+    their fields, so no per-shape objects are retained. Shapes of any other
+    type, including subclasses of registered types, are kept as objects and
+    their area() is called one by one.
+    """
+
+    def __init__(self):
+        self._groups = {}  # Shape type -> [kernel, columns or list of shapes]
+        self._group_order = []  # Group for each group number
+        self._kinds = array("H")  # Group number of every shape, in insertion order
+
+    def __len__(self):
+        return len(self._kinds)
+
+    def _group(self, shape_type):
+        group = self._groups.get(shape_type)
+        if group is None:
+            registered = _AREA_KERNELS.get(shape_type)
+            if registered is None:
+                group = [_object_areas, None, []]
+            else:
+                fields, kernel = registered
+                group = [kernel, fields, tuple(array("d") for _ in fields)]
+            group.append(len(self._group_order))
+            self._groups[shape_type] = group
+            self._group_order.append(group)
+        return group
+
+    def add(self, shape):
+        """Add one shape."""
+        kernel, fields, storage, number = self._group(type(shape))
+        if fields is None:
+            storage.append(shape)
+        else:
+            # Convert every field before appending any, so a bad field
+            # leaves the columns the same length
+            values = array("d", [getattr(shape, field) for field in fields])
+            for value, column in zip(values, storage):
+                column.append(value)
+        self._kinds.append(number)
+
+    def extend(self, shapes):
+        """Add every shape from an iterable."""
+        for shape in shapes:
+            self.add(shape)
+
+    def add_columns(self, shape_type, **columns):
+        """
+        Add many shapes of a registered type from columns of their fields.
+
+        Example: add_columns(Circle, radius=[1.0, 2.5]).
+        """
+        if shape_type not in _AREA_KERNELS:
+            raise TypeError(f"No area kernel is registered for {shape_type.__name__}")
+        kernel, fields, storage, number = self._group(shape_type)
+        if set(columns) != set(fields):
+            raise ValueError(f"{shape_type.__name__} needs columns {', '.join(fields)}")
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) != 1:
+            raise ValueError("All columns must have the same length")
+        values = [array("d", columns[field]) for field in fields]
+        for column, new in zip(storage, values):
+            column.extend(new)
+        self._kinds.extend(array("H", [number]) * lengths.pop())
+
+    def _group_areas(self, group):
+        """Return an iterable of the areas of one group, in insertion order."""
+        kernel, fields, storage, number = group
+        if fields is None:
+            return kernel(storage)
+        return kernel(*storage)
+
+    def areas(self):
+        """Return a list of the area of every shape, in the order they were added."""
+        groups = [self._group_areas(group) for group in self._group_order]
+        if len(groups) == 1:
+            return list(groups[0])
+        next_area = [iter(areas).__next__ for areas in groups]
+        return [next_area[kind]() for kind in self._kinds]
+
+    def total_area(self):
+        """Return the sum of all areas."""
+        return sum(sum(self._group_areas(group)) for group in self._group_order)
+
+    def max_area(self):
+        """Return the largest area. Raises ValueError if the collection is empty."""
+        if not self._kinds:
+            raise ValueError("max_area() of an empty ShapeCollection")
+        return max(max(self._group_areas(group), default=-math.inf)
+                   for group in self._group_order)
+
 # Test the classes (optional)
 # if __name__ == "__main__":
 #     rectangle = Rectangle(10, 5)
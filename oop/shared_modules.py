@@ -0,0 +1,41 @@
+"""
+Shared Modules
+
+The oop examples report through the event sink and write listings with the
+buffered output helpers from programming_paradigm. This module loads those
+two modules from their files without adding programming_paradigm to
+sys.path, so importing an oop example cannot change which modules other
+imports find.
+
+Each module is registered in sys.modules under its usual name, so code
+that imports event_sink directly gets the same module, and the same sink.
+"""
+
+import importlib.util
+import os
+import sys
+
+_PARADIGM_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "programming_paradigm")
+
+
+def _load(name):
+    module = sys.modules.get(name)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(name, os.path.join(_PARADIGM_DIR, name + ".py"))
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[name]
+            raise
+    return module
+
+
+event_sink = _load("event_sink")
+buffered_output = _load("buffered_output")
+
+sink = event_sink.sink
+write_lines = buffered_output.write_lines
+decode_cursor = buffered_output.decode_cursor
+encode_cursor = buffered_output.encode_cursor
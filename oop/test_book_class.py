@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the Book Class
+
+This module contains unit tests for Book, covering its string forms,
+opt-in deletion notices and shared author strings.
+"""
+
+import unittest
+from book_class import Book, set_deletion_notices, sink
+
+
+class TestBook(unittest.TestCase):
+    """Test cases for the Book class."""
+
+    def setUp(self):
+        """Capture everything written by the shared event sink."""
+        self.written = []
+        self.capture = sink.redirected(self.written.extend)
+        self.capture.__enter__()
+
+    def tearDown(self):
+        set_deletion_notices(False)
+        self.capture.__exit__(None, None, None)
+
+    def test_string_forms(self):
+        book = Book("1984", "George Orwell", 1949)
+        self.assertEqual(str(book), "1984 by George Orwell, published in 1949")
+        self.assertEqual(repr(book), "Book('1984', 'George Orwell', 1949)")
+
+    def test_notices_off_by_default(self):
+        """Test that deleting a book is silent unless notices are on."""
+        book = Book("1984", "George Orwell", 1949)
+        del book
+        sink.flush()
+        self.assertEqual(self.written, [])
+
+    def test_notices_on(self):
+        """Test that each deleted book emits one notice through the sink."""
+        set_deletion_notices(True)
+        books = [Book(f"Title {i}", "Author", 2000) for i in range(3)]
+        del books
+        sink.flush()
+        self.assertEqual(sorted(self.written), ["Deleting Title 0", "Deleting Title 1", "Deleting Title 2"])
+
+    def test_shared_authors(self):
+        """Test that books by the same author share one author string."""
+        first = Book("Emma", "".join(["Jane ", "Austen"]), 1815)
+        second = Book("Persuasion", "".join(["Jane ", "Aus", "ten"]), 1817)
+        self.assertIs(first.author, second.author)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
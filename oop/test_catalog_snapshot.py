@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the Catalog Snapshot
+
+This module contains unit tests for write_snapshot and CatalogSnapshot,
+covering round trips, lazy access and rejection of invalid files.
+"""
+
+import os
+import tempfile
+import unittest
+from catalog_snapshot import CatalogSnapshot, write_snapshot
+from library_system import Book, EBook, Library, PrintBook
+
+
+def describe(book):
+    return (type(book), book.title, book.author,
+            getattr(book, "file_size", None), getattr(book, "page_count", None))
+
+
+class TestCatalogSnapshot(unittest.TestCase):
+    """Test cases for writing and reading catalog snapshots."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "catalog.snapshot")
+        self.books = [
+            Book("Pride and Prejudice", "Jane Austen"),
+            EBook("Snow Crash", "Neal Stephenson", 500),
+            PrintBook("The Catcher in the Rye", "J.D. Salinger", 234),
+            EBook("Cien años de soledad", "Gabriel García Márquez", 2 ** 40),
+            Book("", ""),
+        ]
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_round_trip(self):
+        """Test that every book comes back with its type and fields."""
+        library = Library()
+        for book in self.books:
+            library.add_book(book)
+        write_snapshot(self.path, library)
+        with CatalogSnapshot(self.path) as snapshot:
+            self.assertEqual(len(snapshot), 5)
+            self.assertEqual([describe(book) for book in snapshot],
+                             [describe(book) for book in self.books])
+            restored = snapshot.to_library()
+        self.assertEqual(restored.field_stats("file_size").total, 500 + 2 ** 40)
+
+    def test_random_access(self):
+        """Test decoding single records by position."""
+        write_snapshot(self.path, self.books)
+        with CatalogSnapshot(self.path) as snapshot:
+            self.assertEqual(describe(snapshot[2]), describe(self.books[2]))
+            self.assertEqual(describe(snapshot[-2]), describe(self.books[3]))
+            with self.assertRaises(IndexError):
+                snapshot[5]
+
+    def test_empty_catalog(self):
+        write_snapshot(self.path, [])
+        with CatalogSnapshot(self.path) as snapshot:
+            self.assertEqual(list(snapshot), [])
+
+    def test_unsupported_type(self):
+        """Test that unknown book types are rejected and no file is left."""
+        class AudioBook(Book):
+            __slots__ = ()
+
+        with self.assertRaises(TypeError):
+            write_snapshot(self.path, [AudioBook("Dracula", "Bram Stoker")])
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_non_integer_fields(self):
+        """Test that fields a record cannot hold are rejected clearly."""
+        for book, error in [(EBook("Snow Crash", "Neal Stephenson", 1.5), TypeError),
+                            (PrintBook("Ulysses", "James Joyce", "730"), TypeError),
+                            (PrintBook("Ulysses", "James Joyce", 2 ** 63), ValueError)]:
+            with self.subTest(book=str(book)), self.assertRaises(error):
+                write_snapshot(self.path, [book])
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_close_while_iterating(self):
+        """Test that closing stops open iterators instead of failing."""
+        write_snapshot(self.path, self.books)
+        snapshot = CatalogSnapshot(self.path)
+        books = iter(snapshot)
+        self.assertEqual(describe(next(books)), describe(self.books[0]))
+        unstarted = iter(snapshot)
+        snapshot.close()
+        self.assertEqual(list(books), [])
+        self.assertEqual(list(unstarted), [])
+
+        with CatalogSnapshot(self.path) as snapshot:
+            books = iter(snapshot)
+            next(books)
+        self.assertEqual(list(books), [])
+
+    def test_invalid_files(self):
+        """Test that other files, other versions and truncated files are rejected."""
+        write_snapshot(self.path, self.books)
+        with open(self.path, "rb") as snapshot:
+            data = snapshot.read()
+        for name, contents in [("empty", b""), ("other", b"PK\x03\x04" * 8),
+                               ("version", data[:8] + b"\x02" + data[9:]),
+                               ("truncated", data[:40])]:
+            path = os.path.join(self.directory.name, name)
+            with open(path, "wb") as snapshot:
+                snapshot.write(contents)
+            with self.subTest(name=name), self.assertRaises(ValueError):
+                CatalogSnapshot(path)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the Library System
+
+This module contains unit tests for the oop Library, covering insertion
+order, partitioning by type and the incremental field aggregates.
+"""
+
+import io
+import unittest
+from library_system import Book, EBook, FieldStats, Library, PrintBook
+
+
+class TestLibrary(unittest.TestCase):
+    """Test cases for the Library class."""
+
+    def setUp(self):
+        self.library = Library()
+        self.books = [
+            Book("Pride and Prejudice", "Jane Austen"),
+            EBook("Snow Crash", "Neal Stephenson", 500),
+            PrintBook("The Catcher in the Rye", "J.D. Salinger", 234),
+            EBook("Neuromancer", "William Gibson", 300),
+            PrintBook("Dune", "Frank Herbert", 412),
+        ]
+        for book in self.books:
+            self.library.add_book(book)
+
+    def test_insertion_order(self):
+        """Test that iteration yields the original objects in order."""
+        self.assertEqual(list(self.library), self.books)
+        self.assertEqual(len(self.library), 5)
+
+    def test_partition_by_type(self):
+        """Test counts and books per exact type."""
+        self.assertEqual(self.library.count(), 5)
+        self.assertEqual(self.library.count(EBook), 2)
+        self.assertEqual(self.library.count(Book), 1)
+        self.assertEqual(self.library.books_of_type(PrintBook), [self.books[2], self.books[4]])
+        self.assertEqual(self.library.books_of_type(dict), [])
+
+    def test_field_stats(self):
+        """Test the running count, sum, minimum and maximum of each field."""
+        self.assertEqual(self.library.field_stats("file_size"), FieldStats(2, 800, 300, 500))
+        self.assertEqual(self.library.field_stats("page_count").mean, 323)
+        self.assertEqual(self.library.field_stats("page_count", EBook).count, 0)
+        self.assertIsNone(Library().field_stats("file_size").mean)
+        with self.assertRaises(ValueError):
+            self.library.field_stats("title")
+
+    def test_non_numeric_fields(self):
+        """Test that books with non-numeric fields are kept but not aggregated."""
+        book = EBook("Snow Crash", "Neal Stephenson", "500")
+        self.library.add_book(book)
+        self.assertEqual(self.library.books_of_type(EBook), [self.books[1], self.books[3], book])
+        self.assertEqual(self.library.count(EBook), 3)
+        self.assertEqual(self.library.field_stats("file_size", EBook), FieldStats(2, 800, 300, 500))
+
+    def test_subclass_store(self):
+        """Test that a subclass gets its own store with inherited fields."""
+        class AudioEBook(EBook):
+            __slots__ = ("minutes",)
+
+        self.library.add_book(AudioEBook("Dracula", "Bram Stoker", 900))
+        self.assertEqual(self.library.field_stats("file_size", AudioEBook), FieldStats(1, 900, 900, 900))
+        self.assertEqual(self.library.field_stats("file_size").maximum, 900)
+        self.assertEqual(self.library.count(EBook), 2)
+
+    def test_list_books(self):
+        """Test that the listing writes every book through one buffered write."""
+        output = io.StringIO()
+        self.library.list_books(output)
+        self.assertEqual(output.getvalue().splitlines(), [str(book) for book in self.books])
+
+    def test_pages(self):
+        """Test walking the listing page by page with continuation tokens."""
+        lines, cursor = self.library.book_page(limit=2)
+        pages = [lines]
+        while cursor is not None:
+            lines, cursor = self.library.book_page(cursor, limit=2)
+            pages.append(lines)
+        self.assertEqual([len(page) for page in pages], [2, 2, 1])
+        self.assertEqual(sum(pages, []), [str(book) for book in self.books])
+        with self.assertRaises(ValueError):
+            self.library.book_page("-1")
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the Polymorphism Demo Shapes
+
+This module contains unit tests for ShapeCollection, covering per-type
+kernels, registered kernels and the per-object area() fallback.
+"""
+
+import math
+import unittest
+from polymorphism_demo import (_AREA_KERNELS, Circle, Rectangle, Shape, ShapeCollection,
+                                register_area_kernel)
+
+
+class Square(Rectangle):
+    """A subclass with no kernel of its own, so it uses area()."""
+
+    def __init__(self, side):
+        super().__init__(side, side)
+
+    def area(self):
+        return self.length ** 2
+
+
+class Triangle(Shape):
+    def __init__(self, base, height):
+        self.base = base
+        self.height = height
+
+    def area(self):
+        return self.base * self.height / 2
+
+
+class TestShapeCollection(unittest.TestCase):
+    """Test cases for the ShapeCollection class."""
+
+    def setUp(self):
+        self.shapes = [Rectangle(10, 5), Circle(7), Square(3), Rectangle(2, 0.5), Circle(0.1)]
+        self.collection = ShapeCollection()
+        self.collection.extend(self.shapes)
+
+    def test_areas_match_objects(self):
+        """Test that areas are exact and in insertion order."""
+        self.assertEqual(self.collection.areas(), [shape.area() for shape in self.shapes])
+        self.assertEqual(len(self.collection), 5)
+
+    def test_aggregates(self):
+        """Test total and maximum area."""
+        areas = [shape.area() for shape in self.shapes]
+        self.assertAlmostEqual(self.collection.total_area(), sum(areas))
+        self.assertEqual(self.collection.max_area(), max(areas))
+        with self.assertRaises(ValueError):
+            ShapeCollection().max_area()
+
+    def test_add_columns(self):
+        """Test adding shapes from columns without creating objects."""
+        collection = ShapeCollection()
+        collection.add_columns(Circle, radius=[1, 2])
+        collection.add(Rectangle(3, 4))
+        self.assertEqual(collection.areas(), [math.pi, math.pi * 4, 12])
+        with self.assertRaises(ValueError):
+            collection.add_columns(Rectangle, length=[1])
+        with self.assertRaises(TypeError):
+            collection.add_columns(Square, length=[1], width=[1])
+
+    def test_invalid_fields(self):
+        """Test that a shape with a bad field leaves the columns aligned."""
+        collection = ShapeCollection()
+        collection.add(Rectangle(3, 4))
+        with self.assertRaises(TypeError):
+            collection.add(Rectangle(5, "wide"))
+        with self.assertRaises(TypeError):
+            collection.add_columns(Rectangle, length=[1, 2], width=[1, None])
+        collection.add(Rectangle(1, 2))
+        self.assertEqual(collection.areas(), [12, 2])
+        self.assertEqual(len(collection), 2)
+
+    def test_registered_kernel(self):
+        """Test that a subclass can register its own batch kernel."""
+        calls = []
+
+        def triangle_areas(bases, heights):
+            calls.append(len(bases))
+            return [base * height / 2 for base, height in zip(bases, heights)]
+
+        register_area_kernel(Triangle, ("base", "height"), triangle_areas)
+        self.addCleanup(_AREA_KERNELS.pop, Triangle, None)
+        collection = ShapeCollection()
+        collection.extend([Triangle(2, 3), Triangle(4, 5), Circle(1)])
+        self.assertEqual(collection.areas(), [3.0, 10.0, math.pi])
+        self.assertEqual(calls, [2])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
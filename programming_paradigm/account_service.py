@@ -0,0 +1,137 @@
+"""
+Asynchronous Account Service
+
+This module puts BankAccount objects behind an asyncio front end. Incoming
+deposit, withdraw and balance requests are queued per account and coalesced
+into micro-batches. Each batch runs on a worker thread in one go and is then
+committed once, for example with a single fsync of an event-sourced
+account, before every caller's awaitable is resolved with its own result.
+
+A batch is started when `max_batch` requests are waiting for an account or
+when the oldest waiting request has waited `max_wait` seconds, whichever
+comes first. Larger batches and longer waits raise throughput at the cost
+of latency.
+"""
+
+import asyncio
+from bank_account import DEPOSIT, WITHDRAW
+
+BALANCE = 0  # Request kind of a balance query, besides DEPOSIT and WITHDRAW
+
+
+class AccountService:
+    """
+    Batching asyncio front end for a set of BankAccount objects.
+
+    Requests for one account are applied in the order they were made.
+    Requests for different accounts are batched and committed independently.
+    """
+
+    def __init__(self, accounts, max_batch=64, max_wait=0.002, commit=None):
+        """
+        Initialize the service.
+
+        Args:
+            accounts (dict): BankAccount instances keyed by account id
+            max_batch (int): Largest number of requests applied in one batch
+            max_wait (float): Longest time in seconds a request waits for
+                its batch to fill
+            commit (callable): Called with the account after each batch, on
+                the worker thread, to make the batch durable
+        """
+        self.accounts = accounts
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.commit = commit
+        self._pending = {}  # Account id to list of (kind, amount, future)
+        self._full = {}  # Account id to event set when a batch is full
+        self._drains = {}  # Account id to the task draining its queue
+
+    async def deposit(self, account_id, amount):
+        """
+        Deposit money into an account.
+
+        Returns:
+            bool: True if the deposit was accepted, False if the amount was not positive
+        """
+        return await self._submit(account_id, DEPOSIT, amount)
+
+    async def withdraw(self, account_id, amount):
+        """
+        Withdraw money from an account.
+
+        Returns:
+            bool: True if the withdrawal was made, False if funds were insufficient
+        """
+        return await self._submit(account_id, WITHDRAW, amount)
+
+    async def balance(self, account_id):
+        """
+        Read the balance of an account after every earlier request for it.
+
+        Returns:
+            float: The account balance
+        """
+        return await self._submit(account_id, BALANCE, None)
+
+    async def _submit(self, account_id, kind, amount):
+        """Queue a request and wait for the batch that applies it."""
+        if account_id not in self.accounts:
+            raise KeyError(f"Unknown account {account_id!r}")
+        future = asyncio.get_running_loop().create_future()
+        pending = self._pending.setdefault(account_id, [])
+        pending.append((kind, amount, future))
+        if account_id not in self._drains:
+            self._full[account_id] = asyncio.Event()
+            self._drains[account_id] = asyncio.create_task(self._drain(account_id))
+        elif len(pending) >= self.max_batch:
+            self._full[account_id].set()
+        return await future
+
+    async def _drain(self, account_id):
+        """Apply batches for one account until its queue is empty."""
+        loop = asyncio.get_running_loop()
+        account = self.accounts[account_id]
+        full = self._full[account_id]
+        try:
+            while self._pending.get(account_id):
+                if len(self._pending[account_id]) < self.max_batch:
+                    try:
+                        await asyncio.wait_for(full.wait(), self.max_wait)
+                    except asyncio.TimeoutError:
+                        pass
+                full.clear()
+                pending = self._pending[account_id]
+                batch = pending[:self.max_batch]
+                self._pending[account_id] = pending[self.max_batch:]
+                try:
+                    results = await loop.run_in_executor(None, self._apply, account, batch)
+                except Exception as error:
+                    for _, _, future in batch:
+                        if not future.done():
+                            future.set_exception(error)
+                    continue
+                for (_, _, future), result in zip(batch, results):
+                    if not future.done():
+                        future.set_result(result)
+        finally:
+            del self._pending[account_id]
+            del self._full[account_id]
+            del self._drains[account_id]
+
+    def _apply(self, account, batch):
+        """Apply a batch of requests to an account and commit it once."""
+        results = []
+        for kind, amount, _ in batch:
+            if kind == DEPOSIT:
+                accepted = amount > 0
+                if accepted:
+                    account.deposit(amount)
+                results.append(accepted)
+            elif kind == WITHDRAW:
+                results.append(account.withdraw(amount))
+            else:
+                results.append(account.account_balance)
+        if self.commit is not None:
+            self.commit(account)
+        return results
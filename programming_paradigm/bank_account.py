@@ -1,9 +1,23 @@
+import itertools
+import threading
+from event_sink import sink
+
+# Transaction kinds, shared by every module that records or batches
+# deposits and withdrawals. Their values are stored in journal files.
+DEPOSIT = 1
+WITHDRAW = 2
+
+_lock_order = itertools.count()  # Global order in which account locks are taken
+
+
 class BankAccount:
     """
     A simple bank account class that demonstrates OOP concepts.
     
     This class encapsulates banking operations including deposits, withdrawals,
-    and balance inquiries while maintaining data integrity.
+    and balance inquiries while maintaining data integrity. Every account has
+    its own lock, so deposits, withdrawals and transfers are safe to call
+    from several threads.
     """
     
     def __init__(self, initial_balance=0):
@@ -14,6 +28,8 @@ class BankAccount:
             initial_balance (float): Starting balance for the account. Defaults to 0.
         """
         self.account_balance = initial_balance
+        self._lock = threading.Lock()
+        self._lock_order = next(_lock_order)
     
     def deposit(self, amount):
         """
@@ -23,9 +39,10 @@ class BankAccount:
             amount (float): Amount to deposit. Must be positive.
         """
         if amount > 0:
-            self.account_balance += amount
+            with self._lock:
+                self._credit(amount)
         else:
-            print("Deposit amount must be positive.")
+            sink.emit("Deposit amount must be positive.")
     
     def withdraw(self, amount):
         """
@@ -37,14 +54,53 @@ class BankAccount:
         Returns:
             bool: True if withdrawal was successful, False if insufficient funds.
         """
-        if amount > 0 and amount <= self.account_balance:
-            self.account_balance -= amount
-            return True
-        else:
-            return False
+        with self._lock:
+            if amount > 0 and amount <= self.account_balance:
+                self._debit(amount)
+                return True
+            else:
+                return False
+    
+    def _credit(self, amount):
+        """Add an accepted amount to the balance. Called with the lock held."""
+        self.account_balance += amount
+    
+    def _debit(self, amount):
+        """Subtract an accepted amount from the balance. Called with the lock held."""
+        self.account_balance -= amount
     
     def display_balance(self):
         """
         Display the current account balance in a user-friendly format.
         """
         print(f"Current Balance: ${self.account_balance:.2f}")
+
+
+def transfer(source, destination, amount):
+    """
+    Atomically move money from one account to another.
+    
+    Both account locks are held for the whole transfer, so no other thread
+    can see the money missing from both accounts or present in both. Locks
+    are always taken in account creation order, so two opposite transfers
+    cannot deadlock.
+    
+    Args:
+        source (BankAccount): Account to withdraw from
+        destination (BankAccount): Account to deposit into
+        amount (float): Amount to transfer. Must be positive.
+        
+    Returns:
+        bool: True if the transfer was made, False if the amount was not
+        positive or the source had insufficient funds
+    """
+    if source is destination:
+        with source._lock:
+            return 0 < amount <= source.account_balance
+    first, second = sorted((source, destination), key=lambda account: account._lock_order)
+    with first._lock, second._lock:
+        if amount > 0 and amount <= source.account_balance:
+            source._debit(amount)
+            destination._credit(amount)
+            return True
+        return False
@@ -0,0 +1,184 @@
+"""
+Event-Sourced Bank Accounts
+
+This module keeps a full audit trail for a BankAccount. Every accepted
+deposit and withdrawal, including both sides of a transfer, is appended to
+a journal of fixed-size binary records. Every `snapshot_every` events the
+balance is also written to a snapshot file.
+
+Reopening an account reads the latest snapshot and replays only the journal
+records written after it. Point-in-time balance queries start from the
+latest snapshot before the requested time, so they read at most
+`snapshot_every` journal records.
+
+Files kept for an account at `path`:
+    path.journal    - (kind, amount, time) per event
+    path.snapshots  - (events covered, time, balance) per snapshot
+"""
+
+import bisect
+import os
+import struct
+import time
+from array import array
+from bank_account import DEPOSIT, WITHDRAW, BankAccount
+
+_EVENT = struct.Struct("<Bdd")  # Kind, amount, time
+_SNAPSHOT = struct.Struct("<Qdd")  # Events covered, time, balance
+
+
+class EventSourcedAccount(BankAccount):
+    """
+    A BankAccount whose history is journaled to disk.
+
+    Journal records are flushed to the operating system after every event.
+    Call sync() to force them onto disk.
+    """
+
+    def __init__(self, path, initial_balance=0, snapshot_every=1000, clock=time.time):
+        """
+        Open an account, recovering its balance if it already exists.
+
+        Args:
+            path (str): Path prefix of the journal and snapshot files
+            initial_balance (float): Starting balance of a new account.
+                Ignored when the account already exists, unless no complete
+                snapshot survived a crash.
+            snapshot_every (int): Number of events between snapshots
+            clock (callable): Returns the current time in seconds
+        """
+        super().__init__(initial_balance)
+        self.snapshot_every = snapshot_every
+        self._clock = clock
+        self._snapshot_events = array("Q")
+        self._snapshot_times = array("d")
+        self._snapshot_balances = array("d")
+        self._events = 0
+
+        journal_path = path + ".journal"
+        snapshot_path = path + ".snapshots"
+        is_new = not os.path.exists(snapshot_path)
+        self._journal = open(journal_path, "a+b")
+        self._snapshots = open(snapshot_path, "a+b")
+        if is_new:
+            self._journal.truncate(0)
+            self._write_snapshot(0, self._clock(), self.account_balance)
+        else:
+            self._recover()
+
+    def _recover(self):
+        """Load the snapshots and replay the journal after the latest one."""
+        self._snapshots.seek(0)
+        data = self._snapshots.read()
+        whole = len(data) - len(data) % _SNAPSHOT.size  # Ignore a torn snapshot
+        for events, when, balance in _SNAPSHOT.iter_unpack(data[:whole]):
+            self._snapshot_events.append(events)
+            self._snapshot_times.append(when)
+            self._snapshot_balances.append(balance)
+
+        size = os.fstat(self._journal.fileno()).st_size
+        self._events = size // _EVENT.size
+        self._journal.truncate(self._events * _EVENT.size)  # Drop a torn event
+        while self._snapshot_events and self._snapshot_events[-1] > self._events:
+            # A snapshot reached disk but the events it covers did not
+            for column in (self._snapshot_events, self._snapshot_times, self._snapshot_balances):
+                column.pop()
+        self._snapshots.truncate(len(self._snapshot_events) * _SNAPSHOT.size)
+        if not self._snapshot_events:
+            # Not even the first snapshot survived, as after a crash just
+            # after the account was created, so replay the whole journal
+            # from the initial balance
+            if self._events:
+                (_, _, when) = _EVENT.unpack(os.pread(self._journal.fileno(), _EVENT.size, 0))
+            else:
+                when = self._clock()
+            self._write_snapshot(0, when, self.account_balance)
+        self.account_balance = self._replay(len(self._snapshot_events) - 1, None)
+
+    def _replay(self, snapshot, until):
+        """
+        Compute a balance from a snapshot and the journal records after it.
+
+        Args:
+            snapshot (int): Position of the starting snapshot
+            until (float): Stop at the first event after this time, or None
+                to replay to the end of the journal
+
+        Returns:
+            float: The resulting balance
+        """
+        balance = self._snapshot_balances[snapshot]
+        start = self._snapshot_events[snapshot] * _EVENT.size
+        self._journal.flush()
+        data = os.pread(self._journal.fileno(), self._events * _EVENT.size - start, start)
+        for kind, amount, when in _EVENT.iter_unpack(data):
+            if until is not None and when > until:
+                break
+            balance = balance + amount if kind == DEPOSIT else balance - amount
+        return balance
+
+    def _credit(self, amount):
+        super()._credit(amount)
+        self._record(DEPOSIT, amount)
+
+    def _debit(self, amount):
+        super()._debit(amount)
+        self._record(WITHDRAW, amount)
+
+    def _record(self, kind, amount):
+        """Append an event to the journal, taking a snapshot when one is due."""
+        now = self._clock()
+        self._journal.write(_EVENT.pack(kind, amount, now))
+        self._journal.flush()
+        self._events += 1
+        if self._events - self._snapshot_events[-1] >= self.snapshot_every:
+            self._write_snapshot(self._events, now, self.account_balance)
+
+    def _write_snapshot(self, events, when, balance):
+        """Record the balance after `events` journal events."""
+        self._snapshot_events.append(events)
+        self._snapshot_times.append(when)
+        self._snapshot_balances.append(balance)
+        self._snapshots.write(_SNAPSHOT.pack(events, when, balance))
+        self._snapshots.flush()
+
+    def event_count(self):
+        """
+        Get the number of events in the journal.
+
+        Returns:
+            int: Number of accepted deposits and withdrawals recorded
+        """
+        return self._events
+
+    def balance_at(self, when):
+        """
+        Get the balance the account had at a point in time.
+
+        Args:
+            when (float): The time, as returned by the account's clock
+
+        Returns:
+            float: The balance after every event up to and including `when`,
+            or None if the account did not exist yet
+        """
+        with self._lock:
+            snapshot = bisect.bisect_right(self._snapshot_times, when) - 1
+            if snapshot < 0:
+                return None
+            return self._replay(snapshot, when)
+
+    def sync(self):
+        """Force the journal and snapshots onto disk."""
+        with self._lock:
+            for stream in (self._journal, self._snapshots):
+                stream.flush()
+                os.fsync(stream.fileno())
+
+    def close(self):
+        """Sync and close the journal and snapshot files."""
+        if self._journal.closed:
+            return
+        self.sync()
+        self._journal.close()
+        self._snapshots.close()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Account Service Load Generator
+
+Drives an AccountService with many concurrent clients and reports
+throughput and latency percentiles for several batch settings. Each batch
+commit sleeps for COMMIT_SECONDS to stand in for an fsync.
+
+Usage:
+    python benchmark_account_service.py [clients]
+"""
+
+import asyncio
+import random
+import sys
+import time
+from account_service import AccountService
+from bank_account import BankAccount
+
+DEFAULT_CLIENTS = 500
+ACCOUNTS = 20
+REQUESTS_PER_CLIENT = 20
+COMMIT_SECONDS = 0.001
+SETTINGS = [  # (max_batch, max_wait)
+    (1, 0.0),
+    (16, 0.001),
+    (64, 0.002),
+    (256, 0.005),
+]
+
+
+def simulated_fsync(account):
+    time.sleep(COMMIT_SECONDS)
+
+
+async def client(service, latencies):
+    """Issue requests one after another, recording the latency of each."""
+    for _ in range(REQUESTS_PER_CLIENT):
+        account_id = random.randrange(ACCOUNTS)
+        operation = random.choice((service.deposit, service.withdraw))
+        start = time.perf_counter()
+        await operation(account_id, random.randint(1, 100))
+        latencies.append(time.perf_counter() - start)
+
+
+async def run(clients, max_batch, max_wait):
+    """
+    Run one load test.
+
+    Returns:
+        tuple: (requests per second, p50 latency, p99 latency) with
+        latencies in milliseconds
+    """
+    accounts = {i: BankAccount(1000) for i in range(ACCOUNTS)}
+    service = AccountService(accounts, max_batch, max_wait, commit=simulated_fsync)
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*[client(service, latencies) for _ in range(clients)])
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2] * 1000
+    p99 = latencies[int(len(latencies) * 0.99)] * 1000
+    return len(latencies) / elapsed, p50, p99
+
+
+def main(clients):
+    print(f"{clients} clients, {ACCOUNTS} accounts, {COMMIT_SECONDS * 1000:.0f} ms per commit")
+    print(f"{'max_batch':>9}  {'max_wait ms':>11}  {'requests/s':>10}  {'p50 ms':>7}  {'p99 ms':>7}")
+    for max_batch, max_wait in SETTINGS:
+        rate, p50, p99 = asyncio.run(run(clients, max_batch, max_wait))
+        print(f"{max_batch:>9}  {max_wait * 1000:>11.1f}  {rate:>10.0f}  {p50:>7.2f}  {p99:>7.2f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_CLIENTS)
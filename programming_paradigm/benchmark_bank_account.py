@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+BankAccount Transfer Benchmark
+
+Measures transfer throughput between a pool of accounts as the number of
+threads grows.
+
+Usage:
+    python benchmark_bank_account.py [thread counts...]
+"""
+
+import random
+import sys
+import threading
+import time
+from bank_account import BankAccount, transfer
+
+DEFAULT_THREADS = (1, 2, 4, 8, 16)
+ACCOUNTS = 1000
+TRANSFERS = 200_000  # Split across the threads
+
+
+def throughput(threads):
+    """
+    Run random transfers from several threads.
+
+    Returns:
+        float: Transfers completed per second
+    """
+    accounts = [BankAccount(1000) for _ in range(ACCOUNTS)]
+    per_thread = TRANSFERS // threads
+    workloads = [[tuple(random.sample(accounts, 2)) + (random.randint(1, 100),)
+                  for _ in range(per_thread)] for _ in range(threads)]
+    start_barrier = threading.Barrier(threads + 1)
+
+    def worker(workload):
+        start_barrier.wait()
+        for source, destination, amount in workload:
+            transfer(source, destination, amount)
+
+    workers = [threading.Thread(target=worker, args=(workload,)) for workload in workloads]
+    for thread in workers:
+        thread.start()
+    start_barrier.wait()
+    start = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    assert sum(account.account_balance for account in accounts) == ACCOUNTS * 1000
+    return per_thread * threads / elapsed
+
+
+def main(thread_counts):
+    print(f"{'threads':>8}  {'transfers/s':>12}")
+    for threads in thread_counts:
+        print(f"{threads:>8}  {throughput(threads):>12.0f}")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or DEFAULT_THREADS)
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Book Storage Memory Benchmark
+
+Compares the memory used by a catalog of individual objects with a
+columnar BookStore. Three representations are measured:
+
+    dict    - one object per book with a per-instance __dict__ (the
+              original Book layout)
+    slots   - one Book object per book using __slots__
+    store   - a BookStore with interned strings and typed columns
+
+Usage:
+    python benchmark_book_store.py [catalog sizes...]
+"""
+
+import sys
+import time
+import tracemalloc
+from book_store import BookStore
+from library_management import Book
+
+DEFAULT_SIZES = (1_000_000, 10_000_000)
+AUTHORS = 50_000
+
+
+class DictBook:
+    """A book with the original per-instance __dict__ layout."""
+
+    def __init__(self, title, author):
+        self.title = title
+        self.author = author
+        self._is_checked_out = False
+
+
+def build_dict_books(size):
+    return [DictBook(f"Title {i}", f"Author {i % AUTHORS}") for i in range(size)]
+
+
+def build_slot_books(size):
+    return [Book(f"Title {i}", f"Author {i % AUTHORS}") for i in range(size)]
+
+
+def build_store(size):
+    store = BookStore()
+    for i in range(size):
+        store.add(f"Title {i}", f"Author {i % AUTHORS}", page_count=i % 1000)
+    return store
+
+
+def measure(build, size):
+    """
+    Build a catalog and measure the memory it keeps alive.
+
+    Returns:
+        tuple: (megabytes retained, seconds to build)
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    catalog = build(size)
+    elapsed = time.perf_counter() - start
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del catalog
+    return retained / 2**20, elapsed
+
+
+def main(sizes):
+    print(f"{'books':>10}  {'layout':>6}  {'MB':>10}  {'bytes/book':>10}  {'build s':>8}")
+    for size in sizes:
+        for name, build in (("dict", build_dict_books), ("slots", build_slot_books),
+                            ("store", build_store)):
+            megabytes, elapsed = measure(build, size)
+            per_book = megabytes * 2**20 / size
+            print(f"{size:>10}  {name:>6}  {megabytes:>10.1f}  {per_book:>10.1f}  {elapsed:>8.2f}")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES)
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Calculator Benchmark Suite
+
+Times the calculator functions in this repository on scalar workloads (one
+call per row) and bulk workloads (a whole column per call), writes the
+results as JSON and compares them with a stored baseline.
+
+Each result is the best of several runs, in nanoseconds per row. Results
+are compared relative to a reference loop timed in the same run, so a
+machine that is uniformly faster or slower than the one that recorded the
+baseline does not register as a change. The suite exits with status 1 if
+any benchmark is slower than its baseline by more than the tolerance, so
+it can gate changes in CI.
+
+Usage:
+    python benchmark_calculators.py [--rows N] [--output FILE]
+                                    [--baseline FILE] [--tolerance FRACTION]
+                                    [--update-baseline]
+"""
+
+import argparse
+import functools
+import json
+import operator
+import os
+import platform
+import random
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, "..", "fns_and_dsa"))
+sys.path.insert(0, os.path.join(HERE, "..", "oop"))
+
+from arithmetic_operations import perform_operation, perform_operations  # noqa: E402
+from class_static_methods_demo import Calculator  # noqa: E402
+from event_sink import sink  # noqa: E402
+from robust_division_calculator import safe_divide, safe_divide_array  # noqa: E402
+from simple_calculator import SimpleCalculator  # noqa: E402
+
+DEFAULT_ROWS = 100_000
+DEFAULT_BASELINE = os.path.join(HERE, "benchmark_calculators_baseline.json")
+DEFAULT_TOLERANCE = 0.50
+REPEATS = 7
+REFERENCE = "reference/scalar"
+ZERO_FRACTION = 0.01
+
+
+def scalar(function):
+    """Call function once per row."""
+    def run(left, right):
+        for a, b in zip(left, right):
+            function(a, b)
+    return run
+
+
+def bulk(function):
+    """Map function over both columns in one call."""
+    def run(left, right):
+        list(map(function, left, right))
+    return run
+
+
+def build_benchmarks():
+    """Return benchmark name -> function of (left column, right column)."""
+    calculator = SimpleCalculator()
+    divide_operation = functools.partial(perform_operation, operation="divide")
+    return {
+        REFERENCE: scalar(operator.add),
+        "SimpleCalculator.add/scalar": scalar(calculator.add),
+        "SimpleCalculator.subtract/scalar": scalar(calculator.subtract),
+        "SimpleCalculator.multiply/scalar": scalar(calculator.multiply),
+        "SimpleCalculator.divide/scalar": scalar(calculator.divide),
+        "SimpleCalculator.divide/bulk": bulk(calculator.divide),
+        "perform_operation/scalar": scalar(divide_operation),
+        "perform_operation/bulk": bulk(divide_operation),
+        "perform_operations/bulk": lambda left, right: perform_operations(left, right, "divide"),
+        "safe_divide/scalar": scalar(safe_divide),
+        "safe_divide/bulk": bulk(safe_divide),
+        "safe_divide_array/bulk": safe_divide_array,
+        "Calculator.add/scalar": scalar(Calculator.add),
+        "Calculator.multiply/scalar": scalar(Calculator.multiply),
+        "Calculator.multiply/bulk": bulk(Calculator.multiply),
+    }
+
+
+def build_columns(rows):
+    """Return two columns of floats; about 1% of the divisors are zero."""
+    generator = random.Random(42)
+    left = [generator.uniform(-1000, 1000) for _ in range(rows)]
+    right = [0.0 if generator.random() < ZERO_FRACTION else generator.uniform(-1000, 1000)
+             for _ in range(rows)]
+    return left, right
+
+
+def run_benchmarks(rows):
+    """
+    Run every benchmark.
+
+    Returns:
+        dict: Benchmark name -> best time in nanoseconds per row
+    """
+    left, right = build_columns(rows)
+    benchmarks = build_benchmarks()
+    best = dict.fromkeys(benchmarks, float("inf"))
+    # Calculator.multiply reports through the shared event sink; keep the
+    # cost of emitting but drop the messages
+    with sink.silenced():
+        # Interleave the repeats so that drift in machine speed affects
+        # every benchmark alike rather than whichever happens to run last
+        for _ in range(REPEATS):
+            for name, benchmark in benchmarks.items():
+                start = time.perf_counter()
+                benchmark(left, right)
+                best[name] = min(best[name], time.perf_counter() - start)
+    return {name: seconds * 1e9 / rows for name, seconds in best.items()}
+
+
+def compare(results, baseline, tolerance):
+    """
+    Print results against the baseline, both scaled by their reference loop.
+
+    Returns:
+        list: Names of benchmarks slower than baseline * (1 + tolerance)
+    """
+    regressions = []
+    scale = baseline[REFERENCE] / results[REFERENCE] if REFERENCE in baseline else 1.0
+    print(f"{'benchmark':<34}  {'ns/row':>9}  {'baseline':>9}  {'ratio':>6}")
+    for name, value in results.items():
+        reference = baseline.get(name)
+        if name == REFERENCE or reference is None:
+            print(f"{name:<34}  {value:>9.1f}  {'-':>9}  {'-':>6}")
+            continue
+        ratio = value * scale / reference
+        flag = ""
+        if ratio > 1 + tolerance:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:<34}  {value:>9.1f}  {reference:>9.1f}  {ratio:>6.2f}{flag}")
+    return regressions
+
+
+def write_json(path, rows, results):
+    with open(path, "w") as output:
+        json.dump({"python": platform.python_version(), "rows": rows, "results": results},
+                  output, indent=2, sort_keys=True)
+        output.write("\n")
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="Benchmark the calculator functions.")
+    parser.add_argument("--rows", type=int, default=DEFAULT_ROWS)
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="allowed slowdown as a fraction of the baseline")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="store these results as the new baseline")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.rows)
+    if args.output:
+        write_json(args.output, args.rows, results)
+    if args.update_baseline:
+        write_json(args.baseline, args.rows, results)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as source:
+            baseline = json.load(source)["results"]
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f"{len(regressions)} benchmark(s) regressed by more than {args.tolerance:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
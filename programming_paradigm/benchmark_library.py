@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Library Benchmark
+
+Measures the latency of Library.check_out_book and Library.return_book as
+the catalog grows. With the title index in place the latency should stay
+flat from a thousand to a million books. It also compares single calls
+that print every message, as the library once did, with single calls that
+report through the shared event sink, silent single calls and the batch
+methods. Messages go to os.devnull, so the reporting columns show the cost
+of formatting and writing them rather than of a terminal.
+
+Usage:
+    python benchmark_library.py [catalog sizes...]
+"""
+
+import functools
+import os
+import random
+import sys
+import time
+from event_sink import sink
+from library_management import Book, Library
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000, 1_000_000)
+LOOKUPS = 10_000
+
+
+def build_library(size, reporter=None):
+    """Build a library holding `size` books with distinct titles."""
+    library = Library(reporter=reporter)
+    for i in range(size):
+        library.add_book(Book(f"Title {i}", f"Author {i % 1000}"))
+    return library
+
+
+def time_circulation(library, size, lookups=LOOKUPS, finish=None):
+    """
+    Time check-out and return calls on random titles.
+
+    Args:
+        finish (callable): Called before the clock stops, for example to
+            write out queued messages
+
+    Returns:
+        float: Average latency of one check-out plus return, in microseconds
+    """
+    titles = [f"Title {random.randrange(size)}" for _ in range(lookups)]
+    start = time.perf_counter()
+    for title in titles:
+        library.check_out_book(title)
+        library.return_book(title)
+    if finish is not None:
+        finish()
+    elapsed = time.perf_counter() - start
+    return elapsed / lookups * 1e6
+
+
+def time_batches(library, size, lookups=LOOKUPS):
+    """
+    Time check_out_many and return_many on random titles.
+
+    Returns:
+        float: Average latency of one check-out plus return, in microseconds
+    """
+    titles = [f"Title {random.randrange(size)}" for _ in range(lookups)]
+    start = time.perf_counter()
+    library.check_out_many(titles)
+    library.return_many(titles)
+    elapsed = time.perf_counter() - start
+    return elapsed / lookups * 1e6
+
+
+def main(sizes):
+    print("Microseconds per check-out + return")
+    print(f"{'books':>10}  {'single, printed':>16}  {'single, event sink':>19}  "
+          f"{'single, silent':>15}  {'batch':>8}")
+    with open(os.devnull, "w") as devnull:
+        def write_messages(messages):
+            devnull.write("\n".join(messages) + "\n")
+
+        for size in sizes:
+            # One library per column, each built with the reporter it measures
+            library = build_library(size, reporter=functools.partial(print, file=devnull))
+            printed = time_circulation(library, size)
+            with sink.redirected(write_messages):
+                library = build_library(size, reporter=sink.emit)
+                queued = time_circulation(library, size, finish=sink.flush)
+            library = build_library(size, reporter=None)
+            silent = time_circulation(library, size)
+            batch = time_batches(library, size)
+            print(f"{size:>10}  {printed:>16.2f}  {queued:>19.2f}  {silent:>15.2f}  {batch:>8.2f}")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES)
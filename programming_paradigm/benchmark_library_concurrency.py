@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Library Concurrency Benchmark
+
+Measures check-out plus return throughput of a library shared between
+threads, comparing one global lock with striped locks keyed by title.
+
+Usage:
+    python benchmark_library_concurrency.py [thread counts...]
+"""
+
+import random
+import sys
+import threading
+import time
+from library_management import Book, Library
+
+DEFAULT_THREADS = (1, 2, 4, 8, 16)
+BOOKS = 100_000
+OPERATIONS = 200_000  # Check-out plus return pairs, split across the threads
+
+
+def build_library(lock_stripes):
+    library = Library(reporter=None, lock_stripes=lock_stripes)
+    for i in range(BOOKS):
+        library.add_book(Book(f"Title {i}", f"Author {i % 1000}"))
+    return library
+
+
+def throughput(library, threads):
+    """
+    Run check-outs and returns from several threads.
+
+    Returns:
+        float: Check-out plus return pairs completed per second
+    """
+    per_thread = OPERATIONS // threads
+    workloads = [[f"Title {random.randrange(BOOKS)}" for _ in range(per_thread)]
+                 for _ in range(threads)]
+    start_barrier = threading.Barrier(threads + 1)
+
+    def worker(titles):
+        start_barrier.wait()
+        for title in titles:
+            library.check_out_book(title)
+            library.return_book(title)
+
+    workers = [threading.Thread(target=worker, args=(titles,)) for titles in workloads]
+    for thread in workers:
+        thread.start()
+    start_barrier.wait()
+    start = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    return per_thread * threads / (time.perf_counter() - start)
+
+
+def main(thread_counts):
+    print("Check-out + return pairs per second")
+    print(f"{'threads':>8}  {'1 lock':>10}  {'64 stripes':>10}")
+    libraries = (build_library(1), build_library(64))
+    for threads in thread_counts:
+        results = [throughput(library, threads) for library in libraries]
+        print(f"{threads:>8}  {results[0]:>10.0f}  {results[1]:>10.0f}")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or DEFAULT_THREADS)
@@ -0,0 +1,205 @@
+"""
+Columnar Book Storage
+
+This module implements a compact storage backend for very large catalogs.
+Instead of one object per book, a BookStore keeps each field in its own
+column: a UTF-8 string heap for titles, interned string ids for authors, a
+bit array for the checked out flags, and typed arrays for numeric fields.
+Book objects are created on demand as lightweight views over a row of the
+store, holding nothing but the store and the row index.
+"""
+
+from array import array
+from library_management import BaseBook
+
+_MISSING = -1  # Stored in numeric columns for books without that field
+
+
+class BookStore:
+    """
+    Column-oriented storage for a large number of books.
+
+    Authors are stored once in a shared string table and referenced by id,
+    so the many books by one author share a single string. Titles are mostly
+    unique, so they are packed back to back in a UTF-8 heap instead, which
+    avoids the overhead of one string object and table entry per title.
+    """
+
+    def __init__(self):
+        """Initialize an empty store."""
+        self._strings = []  # Author string table indexed by string id
+        self._string_ids = {}  # Reverse lookup from string to id
+        self._title_heap = bytearray()  # UTF-8 encoded titles, back to back
+        self._title_offsets = array("Q", [0])  # Start of each title in the heap
+        self._authors = array("I")  # Author string id per book
+        self._checked_out = bytearray()  # One bit per book
+        self._file_sizes = array("q")  # File size in KB, or -1
+        self._page_counts = array("q")  # Page count, or -1
+        self._listeners = ()  # Callbacks notified of changes to any row
+
+    def _intern(self, text):
+        """Return the string id for text, adding it to the table if needed."""
+        string_id = self._string_ids.get(text)
+        if string_id is None:
+            string_id = len(self._strings)
+            self._strings.append(text)
+            self._string_ids[text] = string_id
+        return string_id
+
+    def add(self, title, author, file_size=None, page_count=None):
+        """
+        Add a book to the store.
+
+        Args:
+            title (str): The title of the book
+            author (str): The author of the book
+            file_size (int): Size of the electronic edition in KB, if any
+            page_count (int): Number of printed pages, if any
+
+        Returns:
+            int: The index of the new book
+        """
+        index = len(self._authors)
+        self._title_heap += title.encode("utf-8")
+        self._title_offsets.append(len(self._title_heap))
+        self._authors.append(self._intern(author))
+        if index % 8 == 0:
+            self._checked_out.append(0)
+        self._file_sizes.append(_MISSING if file_size is None else file_size)
+        self._page_counts.append(_MISSING if page_count is None else page_count)
+        return index
+
+    def __len__(self):
+        """Return the number of books in the store."""
+        return len(self._authors)
+
+    def __getitem__(self, index):
+        """
+        Create a view of one book.
+
+        Args:
+            index (int): The index returned by add
+
+        Returns:
+            StoredBook: A Book view over the stored row
+        """
+        if not 0 <= index < len(self._authors):
+            raise IndexError("book index out of range")
+        return StoredBook(self, index)
+
+    def __iter__(self):
+        """Yield a view of every book in the order they were added."""
+        for index in range(len(self._authors)):
+            yield StoredBook(self, index)
+
+    def title(self, index):
+        """Return the title of the book at index."""
+        start, end = self._title_offsets[index], self._title_offsets[index + 1]
+        return self._title_heap[start:end].decode("utf-8")
+
+    def author(self, index):
+        """Return the author of the book at index."""
+        return self._strings[self._authors[index]]
+
+    def file_size(self, index):
+        """Return the file size of the book at index, or None."""
+        value = self._file_sizes[index]
+        return None if value == _MISSING else value
+
+    def page_count(self, index):
+        """Return the page count of the book at index, or None."""
+        value = self._page_counts[index]
+        return None if value == _MISSING else value
+
+    def add_listener(self, callback):
+        """
+        Register a callback to be notified when any book changes state.
+
+        Args:
+            callback (callable): Called with a view of the book after every
+                successful check-out or return. Adding a callback again has
+                no effect.
+        """
+        if callback not in self._listeners:
+            self._listeners += (callback,)
+
+    def is_checked_out(self, index):
+        """Return True if the book at index is checked out."""
+        return bool(self._checked_out[index >> 3] & (1 << (index & 7)))
+
+    def set_checked_out(self, index, checked_out):
+        """Set or clear the checked out flag of the book at index."""
+        if checked_out:
+            self._checked_out[index >> 3] |= 1 << (index & 7)
+        else:
+            self._checked_out[index >> 3] &= ~(1 << (index & 7)) & 0xFF
+
+
+class StoredBook(BaseBook):
+    """
+    A book backed by a row of a BookStore.
+
+    Views hold only a reference to the store and a row index. Every field is
+    read from and written to the store, so any number of views of the same
+    row agree with each other and compare equal.
+
+    Listeners are kept by the store rather than per row: a callback added
+    through any view is called for changes to every row of the store.
+    """
+
+    __slots__ = ("_store", "_index")
+
+    def __init__(self, store, index):
+        """
+        Initialize a view of one stored book.
+
+        Args:
+            store (BookStore): The store holding the book
+            index (int): The row of the book in the store
+        """
+        self._store = store
+        self._index = index
+
+    @property
+    def title(self):
+        """str: The title of the book."""
+        return self._store.title(self._index)
+
+    @property
+    def author(self):
+        """str: The author of the book."""
+        return self._store.author(self._index)
+
+    @property
+    def file_size(self):
+        """int: The file size in KB, or None for books without one."""
+        return self._store.file_size(self._index)
+
+    @property
+    def page_count(self):
+        """int: The page count, or None for books without one."""
+        return self._store.page_count(self._index)
+
+    @property
+    def _is_checked_out(self):
+        return self._store.is_checked_out(self._index)
+
+    @_is_checked_out.setter
+    def _is_checked_out(self, checked_out):
+        self._store.set_checked_out(self._index, checked_out)
+
+    @property
+    def _listeners(self):
+        return self._store._listeners
+
+    def add_listener(self, callback):
+        """Register a callback with the whole store; see BookStore.add_listener."""
+        self._store.add_listener(callback)
+
+    def __eq__(self, other):
+        if isinstance(other, StoredBook):
+            return self._store is other._store and self._index == other._index
+        return NotImplemented
+
+    def __hash__(self):
+        return hash((id(self._store), self._index))
@@ -0,0 +1,69 @@
+"""
+Buffered Output Module
+
+Helpers for streaming long listings, such as a library catalog, without one
+write per line, and for serving them a page at a time.
+
+write_lines joins lines into blocks of about buffer_size characters and
+writes each block with a single call, so listing a million books costs a few
+hundred writes instead of a million.
+
+Pages are addressed by continuation tokens: opaque strings that encode the
+position of the next item. They stay valid as long as the listed sequence
+only grows at the end.
+"""
+
+import sys
+
+DEFAULT_BUFFER_SIZE = 1 << 16
+
+
+def write_lines(lines, file=None, buffer_size=DEFAULT_BUFFER_SIZE):
+    """
+    Write lines, each followed by a newline, through a large buffer.
+
+    Args:
+        lines (iterable): Strings without trailing newlines
+        file: Any object with a write(str) method. Defaults to sys.stdout.
+        buffer_size (int): Approximate number of characters per write
+
+    Returns:
+        int: The number of lines written
+    """
+    if file is None:
+        file = sys.stdout
+    write = file.write
+    block = []
+    size = 0
+    count = 0
+    for line in lines:
+        block.append(line)
+        size += len(line) + 1
+        if size >= buffer_size:
+            write("\n".join(block) + "\n")
+            count += len(block)
+            block.clear()
+            size = 0
+    if block:
+        write("\n".join(block) + "\n")
+        count += len(block)
+    return count
+
+
+def decode_cursor(cursor):
+    """
+    Return the position encoded in a continuation token, or 0 for None.
+
+    Raises:
+        ValueError: If the token was not produced by encode_cursor
+    """
+    if cursor is None:
+        return 0
+    if not isinstance(cursor, str) or not cursor.isdigit():
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return int(cursor)
+
+
+def encode_cursor(position, total):
+    """Return the continuation token for position, or None past the end."""
+    return str(position) if position < total else None
@@ -0,0 +1,150 @@
+"""
+Streaming Division Pipeline
+
+This module runs safe division over files of numerator/denominator pairs
+far larger than memory. The input is split into chunks of whole lines,
+each chunk is divided with safe_divide_array, and the results are written
+to the output file in input order.
+
+Input lines hold two values separated by a comma or by whitespace. Output
+lines hold either the result or the name of the error for that row.
+
+With processes > 0, chunks are divided in a process pool. Workers map the
+input file themselves and read only their own byte range, so chunks are
+never copied between processes. Only a bounded window of chunks is in
+flight at once, so memory stays bounded however large the input is.
+"""
+
+import collections
+import concurrent.futures
+import mmap
+import os
+import sys
+import time
+from robust_division_calculator import (
+    DIVIDE_BY_ZERO, NON_NUMERIC, OK, UNEXPECTED, safe_divide_array,
+)
+
+ERROR_NAMES = {
+    OK: "ok",
+    DIVIDE_BY_ZERO: "divide_by_zero",
+    NON_NUMERIC: "non_numeric",
+    UNEXPECTED: "unexpected",
+}
+
+PipelineSummary = collections.namedtuple("PipelineSummary", "rows counts seconds rows_per_second")
+
+
+def divide_file(input_path, output_path, chunk_bytes=1 << 20, processes=0):
+    """
+    Divide every pair in an input file and write the results to an output file.
+
+    Args:
+        input_path (str): File of numerator/denominator pairs, one per line
+        output_path (str): File receiving one result or error name per line
+        chunk_bytes (int): Approximate size of each chunk of input
+        processes (int): Worker processes, or 0 to divide in this process
+
+    Returns:
+        PipelineSummary: Row count, rows per error class keyed by error name,
+        elapsed seconds and rows per second
+    """
+    start = time.perf_counter()
+    counts = collections.Counter({name: 0 for name in ERROR_NAMES.values()})
+    rows = 0
+
+    with open(output_path, "wb") as output:
+        for text, chunk_counts in _divided_chunks(input_path, chunk_bytes, processes):
+            output.write(text)
+            counts.update(chunk_counts)
+            rows += sum(chunk_counts.values())
+
+    seconds = time.perf_counter() - start
+    return PipelineSummary(rows, dict(counts), seconds, rows / seconds if seconds else 0.0)
+
+
+def _divided_chunks(input_path, chunk_bytes, processes):
+    """Yield (output bytes, error counts) for every chunk, in input order."""
+    ranges = _chunk_ranges(input_path, chunk_bytes)
+    if not processes:
+        for start, end in ranges:
+            yield _divide_range(input_path, start, end)
+        return
+
+    with concurrent.futures.ProcessPoolExecutor(processes) as pool:
+        # At most two chunks per worker are in flight; the reader waits for
+        # the oldest chunk to be written before submitting another
+        window = collections.deque()
+        for start, end in ranges:
+            window.append(pool.submit(_divide_range, input_path, start, end))
+            if len(window) >= processes * 2:
+                yield window.popleft().result()
+        while window:
+            yield window.popleft().result()
+
+
+def _chunk_ranges(input_path, chunk_bytes):
+    """Yield (start, end) byte ranges covering whole lines of a file."""
+    size = os.path.getsize(input_path)
+    if not size:
+        return
+    with open(input_path, "rb") as source, \
+            mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        start = 0
+        while start < size:
+            end = mapped.find(b"\n", min(start + chunk_bytes, size) - 1)
+            end = size if end == -1 else end + 1
+            yield start, end
+            start = end
+
+
+def _divide_range(input_path, start, end):
+    """
+    Divide the pairs in one byte range of the input file.
+
+    Returns:
+        tuple: (output bytes, Counter of rows per error name)
+    """
+    with open(input_path, "rb") as source, \
+            mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        text = mapped[start:end].decode("utf-8", errors="replace")
+    # Split on "\n" only: str.splitlines() also breaks at characters such as
+    # "\x0b" and "\u2028", which would give more output lines than input lines
+    lines = text.split("\n")
+    if not lines[-1]:
+        lines.pop()  # Nothing follows the final newline
+
+    numerators, denominators = [], []
+    for line in lines:
+        line = line.rstrip("\r")
+        fields = line.split(",") if "," in line else line.split()
+        if len(fields) == 2:
+            numerators.append(fields[0].strip())
+            denominators.append(fields[1].strip())
+        else:
+            numerators.append(line)  # Not a pair; float() rejects it as non-numeric
+            denominators.append("")
+
+    results, errors = safe_divide_array(numerators, denominators)
+    output = [repr(result) if error == OK else ERROR_NAMES[error]
+              for result, error in zip(results, errors)]
+    counts = collections.Counter(ERROR_NAMES[error] for error in errors)
+    text = "\n".join(output) + "\n" if output else ""
+    return text.encode("utf-8"), counts
+
+
+def main(argv):
+    """Divide a file from the command line and print a summary."""
+    if len(argv) not in (2, 3):
+        print("Usage: python division_pipeline.py INPUT OUTPUT [PROCESSES]")
+        return 2
+    processes = int(argv[2]) if len(argv) == 3 else os.cpu_count()
+    summary = divide_file(argv[0], argv[1], processes=processes)
+    print(f"Rows: {summary.rows} in {summary.seconds:.2f}s ({summary.rows_per_second:.0f} rows/s)")
+    for name, count in summary.counts.items():
+        print(f"  {name}: {count}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
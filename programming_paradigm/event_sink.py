@@ -0,0 +1,167 @@
+"""
+Event Sink Module
+
+This module provides EventSink, a buffered destination for informational
+messages such as "Deposit amount must be positive." that used to be printed
+straight from hot code paths.
+
+emit() only appends the message to an in-memory queue, so callers never wait
+on terminal or file I/O. A background thread writes queued messages in
+batches, either every flush_interval seconds or as soon as batch_size
+messages are waiting. Messages can be sampled or switched off entirely.
+
+The module-level sink is shared by the calculators, bank accounts and
+libraries in this repository and is flushed when the interpreter exits.
+Messages are written from the background thread, so redirecting
+sys.stdout does not capture them reliably; use sink.redirected(writer) or
+sink.silenced() instead.
+"""
+
+import atexit
+import collections
+import contextlib
+import random
+import sys
+import threading
+
+
+def write_lines(messages):
+    """Write a batch of messages to standard output, one per line."""
+    sys.stdout.write("\n".join(messages) + "\n")
+
+
+def discard(messages):
+    """Drop a batch of messages."""
+
+
+class EventSink:
+    """
+    A non-blocking, batching sink for messages.
+
+    Attributes:
+        enabled (bool): When False, emitted messages are discarded
+        sample_rate (float): Fraction of messages kept, from 0.0 to 1.0
+        dropped (int): Number of messages lost because the writer raised
+    """
+
+    def __init__(self, writer=write_lines, sample_rate=1.0, batch_size=1000, flush_interval=0.05):
+        """
+        Initialize a new event sink.
+
+        Args:
+            writer (callable): Called from the flushing thread with a list of
+                messages. Defaults to writing them to standard output.
+            sample_rate (float): Fraction of messages kept. Defaults to all.
+            batch_size (int): Number of waiting messages that triggers a
+                flush before flush_interval has passed
+            flush_interval (float): Seconds between background flushes
+        """
+        self.writer = writer
+        self.enabled = True
+        self.sample_rate = sample_rate
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._pending = collections.deque()  # Appends and pops are thread safe
+        self._wake = threading.Event()
+        self._flush_lock = threading.Lock()  # Keeps batches in order
+        self._start_lock = threading.Lock()
+        self._thread = None
+        self._closed = False
+        self.dropped = 0
+        self._failure_reported = False
+
+    def emit(self, message):
+        """
+        Queue a message for writing without waiting for any I/O.
+
+        Args:
+            message (str): The message to write
+        """
+        if not self.enabled:
+            return
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            return
+        self._pending.append(message)
+        if self._thread is None:
+            self._start()
+        if len(self._pending) >= self.batch_size and not self._wake.is_set():
+            self._wake.set()
+
+    def flush(self):
+        """Write every queued message now, in the calling thread."""
+        with self._flush_lock:
+            self._write_pending()
+
+    @contextlib.contextmanager
+    def redirected(self, writer):
+        """
+        Send messages to another writer until the block exits.
+
+        Messages emitted before the block go to the previous writer and
+        messages emitted inside it go to the new one, even if the
+        background thread flushes in between.
+
+        Args:
+            writer (callable): Called with each list of messages
+        """
+        with self._flush_lock:
+            self._write_pending()
+            previous, self.writer = self.writer, writer
+        try:
+            yield self
+        finally:
+            with self._flush_lock:
+                self._write_pending()
+                self.writer = previous
+
+    def silenced(self):
+        """Discard messages until the block exits; emitting still costs the same."""
+        return self.redirected(discard)
+
+    def close(self):
+        """Stop the flushing thread and write any remaining messages."""
+        self._closed = True
+        thread = self._thread
+        if thread is not None:
+            self._wake.set()
+            thread.join()
+        self.flush()
+
+    def _write_pending(self):
+        """Write queued messages. Called with the flush lock held."""
+        pending = self._pending
+        batch = [pending.popleft() for _ in range(len(pending))]
+        if batch:
+            try:
+                self.writer(batch)
+            except BaseException:
+                self.dropped += len(batch)
+                raise
+
+    def _start(self):
+        with self._start_lock:
+            if self._thread is None and not self._closed:
+                thread = threading.Thread(target=self._run, name="event-sink", daemon=True)
+                thread.start()
+                self._thread = thread
+
+    def _run(self):
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as error:
+                # Keep flushing: an uncaught error would end this thread and
+                # leave every later message queued forever. The failed batch
+                # is lost; report only the first failure so that a writer
+                # that keeps failing does not flood standard error.
+                if not self._failure_reported:
+                    self._failure_reported = True
+                    message = f"Event sink writer failed, dropping messages: {error!r}\n"
+                    with contextlib.suppress(Exception):
+                        sys.stderr.write(message)
+
+
+sink = EventSink()
+atexit.register(sink.close)
@@ -0,0 +1,142 @@
+"""
+Ledger Engine
+
+This module applies large batches of deposits and withdrawals across many
+accounts at once. Balances are kept as integer cents in one contiguous
+array instead of one BankAccount object per account, and a whole batch is
+applied in a single pass that returns which rows were accepted.
+
+Each row follows the same rules as BankAccount:
+    - a deposit is accepted if its amount is positive
+    - a withdrawal is accepted if its amount is positive and no larger
+      than the balance at that point in the batch
+    - a row with any other kind, or for an account id outside the ledger,
+      is rejected
+    - a deposit that would take a balance past the 64-bit limit is rejected
+
+Rows are applied in order, so several rows for one account see each
+other's effects exactly as sequential BankAccount calls would.
+"""
+
+from array import array
+from bank_account import DEPOSIT, WITHDRAW
+
+_MAX_CENTS = 2 ** 63 - 1  # Largest balance an array("q") can hold
+
+
+def to_cents(amount):
+    """
+    Convert an amount in dollars to integer cents.
+
+    Args:
+        amount (float): Amount in dollars
+
+    Returns:
+        int: The amount rounded to the nearest cent
+    """
+    return round(amount * 100)
+
+
+class Ledger:
+    """
+    Balances of many accounts stored as integer cents.
+
+    Accounts are identified by their position in the ledger.
+    """
+
+    def __init__(self, balances=()):
+        """
+        Initialize a ledger.
+
+        Args:
+            balances (iterable): Opening balance in dollars of each account
+        """
+        self._balances = array("q", map(to_cents, balances))
+
+    @classmethod
+    def from_accounts(cls, accounts):
+        """
+        Create a ledger holding the balances of BankAccount objects.
+
+        Args:
+            accounts (iterable): BankAccount instances
+
+        Returns:
+            Ledger: A ledger with one account per BankAccount, in order
+        """
+        return cls(account.account_balance for account in accounts)
+
+    def add_account(self, initial_balance=0):
+        """
+        Open a new account.
+
+        Args:
+            initial_balance (float): Opening balance in dollars
+
+        Returns:
+            int: The id of the new account
+        """
+        self._balances.append(to_cents(initial_balance))
+        return len(self._balances) - 1
+
+    def __len__(self):
+        """Return the number of accounts."""
+        return len(self._balances)
+
+    def balance(self, account):
+        """
+        Get the balance of an account.
+
+        Args:
+            account (int): The account id
+
+        Returns:
+            float: The balance in dollars
+        """
+        return self._balances[account] / 100
+
+    def balance_cents(self, account):
+        """Return the balance of an account in integer cents."""
+        return self._balances[account]
+
+    def apply(self, accounts, kinds, amounts):
+        """
+        Apply a batch of transactions in order.
+
+        Args:
+            accounts (sequence): Account id of each row
+            kinds (sequence): DEPOSIT or WITHDRAW for each row
+            amounts (sequence): Amount of each row in integer cents
+
+        Rows with an unknown kind or an account id outside the ledger,
+        including negative ids, are rejected without changing any balance.
+
+        Returns:
+            bytearray: 1 for each accepted row, 0 for each rejected row
+
+        Raises:
+            ValueError: If the columns have different lengths
+            TypeError: If an amount is not an integer
+            OverflowError: If an amount does not fit in 64 bits
+        """
+        if not len(accounts) == len(kinds) == len(amounts):
+            raise ValueError("accounts, kinds and amounts must have the same length")
+        # Check every amount before applying any row, so a bad amount
+        # cannot leave the batch half applied
+        amounts = array("q", amounts)
+        balances = self._balances
+        count = len(balances)
+        accepted = bytearray(len(accounts))
+        for row, account, kind, amount in zip(range(len(accepted)), accounts, kinds, amounts):
+            if amount <= 0 or not 0 <= account < count:
+                continue
+            if kind == DEPOSIT:
+                if balances[account] > _MAX_CENTS - amount:
+                    continue
+                balances[account] += amount
+            elif kind == WITHDRAW and amount <= balances[account]:
+                balances[account] -= amount
+            else:
+                continue
+            accepted[row] = 1
+        return accepted
@@ -0,0 +1,295 @@
+"""
+Library Loan Analytics
+
+This module records the circulation history of a Library and answers
+questions about it without scanning the full event log:
+
+    - every check-out and return, stored in compact typed arrays
+    - the most popular titles, kept as a bounded table of candidates that
+      is updated on every check-out, so top-N queries never scan all titles
+    - the average loan duration per title, kept as running sums
+
+Popularity counts are exact by default. For catalogs where a counter per
+title is too much, pass sketch_width to count loans in a fixed-size
+count-min sketch instead. Counts may then be over-estimated by a small
+margin, and nothing is kept per title except for the current top
+candidates: loan durations are only tracked while a title is a candidate,
+and the event log refers to titles by the strings the books already hold.
+"""
+
+import bisect
+import hashlib
+import heapq
+import time
+from array import array
+from library_management import BOOK_CHECKED_OUT, BOOK_RETURNED
+
+# Event kinds stored in the time series
+CHECK_OUT = 0
+RETURN = 1
+
+
+class CountMinSketch:
+    """
+    Approximate counts for an unbounded set of keys in fixed memory.
+
+    Each key increments one counter in each of `depth` rows. Its estimate is
+    the smallest of those counters, which is never below the true count.
+    """
+
+    def __init__(self, width=2048, depth=4):
+        """
+        Initialize an empty sketch.
+
+        Args:
+            width (int): Counters per row; larger widths reduce over-estimates
+            depth (int): Number of rows; more rows reduce the chance of error
+        """
+        self.width = width
+        self.depth = depth
+        self._rows = [array("Q", bytes(8 * width)) for _ in range(depth)]
+
+    def _columns(self, key):
+        """Return the counter used by key in each row."""
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=4 * self.depth).digest()
+        return [int.from_bytes(digest[4 * row:4 * row + 4], "little") % self.width
+                for row in range(self.depth)]
+
+    def add(self, key, count=1):
+        """
+        Count occurrences of a key.
+
+        Returns:
+            int: The new estimate for the key
+        """
+        estimate = None
+        for row, column in zip(self._rows, self._columns(key)):
+            row[column] += count
+            if estimate is None or row[column] < estimate:
+                estimate = row[column]
+        return estimate
+
+    def estimate(self, key):
+        """Return the estimated count of a key."""
+        return min(row[column] for row, column in zip(self._rows, self._columns(key)))
+
+
+class LoanAnalytics:
+    """
+    Circulation history and statistics for one library.
+
+    Attach an instance to a library with attach(); from then on every
+    check-out and return, through the library or directly on a book, is
+    recorded.
+    """
+
+    def __init__(self, clock=time.time, sketch_width=None, top_capacity=100):
+        """
+        Initialize empty analytics.
+
+        Args:
+            clock (callable): Returns the current time in seconds
+            sketch_width (int): Width of a count-min sketch used for
+                popularity counts, or None to count every title exactly
+            top_capacity (int): Number of candidates tracked for top-N
+                queries; top_titles(n) answers from them for n up to this
+        """
+        self._clock = clock
+        self._title_ids = {}  # Title to dense integer id, exact mode only
+        self._titles = []  # Title by id, exact mode only
+        # Time series of events, one entry per event in each column
+        self._times = array("d")
+        # Title ids, or the titles themselves in sketch mode
+        self._event_titles = array("I") if sketch_width is None else []
+        self._kinds = bytearray()
+        # Per-title statistics indexed by title id, exact mode only
+        self._loan_counts = array("Q")
+        self._loan_seconds = array("d")
+        self._returns = array("Q")
+        self._open_loans = {}  # Book to check-out time
+        self._sketch = None if sketch_width is None else CountMinSketch(sketch_width)
+        self._top_capacity = top_capacity
+        # Top-N candidates: title id (title in sketch mode) to loan count
+        self._top = {}
+        self._top_floor = 0  # Never above the smallest count in a full _top
+        self._candidate_loans = {}  # Candidate title to [loan seconds, returns], sketch mode only
+
+    def attach(self, library):
+        """
+        Start recording the circulation of a library.
+
+        Args:
+            library (Library): The library to observe
+        """
+        library.add_observer(self._observe)
+
+    def _observe(self, event, book):
+        """Record a check-out or return reported by the library."""
+        if event == BOOK_CHECKED_OUT:
+            self.record_check_out(book)
+        elif event == BOOK_RETURNED:
+            self.record_return(book)
+
+    def _title_id(self, title):
+        """Return the id of a title, allocating one on first use."""
+        title_id = self._title_ids.get(title)
+        if title_id is None:
+            title_id = len(self._titles)
+            self._title_ids[title] = title_id
+            self._titles.append(title)
+            self._loan_counts.append(0)
+            self._loan_seconds.append(0.0)
+            self._returns.append(0)
+        return title_id
+
+    def _append_event(self, kind, title, now):
+        self._times.append(now)
+        self._event_titles.append(title)
+        self._kinds.append(kind)
+
+    def record_check_out(self, book):
+        """
+        Record that a book was checked out.
+
+        Args:
+            book (Book): The book checked out
+        """
+        now = self._clock()
+        self._open_loans[book] = now
+        if self._sketch is None:
+            title_id = self._title_id(book.title)
+            self._append_event(CHECK_OUT, title_id, now)
+            self._loan_counts[title_id] += 1
+            self._track_candidate(title_id, self._loan_counts[title_id])
+        else:
+            self._append_event(CHECK_OUT, book.title, now)
+            self._track_candidate(book.title, self._sketch.add(book.title))
+
+    def record_return(self, book):
+        """
+        Record that a book was returned.
+
+        Args:
+            book (Book): The book returned
+        """
+        now = self._clock()
+        started = self._open_loans.pop(book, None)
+        if self._sketch is None:
+            title_id = self._title_id(book.title)
+            self._append_event(RETURN, title_id, now)
+            if started is not None:
+                self._loan_seconds[title_id] += now - started
+                self._returns[title_id] += 1
+        else:
+            self._append_event(RETURN, book.title, now)
+            loans = self._candidate_loans.get(book.title)
+            if started is not None and loans is not None:
+                loans[0] += now - started
+                loans[1] += 1
+
+    def _track_candidate(self, key, count):
+        """
+        Keep the titles with the highest counts as top-N candidates.
+
+        Counts only grow, so a title outside a full table can only enter by
+        passing the smallest candidate count. _top_floor caches a lower
+        bound of that count, so most check-outs skip the search for it.
+        """
+        top = self._top
+        if key not in top:
+            if len(top) >= self._top_capacity:
+                if count <= self._top_floor:
+                    return
+                smallest = min(top, key=top.get)
+                self._top_floor = top[smallest]
+                if count <= self._top_floor:
+                    return
+                del top[smallest]
+                self._candidate_loans.pop(smallest, None)
+            if self._sketch is not None:
+                self._candidate_loans[key] = [0.0, 0]
+        top[key] = count
+
+    def top_titles(self, n=10):
+        """
+        Get the most frequently checked out titles.
+
+        Answered from the candidate table. With exact counts, asking for
+        more titles than top_capacity scans the counters of every title.
+
+        Args:
+            n (int): Number of titles to return
+
+        Returns:
+            list: (title, check-out count) tuples, most popular first
+        """
+        if self._sketch is not None:
+            return heapq.nlargest(n, self._top.items(), key=lambda item: item[1])
+        counts = self._loan_counts
+        if n > self._top_capacity:
+            ids = heapq.nlargest(n, range(len(counts)), key=counts.__getitem__)
+        else:
+            ids = heapq.nlargest(n, self._top, key=self._top.__getitem__)
+        return [(self._titles[i], counts[i]) for i in ids if counts[i]]
+
+    def loan_count(self, title):
+        """
+        Get the number of times a title was checked out.
+
+        Returns:
+            int: The count, estimated when a sketch is used
+        """
+        if self._sketch is not None:
+            return self._sketch.estimate(title)
+        title_id = self._title_ids.get(title)
+        return 0 if title_id is None else self._loan_counts[title_id]
+
+    def average_loan_duration(self, title):
+        """
+        Get the average time between check-out and return of a title.
+
+        Only completed loans recorded by these analytics are counted. When a
+        sketch is used, only loans returned while the title was a top
+        candidate are counted.
+
+        Args:
+            title (str): The title to report on
+
+        Returns:
+            float: Average loan duration in seconds, or None if no loan of
+            the title has been completed
+        """
+        if self._sketch is not None:
+            seconds, returns = self._candidate_loans.get(title, (0.0, 0))
+        else:
+            title_id = self._title_ids.get(title)
+            if title_id is None:
+                return None
+            seconds, returns = self._loan_seconds[title_id], self._returns[title_id]
+        return seconds / returns if returns else None
+
+    def events_between(self, start, end):
+        """
+        Iterate over the events recorded in a time range.
+
+        The clock is expected to be non-decreasing, so the range is found by
+        binary search rather than a scan of the whole log.
+
+        Args:
+            start (float): Inclusive start time
+            end (float): Exclusive end time
+
+        Yields:
+            tuple: (time, title, kind) with kind CHECK_OUT or RETURN
+        """
+        first = bisect.bisect_left(self._times, start)
+        last = bisect.bisect_left(self._times, end)
+        names = self._titles if self._sketch is None else None  # Title by id
+        for position in range(first, last):
+            title = self._event_titles[position]
+            yield (self._times[position], title if names is None else names[title],
+                   self._kinds[position])
+
+    def __len__(self):
+        """Return the number of events recorded."""
+        return len(self._times)
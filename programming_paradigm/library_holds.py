@@ -0,0 +1,218 @@
+"""
+Library Hold Queues
+
+This module implements per-title FIFO hold queues for the library
+management system. A patron who finds every copy of a title checked out
+places a hold, and the next returned copy is handed straight to the oldest
+waiting hold instead of going back on the shelf.
+
+Placing and fulfilling a hold is O(1). Cancelled holds are removed lazily,
+which keeps cancellation O(1), and expiry uses a heap ordered by deadline,
+so expiring holds costs O(log n) each.
+"""
+
+import collections
+import heapq
+import itertools
+import threading
+import time
+
+# Hold states
+WAITING = "waiting"
+FULFILLED = "fulfilled"
+CANCELLED = "cancelled"
+EXPIRED = "expired"
+
+
+class Hold:
+    """
+    A patron's place in the queue for one title.
+
+    When a copy becomes available the hold is fulfilled: `book` is set, the
+    callback, if any, is called with the hold, and the asyncio future, if
+    any, receives the book.
+    """
+
+    __slots__ = ("title", "patron", "callback", "future", "expires_at", "state", "book")
+
+    def __init__(self, title, patron=None, callback=None, future=None, expires_at=None):
+        """
+        Initialize a waiting hold.
+
+        Args:
+            title (str): The title the patron is waiting for
+            patron: Any value identifying the patron
+            callback (callable): Called with the hold once it is fulfilled
+            future (asyncio.Future): Resolved with the book once fulfilled
+            expires_at (float): time.monotonic() deadline, or None to wait forever
+        """
+        self.title = title
+        self.patron = patron
+        self.callback = callback
+        self.future = future
+        self.expires_at = expires_at
+        self.state = WAITING
+        self.book = None
+
+    def fulfil(self, book):
+        """
+        Hand a checked out copy to the patron and notify them.
+
+        Args:
+            book (Book): The copy, already checked out for the patron
+        """
+        self.state = FULFILLED
+        self.book = book
+        if self.future is not None:
+            self.future.get_loop().call_soon_threadsafe(_set_result, self.future, book)
+        if self.callback is not None:
+            self.callback(self)
+
+    def _close(self, state):
+        """Leave the queue without a book."""
+        self.state = state
+        if self.future is not None:
+            self.future.get_loop().call_soon_threadsafe(_cancel, self.future)
+
+
+def _set_result(future, book):
+    if not future.done():
+        future.set_result(book)
+
+
+def _cancel(future):
+    if not future.done():
+        future.cancel()
+
+
+class HoldQueues:
+    """
+    FIFO hold queues for every title in a library.
+
+    All methods are safe to call from several threads.
+    """
+
+    def __init__(self, clock=time.monotonic):
+        """
+        Initialize empty hold queues.
+
+        Args:
+            clock (callable): Returns the current time in seconds
+        """
+        self._clock = clock
+        self._queues = {}  # Title to deque of holds, oldest first
+        self._waiting = collections.Counter()  # Waiting holds per title
+        self._deadlines = []  # Heap of (expires_at, sequence, hold)
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+
+    def place(self, title, patron=None, callback=None, future=None, ttl=None):
+        """
+        Join the end of the queue for a title.
+
+        Args:
+            title (str): The title to wait for
+            patron: Any value identifying the patron
+            callback (callable): Called with the hold once it is fulfilled
+            future (asyncio.Future): Resolved with the book once fulfilled
+            ttl (float): Seconds before the hold expires, or None
+
+        Returns:
+            Hold: The new hold
+        """
+        expires_at = None if ttl is None else self._clock() + ttl
+        hold = Hold(title, patron, callback, future, expires_at)
+        with self._lock:
+            queue = self._queues.get(title)
+            if queue is None:
+                queue = self._queues[title] = collections.deque()
+            queue.append(hold)
+            self._waiting[title] += 1
+            if expires_at is not None:
+                heapq.heappush(self._deadlines, (expires_at, next(self._sequence), hold))
+        return hold
+
+    def cancel(self, hold):
+        """
+        Remove a waiting hold from its queue.
+
+        Args:
+            hold (Hold): The hold to cancel
+
+        Returns:
+            bool: True if the hold was waiting, False if it had already left the queue
+        """
+        with self._lock:
+            if hold.state != WAITING:
+                return False
+            self._leave(hold)
+        hold._close(CANCELLED)
+        return True
+
+    def waiting(self, title):
+        """
+        Count the holds waiting for a title.
+
+        Args:
+            title (str): The title to count holds for
+
+        Returns:
+            int: Number of waiting holds
+        """
+        return self._waiting.get(title, 0)
+
+    def next_hold(self, title):
+        """
+        Remove the oldest waiting hold for a title from its queue.
+
+        The caller checks out a copy for the hold and then fulfils it.
+
+        Args:
+            title (str): The title a copy has become available for
+
+        Returns:
+            Hold: The oldest waiting hold, or None if nobody is waiting
+        """
+        self.expire()
+        with self._lock:
+            if not self._waiting.get(title):
+                return None
+            queue = self._queues[title]
+            hold = queue.popleft()
+            while hold.state != WAITING:  # Skip holds cancelled or expired in place
+                hold = queue.popleft()
+            self._leave(hold)
+        return hold
+
+    def expire(self):
+        """
+        Expire every waiting hold whose deadline has passed.
+
+        Returns:
+            int: Number of holds expired
+        """
+        now = self._clock()
+        expired = []
+        with self._lock:
+            while self._deadlines and self._deadlines[0][0] <= now:
+                hold = heapq.heappop(self._deadlines)[2]
+                if hold.state == WAITING:
+                    self._leave(hold)
+                    expired.append(hold)
+        for hold in expired:
+            hold._close(EXPIRED)
+        return len(expired)
+
+    def _leave(self, hold):
+        """
+        Update the counters for a hold leaving its queue.
+
+        Cancelled and expired holds stay in their deque and are skipped when
+        they reach the front. Once no waiting hold remains the deque is dropped.
+        """
+        hold.state = None  # No longer waiting; the caller sets the final state
+        title = hold.title
+        self._waiting[title] -= 1
+        if not self._waiting[title]:
+            del self._waiting[title]
+            del self._queues[title]
@@ -0,0 +1,167 @@
+"""
+Library Catalog Import
+
+This module streams a catalog export into a Library. Rows are read in
+fixed-size chunks, so memory stays bounded however large the file is.
+Rows repeating a (title, author) pair already in the library or earlier in
+the file are skipped. Each chunk is added with Library.add_books, which
+defers building the search indexes until the import is finished.
+
+Supported formats:
+    CSV   - a header row naming "title" and "author" columns
+    JSONL - one JSON object per line with "title" and "author" keys
+
+With processes > 0, chunks of lines are parsed in a process pool while
+the main process adds the parsed books to the library. Parallel parsing
+reads the file line by line, so CSV fields must not contain line breaks.
+"""
+
+import collections
+import concurrent.futures
+import csv
+import itertools
+import json
+import os
+from library_management import Book
+
+ImportSummary = collections.namedtuple("ImportSummary", "added duplicates invalid")
+
+
+def import_catalog(library, path, file_format=None, chunk_size=10_000, processes=0):
+    """
+    Import every book in a catalog file into a library.
+
+    Args:
+        library (Library): The library to add books to
+        path (str): Path of the CSV or JSONL file
+        file_format (str): "csv" or "jsonl". Defaults to the file extension.
+        chunk_size (int): Number of rows read and added at a time
+        processes (int): Worker processes parsing chunks in parallel, or 0
+            to parse in this process
+
+    Returns:
+        ImportSummary: Counts of books added, duplicate rows skipped and
+        rows without a title or author
+    """
+    file_format = file_format or _detect_format(path)
+    seen = {(book.title, book.author) for book in library.iter_books()}
+    added = duplicates = invalid = 0
+
+    for rows in _parsed_chunks(path, file_format, chunk_size, processes):
+        books = []
+        for row in rows:
+            if row is None:
+                invalid += 1
+            elif row in seen:
+                duplicates += 1
+            else:
+                seen.add(row)
+                books.append(Book(*row))
+        added += library.add_books(books)
+
+    return ImportSummary(added, duplicates, invalid)
+
+
+def _detect_format(path):
+    """Guess the catalog format from the file extension."""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".csv":
+        return "csv"
+    if extension in (".jsonl", ".ndjson"):
+        return "jsonl"
+    raise ValueError(f"Cannot tell the catalog format of {path!r}; pass file_format")
+
+
+def _parsed_chunks(path, file_format, chunk_size, processes):
+    """
+    Yield lists of parsed rows, one list per chunk, in file order.
+
+    Each row is a (title, author) tuple, or None if the row is invalid.
+    """
+    with open(path, newline="", encoding="utf-8") as catalog:
+        if file_format == "csv":
+            header = next(csv.reader(catalog), None)
+            if header is None:
+                return
+            columns = _csv_columns(header)
+            parse, args = _parse_csv_lines, (columns,)
+        elif file_format == "jsonl":
+            parse, args = _parse_jsonl_lines, ()
+        else:
+            raise ValueError(f"Unknown catalog format {file_format!r}")
+
+        if file_format == "csv" and not processes:
+            # The csv module handles fields spanning several lines
+            reader = csv.reader(catalog)
+            while True:
+                chunk = list(itertools.islice(reader, chunk_size))
+                if not chunk:
+                    return
+                yield [_csv_row(fields, columns) for fields in chunk]
+
+        line_chunks = _chunks(catalog, chunk_size)
+        if not processes:
+            for lines in line_chunks:
+                yield parse(lines, *args)
+            return
+
+        with concurrent.futures.ProcessPoolExecutor(processes) as pool:
+            # Keep a bounded window of chunks in flight so a fast reader
+            # cannot queue the whole file in memory
+            window = collections.deque()
+            for lines in line_chunks:
+                window.append(pool.submit(parse, lines, *args))
+                if len(window) >= processes * 2:
+                    yield window.popleft().result()
+            while window:
+                yield window.popleft().result()
+
+
+def _chunks(lines, chunk_size):
+    """Yield lists of up to chunk_size lines."""
+    while True:
+        chunk = list(itertools.islice(lines, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _csv_columns(header):
+    """Return the positions of the title and author columns in a CSV header."""
+    names = [name.strip().lower() for name in header]
+    try:
+        return names.index("title"), names.index("author")
+    except ValueError:
+        raise ValueError("CSV catalog header must name 'title' and 'author' columns") from None
+
+
+def _csv_row(fields, columns):
+    """Return the (title, author) of a CSV row, or None if either is missing."""
+    title_column, author_column = columns
+    if len(fields) <= max(columns):
+        return None
+    title, author = fields[title_column].strip(), fields[author_column].strip()
+    if not title or not author:
+        return None
+    return title, author
+
+
+def _parse_csv_lines(lines, columns):
+    """Parse a chunk of CSV lines into (title, author) rows."""
+    return [_csv_row(fields, columns) for fields in csv.reader(lines)]
+
+
+def _parse_jsonl_lines(lines):
+    """Parse a chunk of JSONL lines into (title, author) rows."""
+    rows = []
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+            title, author = record["title"].strip(), record["author"].strip()
+        except (ValueError, KeyError, TypeError, AttributeError):
+            rows.append(None)
+            continue
+        rows.append((title, author) if title and author else None)
+    return rows
@@ -0,0 +1,214 @@
+"""
+Library Catalog Indexes
+
+This module implements the search indexes used by the library management
+system. Each index is updated incrementally as books are added, and every
+query returns a lazy iterator, so callers paging through a large result only
+pay for the books they actually consume.
+"""
+
+import bisect
+import re
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(text):
+    """
+    Split text into lower-case keyword tokens.
+
+    Args:
+        text (str): The text to split
+
+    Returns:
+        list: The tokens found in the text, in order
+    """
+    return _TOKEN_PATTERN.findall(text.casefold())
+
+
+class AuthorIndex:
+    """
+    Exact author lookup.
+
+    Maps each author to the books they wrote, in the order they were added.
+    """
+
+    def __init__(self):
+        """Initialize an empty author index."""
+        self._authors = {}
+
+    def add(self, book):
+        """
+        Add a book to the index.
+
+        Args:
+            book (Book): The book to index under its author
+        """
+        books = self._authors.get(book.author)
+        if books is None:
+            self._authors[book.author] = [book]
+        else:
+            books.append(book)
+
+    def find(self, author):
+        """
+        Find the books written by an author.
+
+        Args:
+            author (str): The exact author name
+
+        Returns:
+            iterator: The author's books in the order they were added
+        """
+        return iter(self._authors.get(author, ()))
+
+
+class TitlePrefixIndex:
+    """
+    Case-insensitive title prefix search over a sorted array.
+
+    New books are buffered and merged into the sorted array on the next
+    query, so a burst of additions costs a single merge instead of one
+    insertion per book. Since queries write to the index, adds and queries
+    must not overlap; a Library shared between threads runs both under its
+    catalog lock.
+    """
+
+    def __init__(self):
+        """Initialize an empty title prefix index."""
+        self._entries = []  # Sorted (folded title, sequence, book) tuples
+        self._pending = []  # Entries added since the last merge
+        self._sequence = 0  # Tie-breaker keeping equal titles in insertion order
+
+    def add(self, book):
+        """
+        Add a book to the index.
+
+        Args:
+            book (Book): The book to index under its title
+        """
+        self._pending.append((book.title.casefold(), self._sequence, book))
+        self._sequence += 1
+
+    def _merge(self):
+        """Merge pending entries into a new sorted array."""
+        if self._pending:
+            self._pending.sort()
+            # Both runs are already sorted, so this sort is a linear merge.
+            # The array is replaced rather than sorted in place, so results
+            # still being iterated keep a consistent view.
+            entries = self._entries + self._pending
+            entries.sort()
+            self._entries = entries
+            self._pending = []
+
+    def find(self, prefix):
+        """
+        Find the books whose title starts with a prefix, ignoring case.
+
+        Args:
+            prefix (str): The beginning of the title
+
+        Returns:
+            iterator: Matching books ordered by title
+        """
+        self._merge()
+        return self._iter_prefix(self._entries, prefix.casefold())
+
+    @staticmethod
+    def _iter_prefix(entries, prefix):
+        """Yield books from a sorted array for a folded prefix."""
+        position = bisect.bisect_left(entries, (prefix,))
+        while position < len(entries):
+            title, _, book = entries[position]
+            if not title.startswith(prefix):
+                return
+            yield book
+            position += 1
+
+
+class InvertedIndex:
+    """
+    Keyword search over the title and author of every book.
+
+    Each token maps to an insertion-ordered set of the books containing it.
+    A query matches the books that contain all of its tokens.
+    """
+
+    def __init__(self):
+        """Initialize an empty inverted index."""
+        self._postings = {}
+
+    def add(self, book):
+        """
+        Add a book to the index.
+
+        Args:
+            book (Book): The book to index under its title and author tokens
+        """
+        for token in tokenize(f"{book.title} {book.author}"):
+            books = self._postings.get(token)
+            if books is None:
+                self._postings[token] = {book: None}
+            else:
+                books[book] = None
+
+    def find(self, query):
+        """
+        Find the books matching every keyword in a query.
+
+        Args:
+            query (str): Space separated keywords
+
+        Returns:
+            iterator: Matching books in the order they were added
+        """
+        postings = [self._postings.get(token, {}) for token in set(tokenize(query))]
+        if not postings:
+            return iter(())
+        postings.sort(key=len)
+        return self._iter_intersection(postings[0], postings[1:])
+
+    @staticmethod
+    def _iter_intersection(smallest, others):
+        """Yield books from the smallest posting set found in all the others."""
+        for book in smallest:
+            if all(book in books for books in others):
+                yield book
+
+
+class CatalogIndex:
+    """
+    The set of search indexes kept by a library.
+
+    Updates every index in one call, so the library only needs to know about
+    this class.
+    """
+
+    def __init__(self):
+        """Initialize empty author, title prefix and keyword indexes."""
+        self.authors = AuthorIndex()
+        self.title_prefixes = TitlePrefixIndex()
+        self.keywords = InvertedIndex()
+
+    def add(self, book):
+        """
+        Add a book to every index.
+
+        Args:
+            book (Book): The book to index
+        """
+        self.authors.add(book)
+        self.title_prefixes.add(book)
+        self.keywords.add(book)
+
+    def add_many(self, books):
+        """
+        Add a batch of books to every index.
+
+        Args:
+            books (list): The books to index, in the order they were added
+        """
+        for add in (self.authors.add, self.title_prefixes.add, self.keywords.add):
+            for book in books:
+                add(book)
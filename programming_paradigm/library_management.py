@@ -3,29 +3,72 @@ Library Management System
 
 This module implements a basic library management system using OOP principles.
 It includes classes for managing books and library operations such as checking
-books in and out, and tracking availability.
+books in and out, tracking availability, and searching the catalog.
 """
 
+import contextlib
+import itertools
+import threading
+from buffered_output import decode_cursor, encode_cursor, write_lines
+from event_sink import sink
+from library_holds import HoldQueues
+from library_index import CatalogIndex
 
-class Book:
+# Result codes returned by the batch check-out and return methods
+SUCCESS = 0  # The book was checked out or returned
+WRONG_STATE = 1  # Already checked out (check-out) or not checked out (return)
+NOT_FOUND = 2  # No book with that title is in the library
+
+# Events passed to library observers
+BOOK_ADDED = "add"
+BOOK_CHECKED_OUT = "check_out"
+BOOK_RETURNED = "return"
+
+_NO_LOCK = contextlib.nullcontext()  # Stands in for a lock when locking is off
+
+# Below one available book in this many, listing looks for each one with
+# bytearray.find instead of filtering the whole catalog with compress
+_SPARSE_AVAILABLE = 32
+
+_CHECK_OUT_MESSAGES = {
+    SUCCESS: "'{}' has been checked out.",
+    WRONG_STATE: "'{}' is already checked out.",
+    NOT_FOUND: "Book '{}' not found in the library.",
+}
+
+_RETURN_MESSAGES = {
+    SUCCESS: "'{}' has been returned.",
+    WRONG_STATE: "'{}' was not checked out.",
+    NOT_FOUND: "Book '{}' not found in the library.",
+}
+
+
+class BaseBook:
     """
-    Represents a book in the library system.
+    Behaviour shared by every kind of book in the library system.
     
-    This class encapsulates book information and tracks whether the book
-    is currently checked out or available.
+    Tracks whether a book is checked out and notifies listeners when that
+    changes. Subclasses supply title, author, _is_checked_out and
+    _listeners, as slots or as properties. This class declares no slots, so
+    subclasses that compute those fields do not carry unused ones.
     """
     
-    def __init__(self, title, author):
+    __slots__ = ()
+    
+    def add_listener(self, callback):
         """
-        Initialize a new book.
+        Register a callback to be notified when the book changes state.
         
         Args:
-            title (str): The title of the book
-            author (str): The author of the book
+            callback (callable): Called with the book after every successful
+                check-out or return
         """
-        self.title = title
-        self.author = author
-        self._is_checked_out = False  # Private attribute to track availability
+        self._listeners += (callback,)
+    
+    def _notify(self):
+        """Notify every registered listener of a change in availability."""
+        for callback in self._listeners:
+            callback(self)
     
     def check_out(self):
         """
@@ -36,6 +79,7 @@ class Book:
         """
         if not self._is_checked_out:
             self._is_checked_out = True
+            self._notify()
             return True
         return False
     
@@ -48,6 +92,7 @@ class Book:
         """
         if self._is_checked_out:
             self._is_checked_out = False
+            self._notify()
             return True
         return False
     
@@ -70,103 +115,523 @@ class Book:
         return f"{self.title} by {self.author}"
 
 
+class Book(BaseBook):
+    """
+    Represents a book in the library system.
+    
+    This class encapsulates book information and tracks whether the book
+    is currently checked out or available. Instances use __slots__ so that
+    large catalogs do not pay for a per-book __dict__.
+    """
+    
+    __slots__ = ("title", "author", "_is_checked_out", "_listeners")
+    
+    def __init__(self, title, author):
+        """
+        Initialize a new book.
+        
+        Args:
+            title (str): The title of the book
+            author (str): The author of the book
+        """
+        self.title = title
+        self.author = author
+        self._is_checked_out = False  # Private attribute to track availability
+        self._listeners = ()  # Callbacks notified when availability changes
+
+
 class Library:
     """
     Represents a library that manages a collection of books.
     
     This class provides functionality to add books, check them out,
-    return them, and list available books.
+    return them, and list available books. The set of available books is
+    kept up to date as books change state, so availability queries never
+    have to walk the whole catalog.
+    
+    A library created with lock_stripes can be shared between threads.
+    Check-outs and returns lock one of a fixed set of stripes chosen by
+    title, so calls for different titles rarely contend. Books changed
+    directly, rather than through the library, are not guarded.
     """
     
-    def __init__(self):
-        """Initialize a new library with an empty collection of books."""
+    def __init__(self, reporter=sink.emit, lock_stripes=0):
+        """
+        Initialize a new library with an empty collection of books.
+        
+        Args:
+            reporter (callable): Called with a message describing the outcome
+                of each single check-out, return or rejected book. Pass None
+                to switch messages off. Defaults to the shared event sink.
+            lock_stripes (int): Number of locks guarding check-outs and
+                returns. 0, the default, disables locking for single
+                threaded use.
+        """
+        self._reporter = reporter
+        self._locks = tuple(threading.Lock() for _ in range(lock_stripes))
+        self._catalog_lock = threading.Lock() if lock_stripes else _NO_LOCK
         self._books = []  # Private list to store Book instances
+        self._titles = {}  # Private index mapping a title to its copies
+        self._positions = {}  # Position of every book in _books
+        self._available = set()  # Books currently available
+        self._available_flags = bytearray()  # 1 at the position of each available book
+        self._index = CatalogIndex()  # Author, title prefix and keyword indexes
+        self._unindexed = []  # Books added in bulk and not yet indexed
+        self._observers = ()  # Callbacks notified of every catalog change
+        self._holds = HoldQueues()  # Patrons waiting for checked out titles
+    
+    def add_observer(self, callback):
+        """
+        Register a callback to be notified of every change to the catalog.
+        
+        Args:
+            callback (callable): Called as callback(event, book) after a book
+                is added (BOOK_ADDED), checked out (BOOK_CHECKED_OUT) or
+                returned (BOOK_RETURNED)
+        """
+        self._observers += (callback,)
     
     def add_book(self, book):
         """
         Add a new book to the library collection.
         
+        A book already in the library is not added again; add another Book
+        object for each further copy of a title.
+        
         Args:
-            book (Book): A Book instance to add to the library
+            book (BaseBook): A Book, or another BaseBook such as a view of a
+                BookStore row, to add to the library
         """
-        if isinstance(book, Book):
-            self._books.append(book)
-        else:
-            print("Error: Only Book instances can be added to the library.")
+        if not isinstance(book, BaseBook):
+            self._report("Error: Only Book instances can be added to the library.")
+            return
+        with self._catalog_lock:
+            duplicate = book in self._positions
+            if not duplicate:
+                self._positions[book] = len(self._books)
+                self._books.append(book)
+                copies = self._titles.get(book.title)
+                if copies is None:
+                    self._titles[book.title] = [book]
+                else:
+                    copies.append(book)
+                if book.is_available():
+                    self._available.add(book)
+                    self._available_flags.append(1)
+                else:
+                    self._available_flags.append(0)
+                if self._unindexed:
+                    self._unindexed.append(book)  # Keep the bulk order
+                else:
+                    self._index.add(book)
+                book.add_listener(self._book_state_changed)
+                for callback in self._observers:
+                    callback(BOOK_ADDED, book)
+        if duplicate:
+            self._report(f"Error: '{book.title}' is already in the library.")
+    
+    def add_books(self, books):
+        """
+        Add a batch of books to the library collection.
+        
+        Books added in bulk are indexed for searching on the next search,
+        so a large import builds the search indexes once rather than per book.
+        Books already in the library, or repeated in the batch, are skipped.
+        
+        Args:
+            books (iterable): Book instances to add to the library
+            
+        Returns:
+            int: Number of books added
+        """
+        books = list(books)
+        valid = [book for book in books if isinstance(book, BaseBook)]
+        if len(valid) < len(books):
+            self._report("Error: Only Book instances can be added to the library.")
+        with self._catalog_lock:
+            added = []
+            position = len(self._books)
+            positions = self._positions
+            titles = self._titles
+            available = self._available
+            flags = self._available_flags
+            listener = self._book_state_changed
+            for book in valid:
+                if book in positions:
+                    continue
+                positions[book] = position
+                position += 1
+                added.append(book)
+                copies = titles.get(book.title)
+                if copies is None:
+                    titles[book.title] = [book]
+                else:
+                    copies.append(book)
+                if book.is_available():
+                    available.add(book)
+                    flags.append(1)
+                else:
+                    flags.append(0)
+                book.add_listener(listener)
+            self._books += added
+            self._unindexed += added
+            for callback in self._observers:
+                for book in added:
+                    callback(BOOK_ADDED, book)
+        if len(added) < len(valid):
+            self._report("Error: Books already in the library were not added again.")
+        return len(added)
     
     def check_out_book(self, title):
         """
         Check out a book by title.
         
+        The title is looked up in a hash index, so the cost does not grow
+        with the size of the catalog. When the library holds several copies
+        of the same title, any available copy is checked out.
+        
         Args:
             title (str): The title of the book to check out
             
         Returns:
             bool: True if book was found and checked out successfully, False otherwise
         """
-        for book in self._books:
-            if book.title == title:
-                if book.check_out():
-                    print(f"'{title}' has been checked out.")
-                    return True
-                else:
-                    print(f"'{title}' is already checked out.")
-                    return False
-        
-        print(f"Book '{title}' not found in the library.")
-        return False
+        result = self._check_out(title)
+        if self._reporter is not None:
+            self._reporter(_CHECK_OUT_MESSAGES[result].format(title))
+        return result == SUCCESS
     
     def return_book(self, title):
         """
         Return a book by title.
         
+        When the library holds several copies of the same title, any
+        checked out copy is returned.
+        
         Args:
             title (str): The title of the book to return
             
         Returns:
             bool: True if book was found and returned successfully, False otherwise
         """
-        for book in self._books:
-            if book.title == title:
+        result = self._return(title)
+        if self._reporter is not None:
+            self._reporter(_RETURN_MESSAGES[result].format(title))
+        return result == SUCCESS
+    
+    def check_out_many(self, titles):
+        """
+        Check out a batch of books by title without reporting messages.
+        
+        Args:
+            titles (iterable): The titles of the books to check out
+            
+        Returns:
+            bytearray: One result code per title: SUCCESS, WRONG_STATE if every
+            copy is already checked out, or NOT_FOUND
+        """
+        return bytearray(map(self._check_out, titles))
+    
+    def return_many(self, titles):
+        """
+        Return a batch of books by title without reporting messages.
+        
+        Args:
+            titles (iterable): The titles of the books to return
+            
+        Returns:
+            bytearray: One result code per title: SUCCESS, WRONG_STATE if no
+            copy is checked out, or NOT_FOUND
+        """
+        return bytearray(map(self._return, titles))
+    
+    def _check_out(self, title):
+        """
+        Check out any available copy of a title.
+        
+        Returns:
+            int: SUCCESS, WRONG_STATE or NOT_FOUND
+        """
+        copies = self._titles.get(title)
+        if copies is None:
+            return NOT_FOUND
+        with self._lock_for(title):
+            for book in copies:
+                if book.check_out():
+                    return SUCCESS
+        return WRONG_STATE
+    
+    def _return(self, title):
+        """
+        Return any checked out copy of a title.
+        
+        If patrons are waiting for the title, the copy is checked out again
+        for the oldest hold and handed to that patron instead of going back
+        on the shelf.
+        
+        Returns:
+            int: SUCCESS, WRONG_STATE or NOT_FOUND
+        """
+        copies = self._titles.get(title)
+        if copies is None:
+            return NOT_FOUND
+        hold = None
+        with self._lock_for(title):
+            for book in copies:
                 if book.return_book():
-                    print(f"'{title}' has been returned.")
-                    return True
-                else:
-                    print(f"'{title}' was not checked out.")
-                    return False
+                    if self._holds.waiting(title):
+                        hold = self._holds.next_hold(title)
+                        if hold is not None:
+                            book.check_out()
+                    break
+            else:
+                return WRONG_STATE
+        if hold is not None:
+            # Notify outside the lock so callbacks may use the library
+            hold.fulfil(book)
+        return SUCCESS
+    
+    def place_hold(self, title, patron=None, callback=None, future=None, ttl=None):
+        """
+        Wait for a copy of a title to become available.
         
-        print(f"Book '{title}' not found in the library.")
-        return False
+        Holds are served first in, first out. When a copy is returned it is
+        checked out for the oldest waiting hold straight away, then the
+        callback is called with the hold and the future receives the book.
+        If a copy is available already, the hold is fulfilled immediately.
+        
+        Args:
+            title (str): The title to wait for
+            patron: Any value identifying the patron
+            callback (callable): Called with the Hold once it is fulfilled
+            future (asyncio.Future): Resolved with the book once fulfilled,
+                or cancelled if the hold is cancelled or expires
+            ttl (float): Seconds before the hold expires, or None to wait forever
+            
+        Returns:
+            Hold: The new hold, or None if the title is not in the library
+        """
+        copies = self._titles.get(title)
+        if copies is None:
+            self._report(f"Book '{title}' not found in the library.")
+            return None
+        hold = self._holds.place(title, patron, callback, future, ttl)
+        waiting = None
+        with self._lock_for(title):
+            for book in copies:
+                if book.check_out():
+                    waiting = self._holds.next_hold(title)
+                    if waiting is None:
+                        book.return_book()
+                    break
+        if waiting is not None:
+            waiting.fulfil(book)
+        return hold
     
-    def list_available_books(self):
+    def cancel_hold(self, hold):
         """
-        Display all available books in the library.
+        Cancel a hold that is still waiting.
         
-        Prints each available book's title and author to the console.
-        If no books are available, prints an appropriate message.
+        Args:
+            hold (Hold): A hold returned by place_hold
+            
+        Returns:
+            bool: True if the hold was cancelled, False if it had already
+            been fulfilled, cancelled or expired
+        """
+        return self._holds.cancel(hold)
+    
+    def get_hold_count(self, title):
         """
-        available_books = [book for book in self._books if book.is_available()]
+        Get the number of patrons waiting for a title.
         
-        if available_books:
-            for book in available_books:
-                print(book)
+        Args:
+            title (str): The title to count holds for
+            
+        Returns:
+            int: Number of waiting holds
+        """
+        self._holds.expire()
+        return self._holds.waiting(title)
+    
+    def _lock_for(self, title):
+        """Return the lock stripe guarding a title, or a no-op when locking is off."""
+        if self._locks:
+            return self._locks[hash(title) % len(self._locks)]
+        return _NO_LOCK
+    
+    def _report(self, message):
+        """Pass a message to the reporter unless reporting is switched off."""
+        if self._reporter is not None:
+            self._reporter(message)
+    
+    def find_by_author(self, author):
+        """
+        Find the books written by an author.
+        
+        Args:
+            author (str): The exact author name
+            
+        Returns:
+            iterator: The author's books in the order they were added
+        """
+        return self._search_index().authors.find(author)
+    
+    def search_title_prefix(self, prefix):
+        """
+        Find the books whose title starts with a prefix, ignoring case.
+        
+        Args:
+            prefix (str): The beginning of the title
+            
+        Returns:
+            iterator: Matching books ordered by title
+        """
+        index = self._search_index()
+        with self._catalog_lock:  # The query merges books added since the last one
+            return index.title_prefixes.find(prefix)
+    
+    def search(self, query):
+        """
+        Find the books whose title and author contain every keyword in a query.
+        
+        Args:
+            query (str): Space separated keywords, matched ignoring case
+            
+        Returns:
+            iterator: Matching books in the order they were added
+        """
+        return self._search_index().keywords.find(query)
+    
+    def _search_index(self):
+        """Return the search indexes after indexing any books added in bulk."""
+        if self._unindexed:
+            with self._catalog_lock:
+                self._index.add_many(self._unindexed)
+                self._unindexed = []
+        return self._index
+    
+    def _book_state_changed(self, book):
+        """
+        Keep the available set in step with a book that changed state,
+        then notify the library observers.
+        
+        Called by the book itself, so the set stays correct even when a
+        book is checked out or returned directly instead of through the library.
+        
+        Args:
+            book (Book): The book whose availability changed
+        """
+        position = self._positions.get(book)
+        if position is None:
+            return  # Not in this library, such as another row of a BookStore
+        if book.is_available():
+            self._available.add(book)
+            self._available_flags[position] = 1
+            event = BOOK_RETURNED
+        else:
+            self._available.discard(book)
+            self._available_flags[position] = 0
+            event = BOOK_CHECKED_OUT
+        for callback in self._observers:
+            callback(event, book)
+    
+    def iter_books(self):
+        """
+        Iterate over every book in the order they were added.
+        
+        Returns:
+            iterator: The books in the library
+        """
+        return iter(self._books)
+    
+    def list_available_books(self, file=None):
+        """
+        Display all available books in the library.
+        
+        Writes each available book's title and author, in catalog order,
+        through a large buffer. If no books are available, writes an
+        appropriate message.
+        
+        Args:
+            file: Object with a write(str) method. Defaults to sys.stdout.
+        """
+        if self._available:
+            write_lines(map(str, self._iter_available()), file)
         else:
-            print("No books are currently available.")
+            write_lines(("No books are currently available.",), file)
     
-    def list_all_books(self):
+    def _iter_available(self):
+        """Return an iterator over the available books in catalog order."""
+        books = self._books
+        flags = self._available_flags
+        if len(self._available) * _SPARSE_AVAILABLE < len(books):
+            return self._iter_sparse(books, flags)
+        return itertools.compress(books, flags)
+    
+    @staticmethod
+    def _iter_sparse(books, flags):
+        """Yield the books whose flag is set, skipping runs of zeros in C."""
+        position = flags.find(1)
+        while position != -1:
+            yield books[position]
+            position = flags.find(1, position + 1)
+    
+    def list_all_books(self, file=None):
         """
         Display all books in the library with their status.
         
-        Shows both available and checked out books with their current status.
+        Shows both available and checked out books with their current status,
+        written through a large buffer rather than one write per book.
+        
+        Args:
+            file: Object with a write(str) method. Defaults to sys.stdout.
         """
         if not self._books:
-            print("The library has no books.")
+            write_lines(("The library has no books.",), file)
             return
         
-        print("All books in the library:")
-        for book in self._books:
-            status = "Available" if book.is_available() else "Checked Out"
-            print(f"{book} - {status}")
+        write_lines(itertools.chain(("All books in the library:",), self.book_lines()), file)
+    
+    def book_lines(self, start=0, stop=None):
+        """
+        Generate the listing line of each book in the order they were added.
+        
+        Args:
+            start (int): Position of the first book
+            stop (int): Position after the last book. Defaults to the end.
+        
+        Yields:
+            str: The book followed by " - Available" or " - Checked Out"
+        """
+        books = self._books
+        stop = len(books) if stop is None else min(stop, len(books))
+        for position in range(start, stop):
+            book = books[position]
+            yield f"{book} - {'Available' if book.is_available() else 'Checked Out'}"
+    
+    def book_page(self, cursor=None, limit=100):
+        """
+        Return one page of the listing of all books.
+        
+        Books are only ever appended, so a continuation token stays valid
+        while more books are added.
+        
+        Args:
+            cursor (str): Token returned with the previous page, or None for
+                the first page
+            limit (int): Maximum number of lines on the page
+        
+        Returns:
+            tuple: (list of lines, token for the next page or None after
+            the last page)
+        
+        Raises:
+            ValueError: If the cursor is not a valid token
+        """
+        start = decode_cursor(cursor)
+        stop = start + limit
+        return list(self.book_lines(start, stop)), encode_cursor(stop, len(self._books))
     
     def get_book_count(self):
         """
@@ -184,4 +649,4 @@ class Library:
         Returns:
             int: Number of available books
         """
-        return sum(1 for book in self._books if book.is_available())
+        return len(self._available)
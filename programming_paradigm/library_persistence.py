@@ -0,0 +1,282 @@
+"""
+Library Persistence
+
+This module makes a Library durable across restarts. Every book added,
+checked out or returned is appended to a binary log, and the whole catalog
+can be written to a compact snapshot. Opening a journal loads the latest
+snapshot through mmap and replays only the log written since then. The
+recovered books are added to the library in one batch, so its search
+indexes are built on the first search rather than book by book.
+
+Files kept in the journal directory:
+    library.snapshot  - the catalog at the time of the last snapshot
+    library.log       - every change made after that snapshot
+
+Log record layout (little-endian):
+    op (1 byte) | payload length (4 bytes) | payload | CRC32 (4 bytes)
+
+A record whose length or checksum does not match, such as one cut short by
+a crash, marks the end of the log. It is discarded on recovery together
+with anything after it.
+"""
+
+import mmap
+import os
+import struct
+import zlib
+from event_sink import sink
+from library_management import (
+    BOOK_ADDED, BOOK_CHECKED_OUT, BOOK_RETURNED, Book, Library,
+)
+
+SNAPSHOT_NAME = "library.snapshot"
+LOG_NAME = "library.log"
+
+_LOG_MAGIC = b"LIBLOG02"
+_SNAPSHOT_MAGIC = b"LIBSNAP1"
+
+# Both files start with their magic followed by a generation number. Writing
+# a snapshot starts a new generation, so a log left over from an older
+# generation is known to be covered by the snapshot and is not replayed.
+_FILE_HEADER = struct.Struct("<8sQ")
+_SNAPSHOT_COUNTS = struct.Struct("<Q")  # Number of books in the snapshot
+_SNAPSHOT_RECORD = struct.Struct("<QIIB")  # Heap offset, title and author lengths, flag
+_RECORD_HEADER = struct.Struct("<BI")
+_RECORD_CHECKSUM = struct.Struct("<I")
+_ADD_HEADER = struct.Struct("<IB")  # Title length, checked-out flag of an added book
+_POSITION = struct.Struct("<Q")
+
+# Log operation codes
+_OP_ADD = 1
+_OP_CHECK_OUT = 2
+_OP_RETURN = 3
+
+_EVENT_OPS = {BOOK_CHECKED_OUT: _OP_CHECK_OUT, BOOK_RETURNED: _OP_RETURN}
+
+
+class LibraryJournal:
+    """
+    Append-only log and snapshots for one Library.
+
+    Log writes are buffered and flushed to disk with fsync once every
+    `group_size` records, so a burst of changes shares one fsync. Call
+    sync() to make every change so far durable immediately.
+    """
+
+    def __init__(self, directory, group_size=256):
+        """
+        Initialize a journal stored in a directory.
+
+        Args:
+            directory (str): Directory holding the snapshot and log files
+            group_size (int): Number of log records written per fsync
+        """
+        self.directory = directory
+        self.group_size = group_size
+        self._library = None
+        self._positions = {}  # Catalog position of every book
+        self._added = 0  # Books added so far, in step with the catalog
+        self._generation = 0
+        self._log = None
+        self._unsynced = 0
+
+    @property
+    def snapshot_path(self):
+        """str: Path of the snapshot file."""
+        return os.path.join(self.directory, SNAPSHOT_NAME)
+
+    @property
+    def log_path(self):
+        """str: Path of the log file."""
+        return os.path.join(self.directory, LOG_NAME)
+
+    def open(self, reporter=sink.emit):
+        """
+        Recover the library from disk and start recording its changes.
+
+        Args:
+            reporter (callable): Reporter passed to the new Library
+
+        Returns:
+            Library: The recovered library
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        books = []
+        self._load_snapshot(books)
+        end = self._replay_log(books)
+        library = Library(reporter=reporter)
+        library.add_books(books)
+        self._positions = {book: position for position, book in enumerate(books)}
+        self._added = len(books)
+
+        if end is None:
+            self._start_log()
+        else:
+            self._log = open(self.log_path, "r+b")
+            self._log.truncate(end)
+            self._log.seek(end)
+
+        self._library = library
+        library.add_observer(self._record)
+        return library
+
+    def snapshot(self):
+        """
+        Write the whole catalog to a new snapshot and start an empty log.
+
+        The snapshot is written to a temporary file and renamed into place,
+        so a crash never leaves a partially written snapshot behind.
+        """
+        self.sync()
+        self._generation += 1
+        books = list(self._library.iter_books())
+        heap = bytearray()
+        table = bytearray()
+        for book in books:
+            title = book.title.encode("utf-8")
+            author = book.author.encode("utf-8")
+            table += _SNAPSHOT_RECORD.pack(len(heap), len(title), len(author),
+                                           not book.is_available())
+            heap += title
+            heap += author
+
+        temporary = self.snapshot_path + ".tmp"
+        with open(temporary, "wb") as snapshot:
+            snapshot.write(_FILE_HEADER.pack(_SNAPSHOT_MAGIC, self._generation))
+            snapshot.write(_SNAPSHOT_COUNTS.pack(len(books)))
+            snapshot.write(table)
+            snapshot.write(heap)
+            snapshot.flush()
+            os.fsync(snapshot.fileno())
+        os.replace(temporary, self.snapshot_path)
+        self._start_log()
+
+    def sync(self):
+        """Flush buffered log records and fsync them to disk."""
+        if self._log is not None:
+            self._log.flush()
+            os.fsync(self._log.fileno())
+        self._unsynced = 0
+
+    def close(self):
+        """Sync the log and close it."""
+        if self._log is not None:
+            self.sync()
+            self._log.close()
+            self._log = None
+
+    def _start_log(self):
+        """Replace the log with an empty one for the current generation."""
+        if self._log is not None:
+            self._log.close()
+        temporary = self.log_path + ".tmp"
+        with open(temporary, "wb") as log:
+            log.write(_FILE_HEADER.pack(_LOG_MAGIC, self._generation))
+            log.flush()
+            os.fsync(log.fileno())
+        os.replace(temporary, self.log_path)
+        self._log = open(self.log_path, "r+b")
+        self._log.seek(0, os.SEEK_END)
+        self._unsynced = 0
+
+    def _record(self, event, book):
+        """Append a log record for a library event."""
+        if event == BOOK_ADDED:
+            self._positions[book] = self._added
+            self._added += 1
+            title = book.title.encode("utf-8")
+            header = _ADD_HEADER.pack(len(title), not book.is_available())
+            payload = header + title + book.author.encode("utf-8")
+            self._append(_OP_ADD, payload)
+        else:
+            self._append(_EVENT_OPS[event], _POSITION.pack(self._positions[book]))
+
+    def _append(self, op, payload):
+        """Write one checksummed record, syncing once a group is complete."""
+        header = _RECORD_HEADER.pack(op, len(payload))
+        checksum = zlib.crc32(payload, zlib.crc32(header))
+        self._log.write(header + payload + _RECORD_CHECKSUM.pack(checksum))
+        self._unsynced += 1
+        if self._unsynced >= self.group_size:
+            self.sync()
+
+    def _load_snapshot(self, books):
+        """Append every book in the snapshot, if there is one, to books."""
+        try:
+            snapshot = open(self.snapshot_path, "rb")
+        except FileNotFoundError:
+            return
+        with snapshot, mmap.mmap(snapshot.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            try:
+                magic, self._generation = _FILE_HEADER.unpack_from(view)
+                if magic != _SNAPSHOT_MAGIC:
+                    raise ValueError(f"{self.snapshot_path} is not a library snapshot")
+                (count,) = _SNAPSHOT_COUNTS.unpack_from(view, _FILE_HEADER.size)
+                table_start = _FILE_HEADER.size + _SNAPSHOT_COUNTS.size
+                heap_start = table_start + count * _SNAPSHOT_RECORD.size
+                table = view[table_start:heap_start]
+                heap = mapped[heap_start:]  # Slicing bytes beats slicing the view
+                for start, title_length, author_length, checked_out in \
+                        _SNAPSHOT_RECORD.iter_unpack(table):
+                    middle = start + title_length
+                    book = Book(heap[start:middle].decode("utf-8"),
+                                heap[middle:middle + author_length].decode("utf-8"))
+                    if checked_out:
+                        book.check_out()
+                    books.append(book)
+                table.release()
+            finally:
+                view.release()
+
+    def _replay_log(self, books):
+        """
+        Apply the log records written since the snapshot to books.
+
+        Returns:
+            int: Offset just past the last complete record, or None if there
+            is no log for the current generation
+        """
+        try:
+            with open(self.log_path, "rb") as log:
+                data = log.read()
+        except FileNotFoundError:
+            return None
+        if len(data) < _FILE_HEADER.size:
+            return None
+        magic, generation = _FILE_HEADER.unpack_from(data)
+        if magic != _LOG_MAGIC:
+            raise ValueError(f"{self.log_path} is not a library log")
+        if generation != self._generation:
+            return None
+
+        offset = _FILE_HEADER.size
+        while offset + _RECORD_HEADER.size <= len(data):
+            op, length = _RECORD_HEADER.unpack_from(data, offset)
+            payload_start = offset + _RECORD_HEADER.size
+            end = payload_start + length + _RECORD_CHECKSUM.size
+            if end > len(data):
+                break
+            payload = data[payload_start:payload_start + length]
+            (checksum,) = _RECORD_CHECKSUM.unpack_from(data, end - _RECORD_CHECKSUM.size)
+            if checksum != zlib.crc32(payload, zlib.crc32(data[offset:payload_start])):
+                break
+            self._apply(op, payload, books)
+            offset = end
+        return offset
+
+    @staticmethod
+    def _apply(op, payload, books):
+        """Apply one log record to the recovered books."""
+        if op == _OP_ADD:
+            title_length, checked_out = _ADD_HEADER.unpack_from(payload)
+            title_end = _ADD_HEADER.size + title_length
+            book = Book(payload[_ADD_HEADER.size:title_end].decode("utf-8"),
+                        payload[title_end:].decode("utf-8"))
+            if checked_out:
+                book.check_out()
+            books.append(book)
+        elif op == _OP_CHECK_OUT:
+            books[_POSITION.unpack(payload)[0]].check_out()
+        elif op == _OP_RETURN:
+            books[_POSITION.unpack(payload)[0]].return_book()
@@ -3,8 +3,23 @@ Robust Division Calculator Module
 
 This module provides a safe division function that handles common errors
 such as division by zero and non-numeric inputs gracefully.
+
+For bulk data, safe_divide_array divides whole columns at once and reports
+errors as codes in a separate array instead of as formatted messages.
 """
 
+import operator
+from array import array
+
+# Error codes reported by safe_divide_array
+OK = 0
+DIVIDE_BY_ZERO = 1
+NON_NUMERIC = 2
+UNEXPECTED = 3
+
+_NAN = float("nan")
+
+
 def safe_divide(numerator, denominator):
     """
     Safely divide two numbers with comprehensive error handling.
@@ -19,23 +34,101 @@ def safe_divide(numerator, denominator):
     Returns:
         str: A message indicating the result of the division or describing the error
     """
+    # The same rules as safe_divide_array, applied to one pair directly:
+    # building columns for a single row costs several times the division
     try:
-        # Attempt to convert inputs to floats
         num = float(numerator)
         den = float(denominator)
-        
-        # Attempt division
-        result = num / den
-        return f"The result of the division is {result}"
-        
-    except ZeroDivisionError:
-        # Handle division by zero
-        return "Error: Cannot divide by zero."
-    
     except ValueError:
-        # Handle non-numeric inputs
         return "Error: Please enter numeric values only."
+    except Exception as error:
+        return f"An unexpected error occurred: {error}"
     
-    except Exception as e:
-        # Handle any other unexpected errors
-        return f"An unexpected error occurred: {e}"
+    if den == 0.0:
+        return "Error: Cannot divide by zero."
+    return f"The result of the division is {num / den}"
+
+
+def safe_divide_array(numerators, denominators):
+    """
+    Divide two columns of values element by element.
+
+    Values may be numbers or numeric strings. Rows that cannot be divided get
+    NaN in the results and an error code in the error array.
+
+    Args:
+        numerators (sequence): The dividends
+        denominators (sequence): The divisors, one per dividend
+
+    Returns:
+        tuple: (array of float results, bytearray of error codes), where each
+        code is OK, DIVIDE_BY_ZERO, NON_NUMERIC or UNEXPECTED
+    """
+    return _divide_columns(numerators, denominators)
+
+
+def _divide_columns(numerators, denominators, exceptions=None):
+    """
+    Divide two columns, optionally recording the exception behind each UNEXPECTED row.
+
+    Args:
+        numerators (sequence): The dividends
+        denominators (sequence): The divisors
+        exceptions (dict): If given, filled with row -> exception for UNEXPECTED rows
+
+    Returns:
+        tuple: (array of float results, bytearray of error codes)
+    """
+    if len(numerators) != len(denominators):
+        raise ValueError("numerators and denominators must have the same length")
+    errors = bytearray(len(numerators))
+    nums = _parse_column(numerators, errors, exceptions)
+    dens = _parse_column(denominators, errors, exceptions)
+
+    if 0.0 not in dens and not any(errors):
+        # Fast path: every row is valid, so divide the whole column in C
+        return array("d", map(operator.truediv, nums, dens)), errors
+
+    results = array("d", bytes(8 * len(nums)))
+    for row, (num, den) in enumerate(zip(nums, dens)):
+        if errors[row]:
+            results[row] = _NAN
+        elif den == 0.0:
+            errors[row] = DIVIDE_BY_ZERO
+            results[row] = _NAN
+        else:
+            results[row] = num / den
+    return results, errors
+
+
+def _parse_column(values, errors, exceptions):
+    """
+    Convert a column of values to floats.
+
+    The whole column is converted in one call, directly when the first value
+    is a number and through float() when it is a string. Only a column
+    containing a bad value is converted row by row, marking the error code of
+    each failing row that has no earlier error.
+    """
+    if not len(values):
+        return array("d")
+    try:
+        if isinstance(values[0], str):
+            return array("d", map(float, values))
+        return array("d", values)
+    except Exception:
+        pass  # Some row is bad; find out which below
+
+    column = array("d", bytes(8 * len(values)))
+    for row, value in enumerate(values):
+        try:
+            column[row] = float(value)
+        except ValueError:
+            if not errors[row]:
+                errors[row] = NON_NUMERIC
+        except Exception as error:
+            if not errors[row]:
+                errors[row] = UNEXPECTED
+                if exceptions is not None:
+                    exceptions[row] = error
+    return column
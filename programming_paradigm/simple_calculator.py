@@ -0,0 +1,28 @@
+"""
+Simple Calculator Module
+
+This module provides a SimpleCalculator class with the four basic
+arithmetic operations. Division by zero returns None instead of raising.
+"""
+
+
+class SimpleCalculator:
+    """A simple calculator class that supports basic arithmetic operations."""
+
+    def add(self, a, b):
+        """Return the addition of a and b."""
+        return a + b
+
+    def subtract(self, a, b):
+        """Return the subtraction of b from a."""
+        return a - b
+
+    def multiply(self, a, b):
+        """Return the multiplication of a and b."""
+        return a * b
+
+    def divide(self, a, b):
+        """Return the division of a by b. Returns None if b is zero."""
+        if b == 0:
+            return None
+        return a / b
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the Asynchronous Account Service
+
+This module contains unit tests for AccountService, covering per-request
+results, ordering within an account and group commit of batches.
+"""
+
+import asyncio
+import unittest
+from account_service import AccountService
+from bank_account import BankAccount
+
+
+class TestAccountService(unittest.TestCase):
+    """Test cases for the AccountService class."""
+
+    def setUp(self):
+        """Set up two accounts and a service that counts commits."""
+        self.accounts = {"a": BankAccount(100), "b": BankAccount(0)}
+        self.commits = []
+        self.service = AccountService(self.accounts, max_batch=8, max_wait=0.01,
+                                      commit=self.commits.append)
+
+    def run_requests(self, *requests):
+        """Run requests concurrently and return their results in order."""
+        async def run():
+            return await asyncio.gather(*requests)
+        return asyncio.run(run())
+
+    def test_results_per_request(self):
+        """Test that every caller receives its own result."""
+        results = self.run_requests(
+            self.service.withdraw("a", 60),
+            self.service.withdraw("a", 60),
+            self.service.deposit("a", -1),
+            self.service.deposit("b", 5),
+            self.service.balance("a"),
+            self.service.balance("b"),
+        )
+        self.assertEqual(results, [True, False, False, True, 40, 5])
+
+    def test_group_commit(self):
+        """Test that concurrent requests are committed in batches."""
+        results = self.run_requests(*[self.service.deposit("a", 1) for _ in range(20)])
+        self.assertEqual(results, [True] * 20)
+        self.assertEqual(self.accounts["a"].account_balance, 120)
+        self.assertEqual(len(self.commits), 3)
+
+    def test_unknown_account(self):
+        """Test that requests for unknown accounts raise KeyError."""
+        with self.assertRaises(KeyError):
+            self.run_requests(self.service.balance("z"))
+
+    def test_failed_batch(self):
+        """Test that an error while applying a batch reaches its callers."""
+        def fail(account):
+            raise OSError("disk full")
+
+        self.service.commit = fail
+        with self.assertRaises(OSError):
+            self.run_requests(self.service.deposit("a", 1))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for BankAccount
+
+This module contains unit tests for BankAccount and transfer, including a
+stress test checking that money is conserved under heavy contention, and
+for the event-sourced EventSourcedAccount.
+"""
+
+import os
+import random
+import sys
+import tempfile
+import threading
+import unittest
+from bank_account import BankAccount, transfer
+from bank_journal import EventSourcedAccount
+
+
+class TestBankAccount(unittest.TestCase):
+    """Test cases for the BankAccount class and transfer function."""
+
+    def test_transfer(self):
+        """Test transfers with sufficient and insufficient funds."""
+        source, destination = BankAccount(100), BankAccount(5)
+        self.assertTrue(transfer(source, destination, 60))
+        self.assertFalse(transfer(source, destination, 60))
+        self.assertFalse(transfer(source, destination, 0))
+        self.assertEqual(source.account_balance, 40)
+        self.assertEqual(destination.account_balance, 65)
+
+    def test_transfer_to_same_account(self):
+        """Test that a transfer to the same account leaves the balance unchanged."""
+        account = BankAccount(10)
+        self.assertTrue(transfer(account, account, 10))
+        self.assertFalse(transfer(account, account, 11))
+        self.assertEqual(account.account_balance, 10)
+
+    def test_money_is_conserved_under_contention(self):
+        """Test that concurrent transfers, deposits and withdrawals lose no money."""
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)  # Switch threads as often as possible
+        self.addCleanup(sys.setswitchinterval, switch_interval)
+
+        accounts = [BankAccount(1000) for _ in range(5)]
+        deposited = [0] * 8
+        withdrawn = [0] * 8
+
+        def worker(number):
+            generator = random.Random(number)
+            for _ in range(3000):
+                source, destination = generator.sample(accounts, 2)
+                transfer(source, destination, generator.randint(1, 300))
+                account = generator.choice(accounts)
+                amount = generator.randint(1, 50)
+                if generator.random() < 0.5:
+                    account.deposit(amount)
+                    deposited[number] += amount
+                elif account.withdraw(amount):
+                    withdrawn[number] += amount
+
+        threads = [threading.Thread(target=worker, args=(number,)) for number in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        total = sum(account.account_balance for account in accounts)
+        self.assertEqual(total, 5000 + sum(deposited) - sum(withdrawn))
+        self.assertTrue(all(account.account_balance >= 0 for account in accounts))
+
+
+class TestEventSourcedAccount(unittest.TestCase):
+    """Test cases for the EventSourcedAccount class."""
+
+    def setUp(self):
+        """Create a temporary directory and a controllable clock."""
+        self.temporary = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temporary.cleanup)
+        self.path = os.path.join(self.temporary.name, "account")
+        self.now = 100.0
+
+    def clock(self):
+        return self.now
+
+    def open(self, initial_balance=0):
+        account = EventSourcedAccount(self.path, initial_balance, snapshot_every=3,
+                                      clock=self.clock)
+        self.addCleanup(account.close)
+        return account
+
+    def test_recovery(self):
+        """Test that reopening an account restores its balance."""
+        account = self.open(50)
+        for amount in (10, 20, 30, 40):
+            account.deposit(amount)
+        account.withdraw(25)
+        account.withdraw(1000)
+        self.assertEqual(account.event_count(), 5)
+        account.close()
+
+        account = self.open(999)
+        self.assertEqual(account.account_balance, 125)
+        self.assertEqual(account.event_count(), 5)
+        account.deposit(5)
+        account.close()
+        self.assertEqual(self.open().account_balance, 130)
+
+    def test_torn_event(self):
+        """Test that an event cut short by a crash is dropped."""
+        account = self.open(0)
+        account.deposit(10)
+        account.deposit(20)
+        account.close()
+        with open(self.path + ".journal", "r+b") as journal:
+            journal.truncate(os.path.getsize(self.path + ".journal") - 3)
+        account = self.open()
+        self.assertEqual(account.account_balance, 10)
+        self.assertEqual(account.event_count(), 1)
+
+    def test_torn_first_snapshot(self):
+        """Test that the journal is replayed from the initial balance when no snapshot survives."""
+        account = self.open(50)
+        account.deposit(10)
+        account.deposit(20)
+        account.close()
+        for size in (10, 0):
+            with open(self.path + ".snapshots", "r+b") as snapshots:
+                snapshots.truncate(size)
+            account = self.open(50)
+            self.assertEqual(account.account_balance, 80)
+            self.assertEqual(account.event_count(), 2)
+            account.close()
+        account = self.open(50)
+        account.deposit(5)
+        account.close()
+        self.assertEqual(self.open().account_balance, 85)
+
+    def test_transfer_is_journaled(self):
+        """Test that both sides of a transfer are recorded."""
+        account = self.open(100)
+        other = BankAccount(0)
+        self.assertTrue(transfer(account, other, 40))
+        self.assertTrue(transfer(other, account, 15))
+        account.close()
+        self.assertEqual(self.open().account_balance, 75)
+
+    def test_balance_at(self):
+        """Test point-in-time balances before, between and after snapshots."""
+        account = self.open(10)
+        for amount in range(1, 9):
+            self.now += 1
+            account.deposit(amount)
+        self.assertEqual(account.balance_at(99), None)
+        self.assertEqual(account.balance_at(100), 10)
+        self.assertEqual(account.balance_at(101.5), 11)
+        self.assertEqual(account.balance_at(104), 20)
+        self.assertEqual(account.balance_at(105), 25)
+        self.assertEqual(account.balance_at(1000), 46)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the Columnar Book Store
+
+This module contains unit tests for BookStore and the StoredBook views it
+creates, including their use inside a Library.
+"""
+
+import sys
+import unittest
+from book_store import BookStore
+from library_management import BOOK_CHECKED_OUT, BaseBook, Book, Library
+
+
+class TestBookStore(unittest.TestCase):
+    """Test cases for the BookStore class."""
+
+    def setUp(self):
+        """Set up a store with more books than fit in one flag byte."""
+        self.store = BookStore()
+        for i in range(20):
+            self.store.add(f"Title {i}", "Same Author", page_count=100 + i)
+        self.store.add("Snow Crash", "Neal Stephenson", file_size=500)
+
+    def test_fields(self):
+        """Test that views read every stored field."""
+        book = self.store[20]
+        self.assertIsInstance(book, BaseBook)
+        self.assertEqual(book.title, "Snow Crash")
+        self.assertEqual(book.author, "Neal Stephenson")
+        self.assertEqual(book.file_size, 500)
+        self.assertIsNone(book.page_count)
+        self.assertEqual(self.store[3].page_count, 103)
+        self.assertEqual(str(book), "Snow Crash by Neal Stephenson")
+        self.assertEqual(len(self.store), 21)
+
+    def test_authors_are_shared(self):
+        """Test that repeated authors are stored once."""
+        self.assertIs(self.store[0].author, self.store[19].author)
+
+    def test_check_out_flags(self):
+        """Test that flags are independent per book and shared by views."""
+        self.assertTrue(self.store[9].check_out())
+        self.assertFalse(self.store[9].check_out())
+        self.assertTrue(self.store[8].is_available())
+        self.assertTrue(self.store[10].is_available())
+        self.assertTrue(self.store[9].return_book())
+        self.assertTrue(self.store[9].is_available())
+
+    def test_index_out_of_range(self):
+        """Test that invalid indexes raise IndexError."""
+        with self.assertRaises(IndexError):
+            self.store[21]
+
+    def test_library_of_views(self):
+        """Test that a library stays consistent when views change state."""
+        library = Library(reporter=None)
+        for book in self.store:
+            library.add_book(book)
+        self.assertTrue(library.check_out_book("Title 5"))
+        self.assertEqual(library.get_available_count(), 20)
+
+        self.store[5].return_book()
+        self.assertEqual(library.get_available_count(), 21)
+        self.assertEqual(len(self.store._listeners), 1)
+
+    def test_library_of_some_rows(self):
+        """Test that a library ignores rows of the store it does not hold."""
+        library = Library(reporter=None)
+        library.add_books(self.store[i] for i in range(5))
+        events = []
+        library.add_observer(lambda event, book: events.append((event, book.title)))
+        self.store[10].check_out()
+        self.store[2].check_out()
+        self.assertEqual(events, [(BOOK_CHECKED_OUT, "Title 2")])
+        self.assertEqual(library.get_available_count(), 4)
+
+    def test_views_are_smaller_than_books(self):
+        """Test that a view carries only its own two slots."""
+        self.assertLess(sys.getsizeof(self.store[0]), sys.getsizeof(Book("Title", "Author")))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the Buffered Output Helpers
+
+This module contains unit tests for write_lines and the continuation token
+helpers.
+"""
+
+import io
+import unittest
+from buffered_output import decode_cursor, encode_cursor, write_lines
+
+
+class CountingFile(io.StringIO):
+    """A StringIO that counts calls to write."""
+
+    writes = 0
+
+    def write(self, text):
+        self.writes += 1
+        return super().write(text)
+
+
+class TestWriteLines(unittest.TestCase):
+    """Test cases for the write_lines function."""
+
+    def test_batches_writes(self):
+        """Test that many lines are written with few calls."""
+        output = CountingFile()
+        count = write_lines((f"line {i}" for i in range(10_000)), output, buffer_size=4096)
+        self.assertEqual(count, 10_000)
+        self.assertEqual(output.getvalue().splitlines(), [f"line {i}" for i in range(10_000)])
+        self.assertLess(output.writes, 50)
+
+    def test_no_lines(self):
+        """Test that nothing is written for an empty listing."""
+        output = CountingFile()
+        self.assertEqual(write_lines([], output), 0)
+        self.assertEqual(output.writes, 0)
+
+
+class TestCursors(unittest.TestCase):
+    """Test cases for the continuation token helpers."""
+
+    def test_round_trip(self):
+        self.assertEqual(decode_cursor(encode_cursor(40, 100)), 40)
+        self.assertIsNone(encode_cursor(100, 100))
+        self.assertEqual(decode_cursor(None), 0)
+
+    def test_invalid(self):
+        for cursor in ("", "-5", "abc", 7):
+            with self.subTest(cursor=cursor), self.assertRaises(ValueError):
+                decode_cursor(cursor)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the Streaming Division Pipeline
+
+This module contains unit tests for divide_file, covering output order,
+per-error-class counts and chunking across processes.
+"""
+
+import os
+import tempfile
+import unittest
+from division_pipeline import divide_file
+
+
+class TestDivideFile(unittest.TestCase):
+    """Test cases for the divide_file function."""
+
+    def setUp(self):
+        """Create a temporary directory for input and output files."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.input = os.path.join(self.directory.name, "pairs.txt")
+        self.output = os.path.join(self.directory.name, "results.txt")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write_input(self, text):
+        with open(self.input, "w") as source:
+            source.write(text)
+
+    def read_output(self):
+        with open(self.output) as results:
+            return results.read().splitlines()
+
+    def test_results_and_counts(self):
+        """Test output lines and counts for every kind of row."""
+        self.write_input("10,4\n1 0\nten,2\njunk\n9 3")
+        summary = divide_file(self.input, self.output)
+        self.assertEqual(self.read_output(),
+                         ["2.5", "divide_by_zero", "non_numeric", "non_numeric", "3.0"])
+        self.assertEqual(summary.rows, 5)
+        self.assertEqual(summary.counts,
+                         {"ok": 2, "divide_by_zero": 1, "non_numeric": 2, "unexpected": 0})
+
+    def test_only_newlines_end_lines(self):
+        """Test that other line break characters do not split input lines."""
+        self.write_input("1,2\n3\x0b4,1\n5\u2028,0\r\n6,3\r\n")
+        summary = divide_file(self.input, self.output)
+        self.assertEqual(self.read_output(), ["0.5", "non_numeric", "divide_by_zero", "2.0"])
+        self.assertEqual(summary.rows, 4)
+
+    def test_empty_file(self):
+        """Test that an empty input produces an empty output."""
+        self.write_input("")
+        summary = divide_file(self.input, self.output)
+        self.assertEqual(summary.rows, 0)
+        self.assertEqual(self.read_output(), [])
+
+    def test_chunks_keep_order(self):
+        """Test that small chunks divided in worker processes stay in order."""
+        self.write_input("".join(f"{i},{i % 5}\n" for i in range(2000)))
+        summary = divide_file(self.input, self.output, chunk_bytes=256, processes=2)
+        expected = [repr(i / (i % 5)) if i % 5 else "divide_by_zero" for i in range(2000)]
+        self.assertEqual(self.read_output(), expected)
+        self.assertEqual(summary.counts["divide_by_zero"], 400)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the Event Sink
+
+This module contains unit tests for EventSink, covering batching, ordering,
+sampling, switch-off and background flushing.
+"""
+
+import contextlib
+import io
+import threading
+import time
+import unittest
+from event_sink import EventSink
+
+
+class TestEventSink(unittest.TestCase):
+    """Test cases for the EventSink class."""
+
+    def setUp(self):
+        """Set up a sink that collects batches instead of printing them."""
+        self.batches = []
+        self.sink = EventSink(writer=self.batches.append, flush_interval=60)
+
+    def tearDown(self):
+        self.sink.close()
+
+    def test_flush_in_order(self):
+        """Test that emitted messages are written in one ordered batch."""
+        for i in range(5):
+            self.sink.emit(f"message {i}")
+        self.assertEqual(self.batches, [])
+        self.sink.flush()
+        self.assertEqual(self.batches, [[f"message {i}" for i in range(5)]])
+
+    def test_switched_off(self):
+        """Test that a disabled sink discards messages."""
+        self.sink.enabled = False
+        self.sink.emit("ignored")
+        self.sink.flush()
+        self.assertEqual(self.batches, [])
+
+    def test_sampling(self):
+        """Test that a sample rate of 0 keeps nothing and 0.5 keeps some."""
+        self.sink.sample_rate = 0.0
+        self.sink.emit("ignored")
+        self.sink.flush()
+        self.assertEqual(self.batches, [])
+
+        self.sink.sample_rate = 0.5
+        for i in range(1000):
+            self.sink.emit(i)
+        self.sink.flush()
+        self.assertTrue(200 < len(self.batches[0]) < 800)
+
+    def test_background_flush(self):
+        """Test that a full batch is written by the background thread."""
+        written = threading.Event()
+        sink = EventSink(writer=lambda batch: written.set(), batch_size=3, flush_interval=60)
+        for i in range(3):
+            sink.emit(i)
+        self.assertTrue(written.wait(5))
+        sink.close()
+
+    def test_writer_error_keeps_thread(self):
+        """Test that a failing writer does not stop background flushing."""
+        written = threading.Event()
+        batches = []
+
+        def writer(batch):
+            if not batches:
+                batches.append(None)
+                raise OSError("stdout closed")
+            batches.append(batch)
+            written.set()
+
+        sink = EventSink(writer=writer, batch_size=1, flush_interval=60)
+        with contextlib.redirect_stderr(io.StringIO()) as errors:
+            sink.emit("lost")
+            while not batches:
+                time.sleep(0.001)
+            sink.emit("kept")
+            self.assertTrue(written.wait(5))
+            sink.close()
+        self.assertEqual(batches, [None, ["kept"]])
+        self.assertEqual(sink.dropped, 1)
+        self.assertIn("stdout closed", errors.getvalue())
+
+    def test_redirected(self):
+        """Test that a redirect sends only messages from inside the block elsewhere."""
+        self.sink.emit("before")
+        redirected = []
+        with self.sink.redirected(redirected.append):
+            self.sink.emit("inside")
+        self.sink.emit("after")
+        self.sink.flush()
+        self.assertEqual(self.batches, [["before"], ["after"]])
+        self.assertEqual(redirected, [["inside"]])
+
+    def test_silenced(self):
+        """Test that a silenced sink drops messages and is restored afterwards."""
+        with self.sink.silenced():
+            self.sink.emit("dropped")
+        self.sink.emit("kept")
+        self.sink.flush()
+        self.assertEqual(self.batches, [["kept"]])
+
+    def test_close_writes_remaining(self):
+        """Test that close writes queued messages and can be repeated."""
+        self.sink.emit("last")
+        self.sink.close()
+        self.sink.close()
+        self.assertEqual(self.batches, [["last"]])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the Ledger Engine
+
+This module contains unit tests checking that Ledger batches give exactly
+the results of sequential BankAccount calls.
+"""
+
+import random
+import unittest
+from bank_account import BankAccount
+from event_sink import sink
+from ledger import DEPOSIT, WITHDRAW, Ledger, to_cents
+
+
+class TestLedger(unittest.TestCase):
+    """Test cases for the Ledger class."""
+
+    def test_rules(self):
+        """Test the deposit and withdrawal rules row by row."""
+        ledger = Ledger([10, 0])
+        accepted = ledger.apply(
+            [0, 0, 0, 1, 1, 1, 0],
+            [WITHDRAW, WITHDRAW, DEPOSIT, DEPOSIT, WITHDRAW, DEPOSIT, WITHDRAW],
+            [600, 600, 250, 0, -5, 100, 650],
+        )
+        self.assertEqual(list(accepted), [1, 0, 1, 0, 0, 1, 1])
+        self.assertEqual(ledger.balance(0), 0.0)
+        self.assertEqual(ledger.balance(1), 1.0)
+
+    def test_invalid_rows(self):
+        """Test that unknown kinds and account ids are rejected untouched."""
+        ledger = Ledger([10, 20])
+        accepted = ledger.apply([0, -1, 2, 1, 0], [7, DEPOSIT, WITHDRAW, -1, DEPOSIT],
+                                [100, 100, 100, 100, 100])
+        self.assertEqual(list(accepted), [0, 0, 0, 0, 1])
+        self.assertEqual(ledger.balance(0), 11.0)
+        self.assertEqual(ledger.balance(1), 20.0)
+
+    def test_invalid_amounts(self):
+        """Test that a bad amount anywhere in a batch changes no balance."""
+        for amounts, error in [([100, 1.5], TypeError), ([100, 2 ** 63], OverflowError)]:
+            ledger = Ledger([10])
+            with self.subTest(amounts=amounts), self.assertRaises(error):
+                ledger.apply([0, 0], [DEPOSIT, DEPOSIT], amounts)
+            self.assertEqual(ledger.balance_cents(0), 1000)
+
+    def test_balance_limit(self):
+        """Test that a deposit past the largest balance is rejected."""
+        ledger = Ledger()
+        ledger.add_account()
+        accepted = ledger.apply([0, 0], [DEPOSIT, DEPOSIT], [2 ** 63 - 1, 1])
+        self.assertEqual(list(accepted), [1, 0])
+
+    def test_matches_bank_accounts(self):
+        """Test random batches against sequential BankAccount semantics."""
+        generator = random.Random(1)
+        accounts = [BankAccount(generator.randint(0, 100)) for _ in range(50)]
+        ledger = Ledger.from_accounts(accounts)
+
+        rows = 5000
+        ids = [generator.randrange(50) for _ in range(rows)]
+        kinds = [generator.choice((DEPOSIT, WITHDRAW)) for _ in range(rows)]
+        amounts = [generator.randint(-5, 80) for _ in range(rows)]
+        accepted = ledger.apply(ids, kinds, [to_cents(amount) for amount in amounts])
+
+        with sink.silenced():
+            for row in range(rows):
+                account = accounts[ids[row]]
+                if kinds[row] == DEPOSIT:
+                    before = account.account_balance
+                    account.deposit(amounts[row])
+                    expected = account.account_balance != before
+                else:
+                    expected = account.withdraw(amounts[row])
+                self.assertEqual(bool(accepted[row]), expected, f"row {row}")
+
+        for position, account in enumerate(accounts):
+            self.assertEqual(ledger.balance_cents(position), to_cents(account.account_balance))
+
+    def test_add_account(self):
+        """Test opening accounts after the ledger is created."""
+        ledger = Ledger()
+        account = ledger.add_account(12.34)
+        self.assertEqual(len(ledger), 1)
+        self.assertEqual(ledger.balance_cents(account), 1234)
+
+    def test_length_mismatch(self):
+        """Test that columns of different lengths are rejected."""
+        with self.assertRaises(ValueError):
+            Ledger([1]).apply([0], [DEPOSIT, DEPOSIT], [1])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Library Loan Analytics
+
+This module contains unit tests for LoanAnalytics attached to a Library,
+covering popularity rankings, loan durations and time range queries.
+"""
+
+import unittest
+from library_analytics import CHECK_OUT, RETURN, CountMinSketch, LoanAnalytics
+from library_management import Book, Library
+
+
+class FakeClock:
+    """A clock that only moves when told to."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestLoanAnalytics(unittest.TestCase):
+    """Test cases for the LoanAnalytics class."""
+
+    def setUp(self):
+        """Set up a library with analytics attached."""
+        self.clock = FakeClock()
+        self.library = Library(reporter=None)
+        for title in ("1984", "Dune", "Emma"):
+            self.library.add_book(Book(title, "Author"))
+        self.library.add_book(Book("Dune", "Author"))
+
+    def attach(self, **options):
+        analytics = LoanAnalytics(clock=self.clock, **options)
+        analytics.attach(self.library)
+        return analytics
+
+    def circulate(self):
+        """Check out Dune three times and 1984 once."""
+        for _ in range(3):
+            self.library.check_out_book("Dune")
+            self.clock.now += 10
+            self.library.return_book("Dune")
+        self.library.check_out_book("1984")
+        self.clock.now += 5
+        self.library.return_book("1984")
+
+    def test_top_titles(self):
+        """Test that titles are ranked by check-out count."""
+        analytics = self.attach()
+        self.circulate()
+        self.assertEqual(analytics.top_titles(2), [("Dune", 3), ("1984", 1)])
+        self.assertEqual(analytics.top_titles(), [("Dune", 3), ("1984", 1)])
+        self.assertEqual(analytics.loan_count("Emma"), 0)
+
+    def test_exact_top_titles_from_candidates(self):
+        """Test that exact rankings stay correct with few candidates kept."""
+        analytics = LoanAnalytics(clock=self.clock, top_capacity=3)
+        books = [Book(f"Title {number}", "Author") for number in range(20)]
+        # Popularity grows with the title number, but late titles start last
+        for number in range(20):
+            for book in books[number:]:
+                book.check_out()
+                analytics.record_check_out(book)
+                book.return_book()
+        self.assertEqual(analytics.top_titles(3),
+                         [("Title 19", 20), ("Title 18", 19), ("Title 17", 18)])
+        self.assertEqual(len(analytics._top), 3)
+        self.assertEqual(analytics.top_titles(4)[3], ("Title 16", 17))
+
+    def test_top_titles_with_sketch(self):
+        """Test popularity rankings from a count-min sketch."""
+        analytics = self.attach(sketch_width=256, top_capacity=2)
+        self.circulate()
+        self.library.check_out_book("Emma")
+        self.assertEqual(analytics.top_titles(1), [("Dune", 3)])
+        self.assertGreaterEqual(analytics.loan_count("1984"), 1)
+
+    def test_sketch_keeps_only_candidates(self):
+        """Test that a sketch keeps per-title state only for top candidates."""
+        analytics = self.attach(sketch_width=4096, top_capacity=2)
+        self.circulate()
+        for i in range(500):
+            self.library.add_book(Book(f"Title {i}", "Author"))
+            self.library.check_out_book(f"Title {i}")
+            self.library.return_book(f"Title {i}")
+        self.assertEqual(len(analytics), 1008)
+        self.assertEqual(analytics.top_titles(1), [("Dune", 3)])
+        self.assertEqual(len(analytics._top), 2)
+        self.assertEqual(len(analytics._candidate_loans), 2)
+        self.assertEqual(analytics._title_ids, {})
+        self.assertEqual(analytics.average_loan_duration("Dune"), 10)
+        self.assertIsNone(analytics.average_loan_duration("Title 0"))
+        self.assertEqual(list(analytics.events_between(10, 20)),
+                         [(10.0, "Dune", RETURN), (10.0, "Dune", CHECK_OUT)])
+
+    def test_average_loan_duration(self):
+        """Test average durations, including books checked out directly."""
+        analytics = self.attach()
+        self.circulate()
+        self.assertEqual(analytics.average_loan_duration("Dune"), 10)
+        self.assertEqual(analytics.average_loan_duration("1984"), 5)
+        self.assertIsNone(analytics.average_loan_duration("Emma"))
+
+        emma = next(self.library.search_title_prefix("Emma"))
+        emma.check_out()
+        self.clock.now += 40
+        emma.return_book()
+        self.assertEqual(analytics.average_loan_duration("Emma"), 40)
+
+    def test_events_between(self):
+        """Test reading the events recorded in a time range."""
+        analytics = self.attach()
+        self.circulate()
+        self.assertEqual(len(analytics), 8)
+        self.assertEqual(list(analytics.events_between(10, 20)),
+                         [(10.0, "Dune", RETURN), (10.0, "Dune", CHECK_OUT)])
+
+
+class TestCountMinSketch(unittest.TestCase):
+    """Test cases for the CountMinSketch class."""
+
+    def test_never_under_estimates(self):
+        """Test that estimates are at least the true counts."""
+        sketch = CountMinSketch(width=16, depth=3)
+        for i in range(200):
+            sketch.add(f"key {i % 20}")
+        for i in range(20):
+            self.assertGreaterEqual(sketch.estimate(f"key {i}"), 10)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
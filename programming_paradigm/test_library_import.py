@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Library Catalog Import
+
+This module contains unit tests for import_catalog, covering CSV and JSONL
+input, de-duplication, invalid rows and parallel parsing.
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from library_import import import_catalog
+from library_management import Book, Library
+
+
+class TestImportCatalog(unittest.TestCase):
+    """Test cases for the import_catalog function."""
+
+    def setUp(self):
+        """Create a temporary directory and an empty library."""
+        self.temporary = tempfile.TemporaryDirectory()
+        self.library = Library(reporter=None)
+
+    def tearDown(self):
+        """Remove the temporary files."""
+        self.temporary.cleanup()
+
+    def write(self, name, text):
+        """Write a catalog file and return its path."""
+        path = os.path.join(self.temporary.name, name)
+        with open(path, "w", encoding="utf-8", newline="") as catalog:
+            catalog.write(text)
+        return path
+
+    def books(self):
+        """Return the (title, author) of every book in the library."""
+        return [(book.title, book.author) for book in self.library.iter_books()]
+
+    def test_csv(self):
+        """Test importing a CSV catalog with duplicate and invalid rows."""
+        path = self.write("catalog.csv", (
+            "id,author,title\n"
+            "1,George Orwell,1984\n"
+            '2,Aldous Huxley,"Brave New World, Revisited"\n'
+            "3,George Orwell,1984\n"
+            "4,,Nameless\n"
+            '5,Frank Herbert,"Dune\nMessiah"\n'
+        ))
+        summary = import_catalog(self.library, path, chunk_size=2)
+        self.assertEqual(summary, (3, 1, 1))
+        self.assertEqual(self.books(), [
+            ("1984", "George Orwell"),
+            ("Brave New World, Revisited", "Aldous Huxley"),
+            ("Dune\nMessiah", "Frank Herbert"),
+        ])
+
+    def test_jsonl(self):
+        """Test importing a JSONL catalog."""
+        lines = [
+            {"title": "1984", "author": "George Orwell"},
+            {"title": "Émile", "author": "Jean-Jacques Rousseau"},
+            {"title": "1984"},
+        ]
+        path = self.write("catalog.jsonl", "\n".join(map(json.dumps, lines)) + "\nnot json\n")
+        summary = import_catalog(self.library, path)
+        self.assertEqual(summary, (2, 0, 2))
+        self.assertEqual(self.books()[1], ("Émile", "Jean-Jacques Rousseau"))
+
+    def test_skips_books_already_in_library(self):
+        """Test that rows matching existing books are duplicates."""
+        self.library.add_book(Book("1984", "George Orwell"))
+        path = self.write("catalog.jsonl", '{"title": "1984", "author": "George Orwell"}\n')
+        self.assertEqual(import_catalog(self.library, path), (0, 1, 0))
+
+    def test_imported_books_are_searchable(self):
+        """Test that bulk imported books reach every index and lookup."""
+        path = self.write("catalog.csv", "title,author\nAnimal Farm,George Orwell\n1984,George Orwell\n")
+        import_catalog(self.library, path)
+        self.library.add_book(Book("Island", "Aldous Huxley"))
+        self.assertEqual([book.title for book in self.library.find_by_author("George Orwell")],
+                         ["Animal Farm", "1984"])
+        self.assertEqual([book.title for book in self.library.search_title_prefix("i")], ["Island"])
+        self.assertTrue(self.library.check_out_book("1984"))
+        self.assertEqual(self.library.get_available_count(), 2)
+
+    def test_process_pool(self):
+        """Test that parallel parsing gives the same result in file order."""
+        rows = "".join(f"Title {i},Author {i % 7}\n" for i in range(500))
+        path = self.write("catalog.csv", "title,author\n" + rows + "Title 3,Author 3\n")
+        summary = import_catalog(self.library, path, chunk_size=50, processes=2)
+        self.assertEqual(summary, (500, 1, 0))
+        self.assertEqual(self.books()[:2], [("Title 0", "Author 0"), ("Title 1", "Author 1")])
+        self.assertEqual(self.books()[-1], ("Title 499", f"Author {499 % 7}"))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
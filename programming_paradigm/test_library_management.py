@@ -0,0 +1,437 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the Library Management System
+
+This module contains unit tests for the Book and Library classes, covering
+title lookups, check-outs and returns, including titles with several copies.
+"""
+
+import asyncio
+import contextlib
+import io
+import threading
+import time
+import unittest
+from event_sink import sink
+from library_holds import CANCELLED, EXPIRED, FULFILLED, WAITING
+from library_management import (
+    BOOK_CHECKED_OUT, NOT_FOUND, SUCCESS, WRONG_STATE, Book, Library,
+)
+
+
+class SlowBook(Book):
+    """A Book that yields to other threads between checking and setting its state."""
+
+    __slots__ = ("_state",)
+
+    @property
+    def _is_checked_out(self):
+        state = self._state
+        time.sleep(0)
+        return state
+
+    @_is_checked_out.setter
+    def _is_checked_out(self, state):
+        self._state = state
+
+
+class TestLibrary(unittest.TestCase):
+    """Test cases for the Library class."""
+
+    def setUp(self):
+        """Set up a small library before each test."""
+        self.library = Library()
+        self.library.add_book(Book("Brave New World", "Aldous Huxley"))
+        self.library.add_book(Book("1984", "George Orwell"))
+        self.output = io.StringIO()
+        self.redirect = contextlib.redirect_stdout(self.output)
+        self.redirect.__enter__()
+        self.messages = []  # Reporter messages from the shared event sink
+        self.reporting = sink.redirected(self.messages.extend)
+        self.reporting.__enter__()
+
+    def tearDown(self):
+        """Restore the event sink and standard output after each test."""
+        self.reporting.__exit__(None, None, None)
+        self.redirect.__exit__(None, None, None)
+
+    def clear_output(self):
+        """Write out pending messages, then empty the captured output."""
+        sink.flush()
+        self.output.truncate(0)
+        self.output.seek(0)
+
+    def test_check_out_and_return(self):
+        """Test checking a book out and returning it by title."""
+        self.assertTrue(self.library.check_out_book("1984"))
+        self.assertFalse(self.library.check_out_book("1984"))
+        self.assertTrue(self.library.return_book("1984"))
+        self.assertFalse(self.library.return_book("1984"))
+
+    def test_unknown_title(self):
+        """Test that unknown titles are reported as not found."""
+        self.assertFalse(self.library.check_out_book("Dune"))
+        self.assertFalse(self.library.return_book("Dune"))
+        sink.flush()
+        self.assertIn("Book 'Dune' not found in the library.", self.messages)
+
+    def test_duplicate_copies(self):
+        """Test that every copy of a title can be checked out."""
+        self.library.add_book(Book("1984", "George Orwell"))
+        self.assertTrue(self.library.check_out_book("1984"))
+        self.assertTrue(self.library.check_out_book("1984"))
+        self.assertFalse(self.library.check_out_book("1984"))
+        self.assertEqual(self.library.get_available_count(), 1)
+
+        self.assertTrue(self.library.return_book("1984"))
+        self.assertTrue(self.library.return_book("1984"))
+        self.assertFalse(self.library.return_book("1984"))
+        self.assertEqual(self.library.get_available_count(), 3)
+
+    def test_same_book_added_twice(self):
+        """Test that a book already in the library is not added again."""
+        book = Book("Dune", "Frank Herbert")
+        self.library.add_book(book)
+        self.library.add_book(book)
+        self.assertEqual(self.library.add_books([book, Book("Emma", "Jane Austen")]), 1)
+        self.assertEqual(self.library.get_book_count(), 4)
+        self.assertEqual(self.library.get_available_count(), 4)
+        sink.flush()
+        self.assertIn("Error: 'Dune' is already in the library.", self.messages)
+
+    def test_books_added_after_check_out(self):
+        """Test that books added later are found by title lookups."""
+        self.assertTrue(self.library.check_out_book("1984"))
+        self.library.add_book(Book("Dune", "Frank Herbert"))
+        self.assertTrue(self.library.check_out_book("Dune"))
+        self.assertEqual(self.library.get_book_count(), 3)
+
+    def test_available_count_tracks_direct_check_out(self):
+        """Test that the available count follows books changed directly."""
+        book = Book("Dune", "Frank Herbert")
+        self.library.add_book(book)
+        self.assertEqual(self.library.get_available_count(), 3)
+
+        book.check_out()
+        self.assertEqual(self.library.get_available_count(), 2)
+        self.assertFalse(self.library.check_out_book("Dune"))
+
+        book.return_book()
+        self.assertEqual(self.library.get_available_count(), 3)
+
+    def test_checked_out_book_added(self):
+        """Test adding a book that is already checked out."""
+        book = Book("Dune", "Frank Herbert")
+        book.check_out()
+        self.library.add_book(book)
+        self.assertEqual(self.library.get_available_count(), 2)
+        self.assertTrue(self.library.return_book("Dune"))
+        self.assertEqual(self.library.get_available_count(), 3)
+
+    def test_list_available_books(self):
+        """Test that listing shows only the available books."""
+        self.library.check_out_book("1984")
+        self.clear_output()
+        self.library.list_available_books()
+        self.assertEqual(self.output.getvalue(), "Brave New World by Aldous Huxley\n")
+
+        self.library.check_out_book("Brave New World")
+        self.clear_output()
+        self.library.list_available_books()
+        self.assertEqual(self.output.getvalue(), "No books are currently available.\n")
+
+    def test_list_available_books_in_catalog_order(self):
+        """Test that returned books are listed in their catalog position."""
+        self.library.add_books([Book("Dune", "Frank Herbert"), Book("Emma", "Jane Austen")])
+        self.library.check_out_book("Brave New World")
+        self.library.check_out_book("Dune")
+        self.library.return_book("Dune")
+        self.library.return_book("Brave New World")
+        self.clear_output()
+        self.library.list_available_books()
+        self.assertEqual(self.output.getvalue(), "Brave New World by Aldous Huxley\n"
+                         "1984 by George Orwell\nDune by Frank Herbert\nEmma by Jane Austen\n")
+
+    def test_list_all_books(self):
+        """Test the full listing written to a given file."""
+        self.library.check_out_book("1984")
+        listing = io.StringIO()
+        self.library.list_all_books(listing)
+        self.assertEqual(listing.getvalue(), "All books in the library:\n"
+                         "Brave New World by Aldous Huxley - Available\n"
+                         "1984 by George Orwell - Checked Out\n")
+
+    def test_book_pages(self):
+        """Test paging through the listing with continuation tokens."""
+        for i in range(3):
+            self.library.add_book(Book(f"Title {i}", "Author"))
+        lines, cursor = self.library.book_page(limit=4)
+        self.assertEqual(len(lines), 4)
+        lines, cursor = self.library.book_page(cursor, limit=4)
+        self.assertEqual(lines, ["Title 2 by Author - Available"])
+        self.assertIsNone(cursor)
+        with self.assertRaises(ValueError):
+            self.library.book_page("page two")
+
+
+class TestLibraryBatches(unittest.TestCase):
+    """Test cases for the batch check-out and return methods."""
+
+    def setUp(self):
+        """Set up a silent library with two copies of one title."""
+        self.messages = []
+        self.library = Library(reporter=self.messages.append)
+        self.library.add_book(Book("1984", "George Orwell"))
+        self.library.add_book(Book("1984", "George Orwell"))
+        self.library.add_book(Book("Dune", "Frank Herbert"))
+
+    def test_check_out_many(self):
+        """Test that batch check-outs return one code per title."""
+        results = self.library.check_out_many(["1984", "Dune", "1984", "1984", "Emma"])
+        self.assertEqual(list(results), [SUCCESS, SUCCESS, SUCCESS, WRONG_STATE, NOT_FOUND])
+        self.assertEqual(self.library.get_available_count(), 0)
+        self.assertEqual(self.messages, [])
+
+    def test_return_many(self):
+        """Test that batch returns return one code per title."""
+        self.library.check_out_many(["1984", "Dune"])
+        results = self.library.return_many(["Dune", "Dune", "1984", "1984", "Emma"])
+        self.assertEqual(list(results), [SUCCESS, WRONG_STATE, SUCCESS, WRONG_STATE, NOT_FOUND])
+        self.assertEqual(self.library.get_available_count(), 3)
+
+    def test_reporter(self):
+        """Test that single calls pass their messages to the reporter."""
+        self.library.check_out_book("Dune")
+        self.library.check_out_book("Dune")
+        self.library.return_book("Emma")
+        self.assertEqual(self.messages, [
+            "'Dune' has been checked out.",
+            "'Dune' is already checked out.",
+            "Book 'Emma' not found in the library.",
+        ])
+
+    def test_reporter_switched_off(self):
+        """Test that a library without a reporter stays silent."""
+        library = Library(reporter=None)
+        library.add_book("not a book")
+        self.assertFalse(library.check_out_book("Dune"))
+        self.assertEqual(library.get_book_count(), 0)
+
+
+class TestLibraryHolds(unittest.TestCase):
+    """Test cases for hold queues and hand-off on return."""
+
+    def setUp(self):
+        """Set up a library whose only copy of a title is checked out."""
+        self.library = Library(reporter=None)
+        self.book = Book("Dune", "Frank Herbert")
+        self.library.add_book(self.book)
+        self.library.check_out_book("Dune")
+        self.fulfilled = []
+
+    def test_hand_off_in_order(self):
+        """Test that returned copies go to waiting patrons first in, first out."""
+        first = self.library.place_hold("Dune", "ann", callback=self.fulfilled.append)
+        second = self.library.place_hold("Dune", "bob", callback=self.fulfilled.append)
+        self.assertEqual(self.library.get_hold_count("Dune"), 2)
+
+        self.assertTrue(self.library.return_book("Dune"))
+        self.assertEqual(self.fulfilled, [first])
+        self.assertIs(first.book, self.book)
+        self.assertEqual(first.state, FULFILLED)
+        self.assertEqual(second.state, WAITING)
+        self.assertFalse(self.book.is_available())
+        self.assertEqual(self.library.get_available_count(), 0)
+
+        self.library.return_book("Dune")
+        self.library.return_book("Dune")
+        self.assertEqual(self.fulfilled, [first, second])
+        self.assertTrue(self.book.is_available())
+        self.assertEqual(self.library.get_hold_count("Dune"), 0)
+
+    def test_cancel(self):
+        """Test that cancelled holds are skipped."""
+        first = self.library.place_hold("Dune", "ann", callback=self.fulfilled.append)
+        second = self.library.place_hold("Dune", "bob", callback=self.fulfilled.append)
+        self.assertTrue(self.library.cancel_hold(first))
+        self.assertFalse(self.library.cancel_hold(first))
+        self.assertEqual(first.state, CANCELLED)
+        self.assertEqual(self.library.get_hold_count("Dune"), 1)
+
+        self.library.return_book("Dune")
+        self.assertEqual(self.fulfilled, [second])
+
+    def test_expiry(self):
+        """Test that expired holds are skipped."""
+        expired = self.library.place_hold("Dune", "ann", ttl=0)
+        waiting = self.library.place_hold("Dune", "bob", ttl=3600)
+        self.assertEqual(self.library.get_hold_count("Dune"), 1)
+        self.assertEqual(expired.state, EXPIRED)
+
+        self.library.return_book("Dune")
+        self.assertEqual(waiting.state, FULFILLED)
+
+    def test_hold_on_available_title(self):
+        """Test that a hold on an available title is fulfilled immediately."""
+        self.library.return_book("Dune")
+        hold = self.library.place_hold("Dune", callback=self.fulfilled.append)
+        self.assertEqual(self.fulfilled, [hold])
+        self.assertFalse(self.book.is_available())
+        self.assertIsNone(self.library.place_hold("Emma"))
+
+    def test_future(self):
+        """Test that an asyncio future receives the handed off book."""
+        async def wait_for_copy():
+            future = asyncio.get_running_loop().create_future()
+            self.library.place_hold("Dune", future=future)
+            self.library.return_book("Dune")
+            return await asyncio.wait_for(future, 1)
+
+        self.assertIs(asyncio.run(wait_for_copy()), self.book)
+
+
+class TestConcurrentLibrary(unittest.TestCase):
+    """Stress tests for a library shared between threads."""
+
+    THREADS = 8
+    TITLES = 50
+    COPIES = 3
+
+    def setUp(self):
+        """Set up a locked library with several copies of every title."""
+        self.library = Library(reporter=None, lock_stripes=16)
+        for i in range(self.TITLES):
+            for _ in range(self.COPIES):
+                self.library.add_book(SlowBook(f"Title {i}", "Author"))
+        self.check_outs = {}
+        self.library.add_observer(self.count_check_outs)
+
+    def count_check_outs(self, event, book):
+        """Count the check-outs of every book."""
+        if event == BOOK_CHECKED_OUT:
+            self.check_outs[book] = self.check_outs.get(book, 0) + 1
+
+    def run_threads(self, target):
+        """Run target in several threads at once and wait for them."""
+        start = threading.Barrier(self.THREADS)
+
+        def worker():
+            start.wait()
+            target()
+
+        threads = [threading.Thread(target=worker) for _ in range(self.THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def test_no_double_check_outs(self):
+        """Test that no copy is checked out twice when threads race for it."""
+        titles = [f"Title {i}" for i in range(self.TITLES)] * self.COPIES
+        successes = []
+
+        def check_out_all():
+            results = self.library.check_out_many(titles)
+            successes.append(results.count(SUCCESS))
+
+        self.run_threads(check_out_all)
+        self.assertEqual(sum(successes), self.TITLES * self.COPIES)
+        self.assertEqual(set(self.check_outs.values()), {1})
+        self.assertEqual(self.library.get_available_count(), 0)
+
+    def test_circulation_keeps_counts(self):
+        """Test that concurrent check-outs and returns leave every copy available."""
+        titles = [f"Title {i}" for i in range(self.TITLES)]
+
+        def circulate():
+            for _ in range(5):
+                checked_out = [title for title, result
+                               in zip(titles, self.library.check_out_many(titles))
+                               if result == SUCCESS]
+                self.assertEqual(list(self.library.return_many(checked_out)),
+                                 [SUCCESS] * len(checked_out))
+
+        self.run_threads(circulate)
+        self.assertEqual(self.library.get_available_count(), self.TITLES * self.COPIES)
+
+
+    def test_prefix_search_while_adding(self):
+        """Test that prefix searches racing with additions lose no books."""
+        adding = threading.Event()
+
+        def add_books(prefix):
+            for i in range(20000):
+                self.library.add_book(Book(f"New {prefix} {i}", "Author"))
+
+        def search():
+            while not adding.is_set():
+                for _ in self.library.search_title_prefix("new"):
+                    pass
+
+        adders = [threading.Thread(target=add_books, args=(prefix,)) for prefix in "AB"]
+        searchers = [threading.Thread(target=search) for _ in range(4)]
+        for thread in adders + searchers:
+            thread.start()
+        for thread in adders:
+            thread.join()
+        adding.set()
+        for thread in searchers:
+            thread.join()
+        self.assertEqual(len(list(self.library.search_title_prefix("new"))), 40000)
+
+class TestLibrarySearch(unittest.TestCase):
+    """Test cases for the Library search indexes."""
+
+    def setUp(self):
+        """Set up a library with several books by the same authors."""
+        self.library = Library()
+        for title, author in [
+            ("Animal Farm", "George Orwell"),
+            ("Brave New World", "Aldous Huxley"),
+            ("1984", "George Orwell"),
+            ("Island", "Aldous Huxley"),
+            ("Down and Out in Paris and London", "George Orwell"),
+        ]:
+            self.library.add_book(Book(title, author))
+
+    def titles(self, books):
+        """Return the titles of an iterable of books."""
+        return [book.title for book in books]
+
+    def test_find_by_author(self):
+        """Test exact author lookups."""
+        self.assertEqual(
+            self.titles(self.library.find_by_author("George Orwell")),
+            ["Animal Farm", "1984", "Down and Out in Paris and London"],
+        )
+        self.assertEqual(self.titles(self.library.find_by_author("george orwell")), [])
+
+    def test_search_title_prefix(self):
+        """Test case-insensitive title prefix search."""
+        self.assertEqual(self.titles(self.library.search_title_prefix("b")), ["Brave New World"])
+        self.assertEqual(self.titles(self.library.search_title_prefix("ISL")), ["Island"])
+        self.assertEqual(self.titles(self.library.search_title_prefix("Zen")), [])
+
+        self.library.add_book(Book("Brave New World Revisited", "Aldous Huxley"))
+        self.assertEqual(
+            self.titles(self.library.search_title_prefix("brave")),
+            ["Brave New World", "Brave New World Revisited"],
+        )
+
+    def test_search_keywords(self):
+        """Test keyword search over titles and authors."""
+        self.assertEqual(self.titles(self.library.search("orwell paris")),
+                         ["Down and Out in Paris and London"])
+        self.assertEqual(self.titles(self.library.search("HUXLEY")), ["Brave New World", "Island"])
+        self.assertEqual(self.titles(self.library.search("orwell huxley")), [])
+        self.assertEqual(self.titles(self.library.search("")), [])
+
+    def test_queries_are_lazy(self):
+        """Test that queries return iterators rather than lists."""
+        books = self.library.find_by_author("George Orwell")
+        self.assertEqual(next(books).title, "Animal Farm")
+        self.assertEqual(next(self.library.search("orwell")).title, "Animal Farm")
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
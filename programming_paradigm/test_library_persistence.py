@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Library Persistence
+
+This module contains unit tests for LibraryJournal, covering recovery from
+the log alone, from a snapshot plus log tail, and from a log cut short in
+the middle of a record.
+"""
+
+import os
+import tempfile
+import unittest
+from library_management import Book
+from library_persistence import LibraryJournal
+
+
+class TestLibraryJournal(unittest.TestCase):
+    """Test cases for the LibraryJournal class."""
+
+    def setUp(self):
+        """Create a temporary directory for the journal files."""
+        self.temporary = tempfile.TemporaryDirectory()
+        self.directory = self.temporary.name
+
+    def tearDown(self):
+        """Remove the journal files."""
+        self.temporary.cleanup()
+
+    def open(self):
+        """Open a journal over the test directory and recover its library."""
+        journal = LibraryJournal(self.directory, group_size=4)
+        return journal, journal.open(reporter=None)
+
+    def state(self, library):
+        """Return the title, author and availability of every book."""
+        return [(book.title, book.author, book.is_available()) for book in library.iter_books()]
+
+    def fill(self, library):
+        """Add books and circulate some of them."""
+        library.add_book(Book("1984", "George Orwell"))
+        library.add_book(Book("Dune", "Frank Herbert"))
+        library.add_book(Book("1984", "George Orwell"))
+        library.add_book(Book("Émile", "Jean-Jacques Rousseau"))
+        library.check_out_many(["1984", "1984", "Dune"])
+        library.return_book("1984")
+
+    def test_replay_log(self):
+        """Test recovering a library from the log alone."""
+        journal, library = self.open()
+        self.fill(library)
+        expected = self.state(library)
+        journal.close()
+
+        journal, recovered = self.open()
+        self.assertEqual(self.state(recovered), expected)
+        self.assertEqual(recovered.get_available_count(), 2)
+        journal.close()
+
+    def test_add_checked_out_book(self):
+        """Test that a book already checked out when added stays checked out."""
+        journal, library = self.open()
+        book = Book("Dune", "Frank Herbert")
+        book.check_out()
+        library.add_book(book)
+        journal.close()
+
+        journal, recovered = self.open()
+        self.assertEqual(self.state(recovered), [("Dune", "Frank Herbert", False)])
+        self.assertEqual(recovered.get_available_count(), 0)
+        journal.close()
+
+    def test_same_book_added_twice(self):
+        """Test that later books keep their own positions after a repeated add."""
+        journal, library = self.open()
+        book = Book("1984", "George Orwell")
+        library.add_book(book)
+        library.add_book(book)
+        library.add_book(Book("Dune", "Frank Herbert"))
+        library.check_out_book("Dune")
+        journal.close()
+
+        journal, recovered = self.open()
+        self.assertEqual([book.title for book in recovered.iter_books() if not book.is_available()],
+                         ["Dune"])
+        journal.close()
+
+    def test_snapshot_and_log_tail(self):
+        """Test recovering from a snapshot followed by later changes."""
+        journal, library = self.open()
+        self.fill(library)
+        journal.snapshot()
+        library.add_book(Book("Emma", "Jane Austen"))
+        library.check_out_book("Emma")
+        library.return_book("Dune")
+        expected = self.state(library)
+        journal.close()
+
+        journal, recovered = self.open()
+        self.assertEqual(self.state(recovered), expected)
+        recovered.check_out_book("Emma")
+        journal.snapshot()
+        journal.close()
+
+        journal, recovered = self.open()
+        self.assertEqual(self.state(recovered), expected)
+        journal.close()
+
+    def test_torn_record(self):
+        """Test that a record cut short by a crash is discarded."""
+        journal, library = self.open()
+        self.fill(library)
+        expected = self.state(library)
+        library.add_book(Book("Emma", "Jane Austen"))
+        journal.close()
+
+        log_path = os.path.join(self.directory, "library.log")
+        with open(log_path, "r+b") as log:
+            log.truncate(os.path.getsize(log_path) - 5)
+
+        journal, recovered = self.open()
+        self.assertEqual(self.state(recovered), expected)
+
+        recovered.add_book(Book("Persuasion", "Jane Austen"))
+        journal.close()
+        journal, recovered = self.open()
+        self.assertEqual(self.state(recovered), expected + [("Persuasion", "Jane Austen", True)])
+        journal.close()
+
+    def test_corrupt_record(self):
+        """Test that a record with a bad checksum ends the log."""
+        journal, library = self.open()
+        library.add_book(Book("1984", "George Orwell"))
+        library.add_book(Book("Dune", "Frank Herbert"))
+        journal.close()
+
+        log_path = os.path.join(self.directory, "library.log")
+        with open(log_path, "r+b") as log:
+            log.seek(-6, os.SEEK_END)
+            log.write(b"X")
+
+        journal, recovered = self.open()
+        self.assertEqual(self.state(recovered), [("1984", "George Orwell", True)])
+        journal.close()
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the Robust Division Calculator
+
+This module contains unit tests for safe_divide and safe_divide_array,
+covering valid input, division by zero, non-numeric and unexpected input.
+"""
+
+import math
+import unittest
+from robust_division_calculator import (
+    DIVIDE_BY_ZERO, NON_NUMERIC, OK, UNEXPECTED, safe_divide, safe_divide_array,
+)
+
+
+class TestSafeDivide(unittest.TestCase):
+    """Test cases for the string-returning safe_divide function."""
+
+    def test_messages(self):
+        """Test the message returned for every kind of outcome."""
+        self.assertEqual(safe_divide("10", "4"), "The result of the division is 2.5")
+        self.assertEqual(safe_divide(1, 0), "Error: Cannot divide by zero.")
+        self.assertEqual(safe_divide("ten", 2), "Error: Please enter numeric values only.")
+        self.assertEqual(
+            safe_divide(None, 2),
+            "An unexpected error occurred: float() argument must be a string or a real number, "
+            "not 'NoneType'",
+        )
+
+
+class TestSafeDivideArray(unittest.TestCase):
+    """Test cases for the column-wise safe_divide_array function."""
+
+    def test_valid_columns(self):
+        """Test the fast path where every row divides cleanly."""
+        results, errors = safe_divide_array([1, 5.0, "9"], ["2", 2, 3])
+        self.assertEqual(list(results), [0.5, 2.5, 3.0])
+        self.assertEqual(list(errors), [OK, OK, OK])
+
+    def test_error_codes(self):
+        """Test that failing rows get NaN and an error code."""
+        results, errors = safe_divide_array(["1", "x", None, 4, "y"], [0, 1, 1, 2, None])
+        self.assertEqual(list(errors), [DIVIDE_BY_ZERO, NON_NUMERIC, UNEXPECTED, OK, NON_NUMERIC])
+        self.assertTrue(all(math.isnan(value) for value in results[:3]))
+        self.assertEqual(results[3], 2.0)
+
+    def test_length_mismatch(self):
+        """Test that columns of different lengths are rejected."""
+        with self.assertRaises(ValueError):
+            safe_divide_array([1, 2], [1])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)